@@ -3,8 +3,8 @@ API Routes - Account Management
 """
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List
-from app.core.accounts import AccountManager
+from typing import List, Optional
+from app.domain.accounts import AccountManager
 
 router = APIRouter()
 account_manager = AccountManager()
@@ -18,12 +18,17 @@ class AccountResponse(BaseModel):
     name: str
     path: str
     exists: bool
+    piggy_bank_count: int = 0
+    transaction_count: int = 0
+    balance: float = 0.0
+    last_modified: Optional[str] = None
+    version: int = 0
 
 
 @router.get("/accounts", response_model=List[AccountResponse])
 async def list_accounts():
     """
-    List all accounts
+    List all accounts, served from their catalogs
     """
     accounts = account_manager.list_accounts()
     return accounts
@@ -45,7 +50,7 @@ async def create_account(account: AccountCreate):
 @router.get("/accounts/{account_name}")
 async def get_account(account_name: str):
     """
-    Get account details
+    Get account details and its piggy banks from the account catalog
     """
     account = account_manager.get_account(account_name)
     
@@ -60,9 +65,12 @@ async def delete_account(account_name: str, delete_data: bool = False):
     """
     Delete an account
     """
+    if account_manager.get_account(account_name) is None:
+        raise HTTPException(status_code=404, detail="Account not found")
+    
     result = account_manager.delete_account(account_name, delete_data)
     
     if not result["success"]:
-        raise HTTPException(status_code=404, detail=result["error"])
+        raise HTTPException(status_code=400, detail=result["error"])
     
     return result
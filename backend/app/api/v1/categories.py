@@ -3,11 +3,13 @@ API Routes - Category Management
 """
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List
-from app.core.categories import CategoryManager
+from typing import Dict, List
+from app.domain.categories import CategoryManager
+from app.domain.metrics import registry
 
 router = APIRouter()
 category_manager = CategoryManager()
+registry.register_cache("categories", category_manager)
 
 
 class CategoryCreate(BaseModel):
@@ -18,6 +20,14 @@ class CategoryUpdate(BaseModel):
     new_name: str
 
 
+class CategoryBatchCreate(BaseModel):
+    names: List[str]
+
+
+class CategoryBatchRename(BaseModel):
+    renames: Dict[str, str]
+
+
 @router.get("/categories", response_model=List[str])
 async def get_categories():
     """Get all categories"""
@@ -35,6 +45,23 @@ async def add_category(category: CategoryCreate):
     return result
 
 
+@router.post("/categories/batch", status_code=201)
+async def add_categories(batch: CategoryBatchCreate):
+    """Add several categories with a single write"""
+    return category_manager.add_categories(batch.names)
+
+
+@router.post("/categories/rename")
+async def rename_categories(batch: CategoryBatchRename):
+    """Rename several categories at once; all or nothing"""
+    result = category_manager.rename_categories(batch.renames)
+    
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result["error"])
+    
+    return result
+
+
 @router.put("/categories/{category_name}")
 async def update_category(category_name: str, update: CategoryUpdate):
     """Update/rename a category"""
@@ -1,16 +1,137 @@
 """
 API Routes - Reports and Analytics
 """
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
-from app.core.transactions import TransactionManager
-from app.core.reports import ReportGenerator
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+from typing import Any, Callable, Dict, List, Optional
+from app.domain.metadata import PiggyBankMeta
+from app.domain.concurrency import piggy_bank_locks, run_blocking
+from app.domain.report_cache import etag_matches, report_cache
+from app.domain.lazy import lazy_import
+
+# Built on pandas; loaded with the first report request
+TransactionManager = lazy_import("app.domain.transactions", "TransactionManager")
+AccountReportGenerator = lazy_import("app.domain.reports", "AccountReportGenerator")
+ReportGenerator = lazy_import("app.domain.reports", "ReportGenerator")
+category_dictionary = lazy_import("app.domain.category_dictionary", "category_dictionary")
 
 router = APIRouter()
 
 
+def _data_version(account_name: str, piggy_bank_name: str) -> tuple:
+    """
+    Current data version of a piggy bank, read from its metadata only,
+    with the category dictionary version since renames relabel reports
+    """
+    meta = PiggyBankMeta(TransactionManager.piggy_bank_path(account_name, piggy_bank_name))
+    return meta.version, category_dictionary.version
+
+
+async def _versioned_report(
+    request: Request,
+    account_name: str,
+    piggy_bank_name: str,
+    endpoint: str,
+    params: dict,
+    build: Callable[["TransactionManager"], dict]
+) -> Response:
+    """
+    Serve a report through the report cache.
+    
+    The ETag covers the endpoint, its parameters and the piggy bank's data
+    version. A matching If-None-Match gets 304 before any transactions are
+    read; a cached result is returned as is; otherwise the report is built
+    and cached under the version it was built from.
+    """
+    async with piggy_bank_locks.read(account_name, piggy_bank_name):
+        version = await run_blocking(_data_version, account_name, piggy_bank_name)
+        key = report_cache.key(account_name, piggy_bank_name, endpoint, params, version)
+        headers = {"ETag": report_cache.etag(key), "Cache-Control": "no-cache"}
+        
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        
+        report = report_cache.get(key)
+        if report is None:
+            report = await run_blocking(
+                lambda: build(TransactionManager(account_name, piggy_bank_name))
+            )
+            report_cache.put(key, report)
+    
+    return JSONResponse(report, headers=headers)
+
+
+async def _fan_out(account_name: str, piggy_banks: List[str], partial: Callable[[str], Any]) -> Dict[str, tuple]:
+    """
+    Run partial(piggy_bank) for every piggy bank concurrently on the
+    storage pool, each under its own read lock; returns
+    {piggy_bank: (data version, partial result)}
+    """
+    async def one(piggy_bank_name: str) -> tuple:
+        async with piggy_bank_locks.read(account_name, piggy_bank_name):
+            return await run_blocking(
+                lambda: (_data_version(account_name, piggy_bank_name), partial(piggy_bank_name))
+            )
+    
+    results = await asyncio.gather(*(one(name) for name in piggy_banks))
+    return dict(zip(piggy_banks, results))
+
+
+async def _consolidated_report(
+    request: Request,
+    account_name: str,
+    endpoint: str,
+    params: dict,
+    partial: Callable[[str], Any],
+    merge: Callable[[list], dict]
+) -> Response:
+    """
+    Serve an account-wide report built from one partial aggregate per
+    piggy bank.
+    
+    The partials are computed in parallel and merged, so the wall-clock
+    time follows the slowest piggy bank rather than their sum. The cache
+    key and ETag cover the data version of every piggy bank involved.
+    """
+    piggy_banks = await run_blocking(TransactionManager.list_piggy_banks, account_name)
+    if not piggy_banks:
+        raise HTTPException(status_code=404, detail=f"No piggy banks found for account: {account_name}")
+    
+    def versioned(versions: Dict[str, tuple]) -> tuple:
+        key = report_cache.key(account_name, None, endpoint, params, tuple(sorted(versions.items())))
+        return key, {"ETag": report_cache.etag(key), "Cache-Control": "no-cache"}
+    
+    async def version(piggy_bank_name: str) -> tuple:
+        async with piggy_bank_locks.read(account_name, piggy_bank_name):
+            return await run_blocking(_data_version, account_name, piggy_bank_name)
+    
+    versions = await asyncio.gather(*(version(name) for name in piggy_banks))
+    key, headers = versioned(dict(zip(piggy_banks, versions)))
+    
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    
+    report = report_cache.get(key)
+    if report is None:
+        results = await _fan_out(account_name, piggy_banks, partial)
+        partials = {name: result for name, (_, result) in results.items() if result is not None}
+        if not partials:
+            raise HTTPException(status_code=404, detail="No piggy bank has data for the requested period")
+        
+        report = await run_blocking(merge, list(partials.values()))
+        report["piggy_banks"] = list(partials)
+        
+        # Key the result by the versions it was actually built from
+        key, headers = versioned({name: version for name, (version, _) in results.items()})
+        report_cache.put(key, report)
+    
+    return JSONResponse(report, headers=headers)
+
+
 @router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/reports/monthly")
 async def get_monthly_report(
+    request: Request,
     account_name: str,
     piggy_bank_name: str,
     year: int,
@@ -20,39 +141,53 @@ async def get_monthly_report(
     if not (1 <= month <= 12):
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
     
-    tm = TransactionManager(account_name, piggy_bank_name)
-    load_result = tm.load_from_csv(year)
-    
-    if not load_result["success"]:
-        raise HTTPException(status_code=404, detail=load_result["error"])
-    
-    report_gen = ReportGenerator(tm)
-    report = report_gen.generate_monthly_report(year, month)
+    def build(tm: TransactionManager) -> dict:
+        # Reports are served from the monthly rollups
+        load_result = tm.load_rollups(year)
+        if not load_result["success"]:
+            raise HTTPException(status_code=404, detail=load_result["error"])
+        
+        return ReportGenerator(tm).generate_monthly_report(year, month)
     
-    return report
+    return await _versioned_report(
+        request,
+        account_name,
+        piggy_bank_name,
+        "monthly",
+        {"year": year, "month": month},
+        build
+    )
 
 
 @router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/reports/yearly")
 async def get_yearly_report(
+    request: Request,
     account_name: str,
     piggy_bank_name: str,
     year: int
 ):
     """Generate yearly financial report"""
-    tm = TransactionManager(account_name, piggy_bank_name)
-    load_result = tm.load_from_csv(year)
+    def build(tm: TransactionManager) -> dict:
+        # Reports are served from the monthly rollups
+        load_result = tm.load_rollups(year)
+        if not load_result["success"]:
+            raise HTTPException(status_code=404, detail=load_result["error"])
+        
+        return ReportGenerator(tm).generate_yearly_report(year)
     
-    if not load_result["success"]:
-        raise HTTPException(status_code=404, detail=load_result["error"])
-    
-    report_gen = ReportGenerator(tm)
-    report = report_gen.generate_yearly_report(year)
-    
-    return report
+    return await _versioned_report(
+        request,
+        account_name,
+        piggy_bank_name,
+        "yearly",
+        {"year": year},
+        build
+    )
 
 
 @router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/reports/category-summary")
 async def get_category_summary(
+    request: Request,
     account_name: str,
     piggy_bank_name: str,
     start_date: Optional[str] = Query(None),
@@ -60,13 +195,84 @@ async def get_category_summary(
     year: Optional[int] = Query(None)
 ):
     """Get spending summary by category"""
-    tm = TransactionManager(account_name, piggy_bank_name)
-    load_result = tm.load_from_csv(year)
-    
-    if not load_result["success"]:
-        raise HTTPException(status_code=404, detail=load_result["error"])
+    def build(tm: TransactionManager) -> dict:
+        # A date range without a year spans every year file it overlaps
+        if year is None and (start_date or end_date):
+            if not tm.list_transaction_files():
+                raise HTTPException(status_code=404, detail=f"No {tm.storage.name.upper()} files available.")
+            return ReportGenerator(tm).get_range_category_summary(start_date, end_date)
+        
+        load_result = tm.load(year)
+        if not load_result["success"]:
+            raise HTTPException(status_code=404, detail=load_result["error"])
+        
+        return ReportGenerator(tm).get_category_summary(start_date, end_date)
     
-    report_gen = ReportGenerator(tm)
-    summary = report_gen.get_category_summary(start_date, end_date)
+    return await _versioned_report(
+        request,
+        account_name,
+        piggy_bank_name,
+        "category-summary",
+        {"start_date": start_date, "end_date": end_date, "year": year},
+        build
+    )
+
+
+@router.get("/accounts/{account_name}/reports/monthly")
+async def get_account_monthly_report(
+    request: Request,
+    account_name: str,
+    year: int,
+    month: int
+):
+    """Generate a monthly report consolidated across all piggy banks"""
+    if not (1 <= month <= 12):
+        raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
     
-    return summary
+    generator = AccountReportGenerator(account_name)
+    return await _consolidated_report(
+        request,
+        account_name,
+        "monthly",
+        {"year": year, "month": month},
+        lambda name: generator.year_partial(name, year),
+        lambda partials: generator.generate_monthly_report(partials, year, month)
+    )
+
+
+@router.get("/accounts/{account_name}/reports/yearly")
+async def get_account_yearly_report(
+    request: Request,
+    account_name: str,
+    year: int
+):
+    """Generate a yearly report consolidated across all piggy banks"""
+    generator = AccountReportGenerator(account_name)
+    return await _consolidated_report(
+        request,
+        account_name,
+        "yearly",
+        {"year": year},
+        lambda name: generator.year_partial(name, year),
+        lambda partials: generator.generate_yearly_report(partials, year)
+    )
+
+
+@router.get("/accounts/{account_name}/reports/category-summary")
+async def get_account_category_summary(
+    request: Request,
+    account_name: str,
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    year: Optional[int] = Query(None)
+):
+    """Get spending summary by category consolidated across all piggy banks"""
+    generator = AccountReportGenerator(account_name)
+    return await _consolidated_report(
+        request,
+        account_name,
+        "category-summary",
+        {"start_date": start_date, "end_date": end_date, "year": year},
+        lambda name: generator.range_partial(name, start_date, end_date, year),
+        generator.get_category_summary
+    )
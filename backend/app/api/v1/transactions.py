@@ -1,11 +1,24 @@
 """
 API Routes - Transaction Management
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import date
-from app.core.transactions import TransactionManager
+from app.config import settings
+from app.domain.catalog import AccountCatalog
+from app.domain.concurrency import piggy_bank_locks, run_blocking
+from app.domain.lazy import lazy_import
+
+# pandas and the modules built on it load with the first request
+pd = lazy_import("pandas")
+TransactionManager = lazy_import("app.domain.transactions", "TransactionManager")
+TransactionQuery = lazy_import("app.domain.query", "TransactionQuery")
+pagination = lazy_import("app.domain.pagination")
+ingest = lazy_import("app.domain.ingest")
+
+MAX_PAGE_SIZE = settings.MAX_PAGE_SIZE
 
 router = APIRouter()
 
@@ -32,22 +45,70 @@ async def add_transaction(
     """Add a new transaction"""
     tm = TransactionManager(account_name, piggy_bank_name)
     
-    # Load existing data
-    load_result = tm.load_from_csv()
+    try:
+        year = pd.to_datetime(transaction.date).year
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid date: {transaction.date}")
     
-    # Add transaction
-    result = tm.add_transaction(
-        date=transaction.date,
-        amount=transaction.amount,
-        category=transaction.category,
-        description=transaction.description
-    )
+    async with piggy_bank_locks.write(account_name, piggy_bank_name):
+        # Load the year the transaction belongs to
+        load_result = await run_blocking(tm.load, year)
+        
+        # Add transaction
+        result = await run_blocking(
+            tm.add_transaction,
+            date=transaction.date,
+            amount=transaction.amount,
+            category=transaction.category,
+            description=transaction.description
+        )
+        
+        if not result["success"]:
+            raise HTTPException(status_code=400, detail=result["error"])
+        
+        # Persist, appending the new row unless earlier balances changed
+        await run_blocking(tm.flush, year)
     
-    if not result["success"]:
-        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+
+@router.post("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/transactions:batch")
+async def add_transactions_batch(
+    account_name: str,
+    piggy_bank_name: str,
+    request: Request
+):
+    """
+    Add many transactions in one request.
     
-    # Save to file
-    tm.save_to_csv()
+    Accepts a JSON array (application/json), newline-delimited JSON
+    (application/x-ndjson) or a CSV file (multipart/form-data field
+    "file", or a text/csv body). Rows are routed to their year files.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    
+    try:
+        if content_type == "multipart/form-data":
+            form = await request.form()
+            upload = form.get("file")
+            if upload is None or isinstance(upload, str):
+                raise HTTPException(status_code=400, detail='Expected a CSV file in form field "file"')
+            raw = await run_blocking(ingest.read_csv, await upload.read())
+        elif content_type == "text/csv":
+            raw = await run_blocking(ingest.read_csv, await request.body())
+        elif content_type in ("application/x-ndjson", "application/jsonl"):
+            chunks = [chunk async for chunk in request.stream()]
+            raw = await run_blocking(ingest.read_ndjson, b"".join(chunks))
+        else:
+            raw = await run_blocking(ingest.read_json_array, await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Could not parse batch: {e}")
+    
+    async with piggy_bank_locks.write(account_name, piggy_bank_name):
+        result = await run_blocking(ingest.ingest_transactions, account_name, piggy_bank_name, raw)
+    
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result)
     
     return result
 
@@ -59,66 +120,238 @@ async def get_transactions(
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
-    year: Optional[int] = Query(None)
+    year: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    stream: bool = Query(False)
 ):
-    """Get transactions with optional filters"""
+    """
+    Get transactions with optional filters.
+    
+    Pages are keyed on (Date, Transaction ID): pass `limit`, then the
+    returned `next_cursor` as `cursor` for the following page. With
+    `stream=true` rows are sent as newline-delimited JSON while they are
+    serialized, and the next cursor is in the X-Next-Cursor header.
+    """
     tm = TransactionManager(account_name, piggy_bank_name)
     
-    # Load data
-    load_result = tm.load_from_csv(year)
-    if not load_result["success"] and load_result.get("error") != "File not found":
-        raise HTTPException(status_code=404, detail=load_result["error"])
+    async with piggy_bank_locks.read(account_name, piggy_bank_name):
+        # A date range without a year only opens the year files it overlaps
+        if year is None and (start_date or end_date):
+            df = await run_blocking(tm.load_range, start_date, end_date)
+            if category:
+                df = df[df['Category'] == category]
+            tm.current_balance = tm.meta.closing_balance()
+        else:
+            # Load data
+            load_result = await run_blocking(tm.load, year)
+            if not load_result["success"] and load_result.get("error") != "File not found":
+                raise HTTPException(status_code=404, detail=load_result["error"])
+            
+            # Get filtered transactions
+            df = await run_blocking(tm.get_transactions, start_date, end_date, category)
     
-    # Get filtered transactions
-    df = tm.get_transactions(start_date, end_date, category)
+    try:
+        page, next_cursor = pagination.paginate(df, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Convert to dict
-    transactions = df.to_dict('records')
+    if stream:
+        headers = {"X-Balance": str(tm.current_balance)}
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return StreamingResponse(
+            pagination.iter_ndjson(page),
+            media_type="application/x-ndjson",
+            headers=headers
+        )
     
-    # Convert timestamps to strings
-    for t in transactions:
-        if 'Date' in t:
-            t['Date'] = t['Date'].isoformat()
+    transactions = await run_blocking(pagination.serialize_records, page)
     
     return {
         "transactions": transactions,
         "count": len(transactions),
-        "balance": tm.current_balance
+        "balance": tm.current_balance,
+        "next_cursor": next_cursor
     }
 
 
-@router.delete("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/transactions/{transaction_id}")
-async def delete_transaction(
+@router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/transactions/query")
+async def query_transactions(
     account_name: str,
     piggy_bank_name: str,
-    transaction_id: int
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    year: Optional[int] = Query(None),
+    category: Optional[List[str]] = Query(None, description="Repeat to match any of several categories"),
+    min_amount: Optional[float] = Query(None),
+    max_amount: Optional[float] = Query(None),
+    sign: Optional[str] = Query(None, description="income or expense"),
+    description: Optional[str] = Query(None, description="Case-insensitive substring"),
+    sort: str = Query("date", description="date, amount, category or id; prefix with - to reverse"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    stream: bool = Query(False)
 ):
-    """Delete a transaction by ID"""
+    """
+    Search transactions.
+    
+    Filters are pushed down to the storage format, so only matching rows
+    are read and serialized. Rows carry no running balance.
+    """
+    try:
+        query = TransactionQuery(
+            start_date=start_date,
+            end_date=end_date,
+            categories=category or [],
+            min_amount=min_amount,
+            max_amount=max_amount,
+            sign=sign,
+            description=description,
+            sort=sort,
+            limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    tm = TransactionManager(account_name, piggy_bank_name)
+    
+    async with piggy_bank_locks.read(account_name, piggy_bank_name):
+        df = await run_blocking(tm.query, query, year)
+    
+    if stream:
+        return StreamingResponse(pagination.iter_ndjson(df), media_type="application/x-ndjson")
+    
+    transactions = await run_blocking(pagination.serialize_records, df)
+    
+    return {
+        "transactions": transactions,
+        "count": len(transactions)
+    }
+
+
+@router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/transactions/search")
+async def search_transactions(
+    account_name: str,
+    piggy_bank_name: str,
+    q: str = Query(..., description="Words to find in descriptions; end a word with * to match a prefix"),
+    match: str = Query("all", description="all or any of the words"),
+    year: Optional[int] = Query(None),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE)
+):
+    """
+    Full-text search over descriptions, newest first.
+    
+    Served from the piggy bank's search index; only years holding matches
+    are read.
+    """
+    tm = TransactionManager(account_name, piggy_bank_name)
+    
+    async with piggy_bank_locks.read(account_name, piggy_bank_name):
+        try:
+            df, total = await run_blocking(tm.search, q, match, limit, year)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    transactions = await run_blocking(pagination.serialize_records, df)
+    
+    return {
+        "transactions": transactions,
+        "count": len(transactions),
+        "total": total
+    }
+
+
+@router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/transactions/{transaction_id}")
+async def get_transaction(
+    account_name: str,
+    piggy_bank_name: str,
+    transaction_id: int,
+    year: Optional[int] = Query(None)
+):
+    """Get a single transaction by ID"""
     tm = TransactionManager(account_name, piggy_bank_name)
     
-    # Load existing data
-    load_result = tm.load_from_csv()
+    async with piggy_bank_locks.read(account_name, piggy_bank_name):
+        load_result = await run_blocking(tm.load, year)
+    
     if not load_result["success"]:
         raise HTTPException(status_code=404, detail=load_result["error"])
     
-    # Delete transaction
-    result = tm.delete_transaction_by_id(transaction_id)
+    transaction = tm.get_transaction(transaction_id)
     
-    if not result["success"]:
-        raise HTTPException(status_code=404, detail=result["error"])
+    if transaction is None:
+        raise HTTPException(status_code=404, detail=f"Transaction ID {transaction_id} not found.")
     
-    # Save changes
-    tm.save_to_csv()
+    transaction['Date'] = transaction['Date'].isoformat()
+    return transaction
+
+
+@router.delete("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/transactions/{transaction_id}")
+async def delete_transaction(
+    account_name: str,
+    piggy_bank_name: str,
+    transaction_id: int,
+    year: Optional[int] = Query(None)
+):
+    """Delete a transaction by ID"""
+    tm = TransactionManager(account_name, piggy_bank_name)
+    
+    async with piggy_bank_locks.write(account_name, piggy_bank_name):
+        # Load existing data
+        load_result = await run_blocking(tm.load, year)
+        if not load_result["success"]:
+            raise HTTPException(status_code=404, detail=load_result["error"])
+        
+        # Delete transaction
+        result = await run_blocking(tm.delete_transaction_by_id, transaction_id)
+        
+        if not result["success"]:
+            raise HTTPException(status_code=404, detail=result["error"])
+        
+        # Persist the delete as a tombstone record
+        await run_blocking(tm.flush, tm.loaded_year)
     
     return result
 
 
 @router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/balance")
-async def get_balance(account_name: str, piggy_bank_name: str, year: Optional[int] = None):
-    """Get current balance"""
+async def get_balance(
+    account_name: str,
+    piggy_bank_name: str,
+    year: Optional[int] = None,
+    as_of: Optional[str] = Query(None, description="Balance at the end of this date")
+):
+    """Get current balance, or the balance as of a date"""
     tm = TransactionManager(account_name, piggy_bank_name)
     
-    load_result = tm.load_from_csv(year)
+    if as_of is not None:
+        try:
+            pd.to_datetime(as_of)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail=f"Invalid date: {as_of}")
+        
+        async with piggy_bank_locks.read(account_name, piggy_bank_name):
+            result = await run_blocking(tm.balance_as_of, as_of)
+        
+        if not result["success"]:
+            raise HTTPException(status_code=404, detail=result["error"])
+        return result
+    
+    # Catalogued years are answered without reading any year file, unless
+    # the file changed since the catalog was written
+    entry = AccountCatalog(account_name).piggy_bank(piggy_bank_name)
+    if entry and entry["years"] and (year is None or str(year) in entry["years"]):
+        catalogued_year = year if year is not None else max(int(y) for y in entry["years"])
+        snapshot = entry["years"][str(catalogued_year)]
+        if tm.is_catalogued(catalogued_year, snapshot):
+            return {
+                "balance": snapshot["closing_balance"],
+                "transaction_count": snapshot["count"],
+                "year": catalogued_year
+            }
+    
+    async with piggy_bank_locks.read(account_name, piggy_bank_name):
+        load_result = await run_blocking(tm.load, year)
     
     return {
         "balance": tm.current_balance,
@@ -0,0 +1,131 @@
+"""
+Maintenance Commands
+Run from the backend directory: python -m app.cli <command> [options]
+"""
+import argparse
+import json
+import os
+import sys
+
+
+def convert_storage(args: argparse.Namespace) -> dict:
+    """Convert year files between storage formats"""
+    from app.domain.migrations import convert_storage
+    return convert_storage(
+        target_format=args.to_format,
+        source_format=args.from_format,
+        remove_source=args.remove_source
+    )
+
+
+def rebuild_rollups(args: argparse.Namespace) -> dict:
+    """Rebuild monthly report rollups from stored transactions"""
+    from app.domain.migrations import rebuild_rollups
+    return rebuild_rollups(
+        account_name=args.account,
+        piggy_bank_name=args.piggy_bank,
+        storage_format=args.storage_format
+    )
+
+
+def encode_categories(args: argparse.Namespace) -> dict:
+    """Store category IDs instead of names in existing year files"""
+    from app.domain.migrations import encode_categories
+    return encode_categories(storage_format=args.storage_format)
+
+
+def generate_data(args: argparse.Namespace) -> dict:
+    """Write a synthetic piggy bank for benchmarks and load tests"""
+    if args.data_dir:
+        # Must be set before settings are first imported
+        os.environ["USER_DATA_DIR"] = args.data_dir
+    from app.domain.synthetic import generate_dataset
+    return generate_dataset(
+        account_name=args.account,
+        piggy_bank_name=args.piggy_bank,
+        rows_per_year=args.rows,
+        years=args.years,
+        categories=args.categories,
+        start_year=args.start_year,
+        seed=args.seed,
+        storage_format=args.storage_format
+    )
+
+
+def startup_check(args: argparse.Namespace) -> dict:
+    """Time a cold import of the app against the startup budget"""
+    from app.startup_check import check
+    return check(
+        budget_ms=args.budget_ms,
+        module=args.module,
+        runs=args.runs,
+        top=args.top
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    convert = commands.add_parser(
+        "convert-storage",
+        help="Convert data/user/**/<format> year files to another storage format"
+    )
+    convert.add_argument("--to", dest="to_format", required=True, help="csv, parquet or feather")
+    convert.add_argument("--from", dest="from_format", default="csv", help="source format (default: csv)")
+    convert.add_argument("--remove-source", action="store_true", help="delete source files after converting")
+    convert.set_defaults(handler=convert_storage)
+    
+    rollups = commands.add_parser(
+        "rebuild-rollups",
+        help="Rebuild the monthly rollups that reports are served from"
+    )
+    rollups.add_argument("--account", help="only this account")
+    rollups.add_argument("--piggy-bank", help="only this piggy bank")
+    rollups.add_argument("--storage-format", help="storage format to read (default: TRANSACTION_STORAGE_FORMAT)")
+    rollups.set_defaults(handler=rebuild_rollups)
+    
+    encode = commands.add_parser(
+        "encode-categories",
+        help="Rewrite year files that store category names to store category dictionary IDs"
+    )
+    encode.add_argument("--storage-format", help="only this format (default: csv, parquet and feather)")
+    encode.set_defaults(handler=encode_categories)
+    
+    generate = commands.add_parser(
+        "generate-data",
+        help="Write reproducible synthetic year files for a new piggy bank"
+    )
+    generate.add_argument("--account", default="bench", help="account name (default: bench)")
+    generate.add_argument("--piggy-bank", default="synthetic", help="piggy bank name (default: synthetic)")
+    generate.add_argument("--rows", type=int, default=10000, help="rows per year (default: 10000)")
+    generate.add_argument("--years", type=int, default=3, help="number of years (default: 3)")
+    generate.add_argument("--categories", type=int, default=8, help="expense categories (default: 8)")
+    generate.add_argument("--start-year", type=int, default=2020, help="first year (default: 2020)")
+    generate.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    generate.add_argument("--storage-format", help="storage format to write (default: TRANSACTION_STORAGE_FORMAT)")
+    generate.add_argument("--data-dir", help="write under this directory instead of USER_DATA_DIR")
+    generate.set_defaults(handler=generate_data)
+    
+    startup = commands.add_parser(
+        "startup-check",
+        help="Report cold-start import time and fail when it is over budget"
+    )
+    startup.add_argument("--budget-ms", type=float, help="budget in ms (default: STARTUP_IMPORT_BUDGET_MS)")
+    startup.add_argument("--module", default="app.main", help="module to import (default: app.main)")
+    startup.add_argument("--runs", type=int, default=3, help="cold imports to take the fastest of (default: 3)")
+    startup.add_argument("--top", type=int, default=10, help="slowest packages to list (default: 10)")
+    startup.set_defaults(handler=startup_check)
+    
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    result = args.handler(args)
+    print(json.dumps(result, indent=2, default=str))
+    return 0 if result.get("success", True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
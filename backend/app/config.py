@@ -3,11 +3,21 @@ Application Configuration
 Handles environment variables and settings
 """
 import os
-import yaml
+import threading
 from typing import List
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 from pathlib import Path
 
+# Settings config.yaml may override; the file is read the first time one is used
+YAML_FIELDS = frozenset({
+    "DRIVE_FOLDER_ID",
+    "GOOGLE_SCOPES",
+    "DEFAULT_CATEGORIES",
+    "DATA_BASE_DIR",
+    "USER_DATA_DIR"
+})
+
 
 class Settings(BaseSettings):
     # ------------
@@ -46,6 +56,34 @@ class Settings(BaseSettings):
     # --------
     DATABASE_URL: str = "sqlite:///./data/bookkeeping.db"
     
+    # -----------------
+    # Transaction Cache
+    # -----------------
+    TRANSACTION_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    REPORT_CACHE_MAX_ENTRIES: int = 1024
+    
+    # -------------------
+    # Transaction Storage
+    # -------------------
+    TRANSACTION_STORAGE_FORMAT: str = "csv"
+    TRANSACTION_FSYNC: bool = False
+    
+    # -----------
+    # Concurrency
+    # -----------
+    STORAGE_IO_WORKERS: int = 8
+    
+    # ----------
+    # Pagination
+    # ----------
+    MAX_PAGE_SIZE: int = 5000
+    
+    # -------
+    # Startup
+    # -------
+    # Budget for importing app.main in a fresh interpreter
+    STARTUP_IMPORT_BUDGET_MS: int = 1000
+    
     # --------
     # Security
     # --------
@@ -63,42 +101,63 @@ class Settings(BaseSettings):
         "Others"
     ]
     
+    _yaml_applied: bool = PrivateAttr(default=False)
+    _yaml_lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
+    
+    def __getattribute__(self, name: str):
+        if name in YAML_FIELDS and not super().__getattribute__("__pydantic_private__")["_yaml_applied"]:
+            self.apply_yaml_config()
+        return super().__getattribute__(name)
+    
+    def __setattr__(self, name: str, value) -> None:
+        # Merge first, so values set in code still win over the file
+        if name in YAML_FIELDS:
+            self.apply_yaml_config()
+        super().__setattr__(name, value)
+    
+    def apply_yaml_config(self) -> None:
+        """Merge the YAML config file over these settings, once"""
+        with self._yaml_lock:
+            if self._yaml_applied:
+                return
+            # Set first: the merge below reads the fields it overrides
+            self._yaml_applied = True
+            
+            yaml_config = load_yaml_config(self.CONFIG_FILE)
+            if 'google_drive' in yaml_config:
+                self.DRIVE_FOLDER_ID = yaml_config['google_drive'].get('folder_id', '')
+                self.GOOGLE_SCOPES = yaml_config['google_drive'].get('scopes', self.GOOGLE_SCOPES)
+            
+            if 'defaults' in yaml_config and 'categories' in yaml_config['defaults']:
+                self.DEFAULT_CATEGORIES = yaml_config['defaults']['categories']
+            
+            if 'paths' in yaml_config:
+                paths = yaml_config['paths']
+                self.DATA_BASE_DIR = paths.get('data_base_dir', self.DATA_BASE_DIR)
+                self.USER_DATA_DIR = paths.get('user_data_dir', self.USER_DATA_DIR)
 
 
 def load_yaml_config(config_path: str = None) -> dict:
     """
-    Load configuration from YAML file
+    Load configuration from YAML file. PyYAML is only imported when the
+    file exists.
     """
     if config_path is None:
-        config_path = Settings().CONFIG_FILE
+        config_path = settings.CONFIG_FILE
     
     if os.path.exists(config_path):
+        import yaml
         with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.safe_load(f) or {}
     return {}
 
 
 # ------------------------
 # Global settings instance
 # ------------------------
-settings = Settings()
-
-# ------------------------------------
-# Load and merge YAML config if exists
-# ------------------------------------
-yaml_config = load_yaml_config()
-if yaml_config:
-    if 'google_drive' in yaml_config:
-        settings.DRIVE_FOLDER_ID = yaml_config['google_drive'].get('folder_id', '')
-        settings.GOOGLE_SCOPES = yaml_config['google_drive'].get('scopes', settings.GOOGLE_SCOPES)
-    
-    if 'defaults' in yaml_config and 'categories' in yaml_config['defaults']:
-        settings.DEFAULT_CATEGORIES = yaml_config['defaults']['categories']
-    
-    if 'paths' in yaml_config:
-        paths = yaml_config['paths']
-        settings.DATA_BASE_DIR = paths.get('data_base_dir', settings.DATA_BASE_DIR)
-        settings.USER_DATA_DIR = paths.get('user_data_dir', settings.USER_DATA_DIR)
\ No newline at end of file
+# config.yaml is merged in lazily, see Settings.apply_yaml_config
+settings = Settings()
\ No newline at end of file
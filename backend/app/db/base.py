@@ -1,9 +1,4 @@
-from models.base import Base
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import declarative_base
 
-engine = create_engine("sqlite:///piggy_nest.db", echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Declarative base shared by every model; the engine lives in db/session.py
+Base = declarative_base()
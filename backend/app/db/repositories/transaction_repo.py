@@ -0,0 +1,242 @@
+# db/repositories/transaction_repo.py
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+from sqlalchemy import case, delete, exists, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.transaction import Ledger, Transaction
+
+# Frame column -> model column, in the order TransactionManager uses
+FRAME_COLUMNS = {
+    "Transaction ID": Transaction.id,
+    "Date": Transaction.date,
+    "Amount": Transaction.amount,
+    "Category": Transaction.category,
+    "Description": Transaction.description,
+}
+
+
+class TransactionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # -------
+    # Ledgers
+    # -------
+    def get_ledger_id(
+        self,
+        account_name: str,
+        piggy_bank_name: str,
+        create: bool = False
+    ) -> Optional[int]:
+        """Ledger ID of a piggy bank, optionally creating the ledger"""
+        ledger_id = self.db.scalar(
+            select(Ledger.id).where(
+                Ledger.account_name == account_name,
+                Ledger.piggy_bank_name == piggy_bank_name,
+            )
+        )
+        if ledger_id is None and create:
+            ledger = Ledger(account_name=account_name, piggy_bank_name=piggy_bank_name, version=0)
+            self.db.add(ledger)
+            self.db.commit()
+            ledger_id = ledger.id
+        return ledger_id
+
+    def version(self, ledger_id: int) -> int:
+        return self.db.scalar(select(Ledger.version).where(Ledger.id == ledger_id)) or 0
+
+    def _bump_version(self, ledger_id: int) -> None:
+        self.db.execute(
+            update(Ledger).where(Ledger.id == ledger_id).values(version=Ledger.version + 1)
+        )
+
+    # -----
+    # Reads
+    # -----
+    def years(self, ledger_id: int) -> List[int]:
+        """Years holding at least one transaction"""
+        first, last = self.db.execute(
+            select(func.min(Transaction.date), func.max(Transaction.date))
+            .where(Transaction.piggy_bank_id == ledger_id)
+        ).one()
+        if first is None:
+            return []
+
+        # One index probe per year instead of scanning every row
+        return [
+            year for year in range(first.year, last.year + 1)
+            if self.db.scalar(select(exists().where(*self._year_filter(ledger_id, year))))
+        ]
+
+    def get(self, ledger_id: int, transaction_id: int) -> Optional[Transaction]:
+        return self.db.get(Transaction, (ledger_id, transaction_id))
+
+    def balance_before(self, ledger_id: int, date: datetime) -> float:
+        """Sum of all amounts dated before the given date"""
+        return float(self.db.scalar(
+            select(func.coalesce(func.sum(Transaction.amount), 0.0)).where(
+                Transaction.piggy_bank_id == ledger_id,
+                Transaction.date < date,
+            )
+        ))
+
+    def read_year(self, ledger_id: int, year: int) -> pd.DataFrame:
+        """Transactions of one year in (date, id) order, without balances"""
+        stmt = (
+            select(*[column.label(name) for name, column in FRAME_COLUMNS.items()])
+            .where(*self._year_filter(ledger_id, year))
+            .order_by(Transaction.date, Transaction.id)
+        )
+        return self._read_frame(stmt)
+
+    def read_range(
+        self,
+        ledger_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Transactions between two dates (inclusive) with running balances.
+
+        Only the rows in range are read; the balance carried into the range
+        is a single indexed sum over the rows before it.
+        """
+        filters = [Transaction.piggy_bank_id == ledger_id]
+        if start is not None:
+            filters.append(Transaction.date >= start)
+        if end is not None:
+            filters.append(Transaction.date <= end)
+
+        opening = self.balance_before(ledger_id, start) if start is not None else 0.0
+        running = func.sum(Transaction.amount).over(order_by=(Transaction.date, Transaction.id))
+
+        stmt = (
+            select(
+                *[column.label(name) for name, column in FRAME_COLUMNS.items()],
+                (running + opening).label("Balance"),
+            )
+            .where(*filters)
+            .order_by(Transaction.date, Transaction.id)
+        )
+        return self._read_frame(stmt)
+
+    def query(self, ledger_id: int, year: int, query) -> pd.DataFrame:
+        """
+        Transactions of one year matching a TransactionQuery, filtered,
+        sorted and limited by the database; balances are not derived
+        """
+        filters = self._year_filter(ledger_id, year)
+        if query.start is not None:
+            filters.append(Transaction.date >= query.start.to_pydatetime())
+        if query.end is not None:
+            filters.append(Transaction.date <= query.end.to_pydatetime())
+        if query.min_amount is not None:
+            filters.append(Transaction.amount >= query.min_amount)
+        if query.max_amount is not None:
+            filters.append(Transaction.amount <= query.max_amount)
+        if query.sign == "income":
+            filters.append(Transaction.amount > 0)
+        elif query.sign == "expense":
+            filters.append(Transaction.amount < 0)
+        if query.categories:
+            filters.append(Transaction.category.in_(query.categories))
+        if query.description:
+            filters.append(Transaction.description.icontains(query.description, autoescape=True))
+
+        order_by = [FRAME_COLUMNS[name] for name in query.sort_columns]
+        if query.descending:
+            order_by = [column.desc() for column in order_by]
+
+        stmt = (
+            select(*[column.label(name) for name, column in FRAME_COLUMNS.items()])
+            .where(*filters)
+            .order_by(*order_by)
+            .limit(query.limit)
+        )
+        return self._read_frame(stmt)
+
+    # ------
+    # Writes
+    # ------
+    def apply(self, ledger_id: int, rows: pd.DataFrame, deleted_ids: Iterable[int]) -> None:
+        """Insert new rows and delete removed IDs in a single transaction"""
+        ids = [int(i) for i in deleted_ids]
+        if ids:
+            self.db.execute(
+                delete(Transaction).where(
+                    Transaction.piggy_bank_id == ledger_id,
+                    Transaction.id.in_(ids),
+                )
+            )
+        if not rows.empty:
+            self.db.execute(insert(Transaction), self._records(ledger_id, rows))
+        self._bump_version(ledger_id)
+        self.db.commit()
+
+    def replace_year(self, ledger_id: int, year: int, rows: pd.DataFrame) -> None:
+        """Replace every transaction of a year in a single transaction"""
+        self.db.execute(delete(Transaction).where(*self._year_filter(ledger_id, year)))
+        if not rows.empty:
+            self.db.execute(insert(Transaction), self._records(ledger_id, rows))
+        self._bump_version(ledger_id)
+        self.db.commit()
+
+    def rename_categories(self, renames: Dict[str, str]) -> int:
+        """
+        Rename categories in every ledger with a single statement, so names
+        can be swapped, and bump the version of each ledger that changed.
+        Returns the number of rows relabelled.
+        """
+        renames = {old: new for old, new in renames.items() if old != new}
+        if not renames:
+            return 0
+
+        matches = Transaction.category.in_(list(renames))
+        ledger_ids = self.db.scalars(select(Transaction.piggy_bank_id).where(matches).distinct()).all()
+        result = self.db.execute(
+            update(Transaction)
+            .where(matches)
+            .values(category=case(renames, value=Transaction.category))
+        )
+        for ledger_id in ledger_ids:
+            self._bump_version(ledger_id)
+        self.db.commit()
+        return result.rowcount
+
+    # -------
+    # Helpers
+    # -------
+    @staticmethod
+    def _year_filter(ledger_id: int, year: int) -> list:
+        return [
+            Transaction.piggy_bank_id == ledger_id,
+            Transaction.date >= datetime(year, 1, 1),
+            Transaction.date < datetime(year + 1, 1, 1),
+        ]
+
+    @staticmethod
+    def _records(ledger_id: int, rows: pd.DataFrame) -> List[dict]:
+        dates = pd.to_datetime(rows["Date"]).tolist()
+        return [
+            {
+                "piggy_bank_id": ledger_id,
+                "id": int(transaction_id),
+                "date": date,
+                "amount": float(amount),
+                "category": category if isinstance(category, str) else "",
+                "description": description if isinstance(description, str) else "",
+            }
+            for transaction_id, date, amount, category, description in zip(
+                rows["Transaction ID"],
+                dates,
+                rows["Amount"],
+                rows["Category"],
+                rows["Description"],
+            )
+        ]
+
+    def _read_frame(self, stmt) -> pd.DataFrame:
+        return pd.read_sql(stmt, self.db.connection(), parse_dates=["Date"])
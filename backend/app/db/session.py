@@ -0,0 +1,68 @@
+# db/session.py
+import os
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.config import settings
+from app.db.base import Base
+
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "cache_size": -64 * 1024,
+    "mmap_size": 256 * 1024 * 1024,
+}
+
+
+def _make_engine(url: str):
+    if not url.startswith("sqlite"):
+        return create_engine(url, pool_pre_ping=True)
+
+    database = url.split("///", 1)[-1]
+    if database and database != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(database)), exist_ok=True)
+
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        pragmas = dict(SQLITE_PRAGMAS)
+        if settings.TRANSACTION_FSYNC:
+            pragmas["synchronous"] = "FULL"
+
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return engine
+
+
+engine = _make_engine(settings.DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+_initialized = False
+
+
+def init_db() -> None:
+    """Create the transaction tables if they do not exist yet"""
+    global _initialized
+    if _initialized:
+        return
+
+    from app.models.transaction import Ledger, Transaction
+    Base.metadata.create_all(bind=engine, tables=[Ledger.__table__, Transaction.__table__])
+    _initialized = True
+
+
+def get_db():
+    """FastAPI dependency yielding a session that is always closed"""
+    init_db()
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,92 @@
+"""
+Core Business Logic - Account Management
+"""
+import os
+import re
+import shutil
+from typing import List, Optional
+from app.config import settings
+from app.domain.catalog import AccountCatalog
+
+NAME_PATTERN = re.compile(r"^[\w\-]+$")
+
+
+class AccountManager:
+    """
+    Manages accounts: folders under USER_DATA_DIR holding piggy banks.
+    
+    Listings and details come from each account's catalog, so no year
+    file is read. An account with data but no catalog yet has it rebuilt
+    from the piggy bank metadata once.
+    """
+    
+    def _catalog(self, account_name: str) -> AccountCatalog:
+        catalog = AccountCatalog(account_name)
+        if not catalog.exists() and os.path.isdir(catalog.account_path):
+            catalog.rebuild()
+        return catalog
+    
+    def list_accounts(self) -> List[dict]:
+        """Summaries of every account"""
+        if not os.path.isdir(settings.USER_DATA_DIR):
+            return []
+        
+        return [
+            self._catalog(name).summary()
+            for name in sorted(os.listdir(settings.USER_DATA_DIR))
+            if os.path.isdir(os.path.join(settings.USER_DATA_DIR, name))
+        ]
+    
+    def create_account(self, account_name: str) -> dict:
+        """Create a new account"""
+        if not NAME_PATTERN.match(account_name):
+            return {
+                "success": False,
+                "error": "Invalid account name. Use alphanumeric, hyphen, underscore."
+            }
+        
+        catalog = AccountCatalog(account_name)
+        if os.path.isdir(catalog.account_path):
+            return {
+                "success": False,
+                "error": f"Account '{account_name}' already exists."
+            }
+        
+        catalog.rebuild()
+        return {
+            "success": True,
+            "account": catalog.summary(),
+            "message": f"Account '{account_name}' created successfully."
+        }
+    
+    def get_account(self, account_name: str) -> Optional[dict]:
+        """Account summary with its piggy banks, or None if it does not exist"""
+        if not NAME_PATTERN.match(account_name):
+            return None
+        if not os.path.isdir(AccountCatalog(account_name).account_path):
+            return None
+        return self._catalog(account_name).summary()
+    
+    def delete_account(self, account_name: str, delete_data: bool = False) -> dict:
+        """
+        Delete an account. Accounts holding piggy banks are only deleted,
+        with all their data, when delete_data is set.
+        """
+        account = self.get_account(account_name)
+        if account is None:
+            return {
+                "success": False,
+                "error": f"Account '{account_name}' not found."
+            }
+        
+        if account["piggy_bank_count"] and not delete_data:
+            return {
+                "success": False,
+                "error": f"Account '{account_name}' holds piggy banks; set delete_data to remove them."
+            }
+        
+        shutil.rmtree(account["path"])
+        return {
+            "success": True,
+            "message": f"Account '{account_name}' deleted successfully."
+        }
@@ -0,0 +1,96 @@
+"""
+Core Business Logic - Report Aggregation Engine
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable
+
+CELL_COLUMNS = ['year', 'month', 'category', 'sign', 'sum', 'count']
+
+
+def aggregate(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sum and count transactions per (year, month, category, sign) in one
+    pass.
+    
+    Each row is mapped to a dense integer cell key and the sums and counts
+    are accumulated with np.bincount, so the cost is linear in the rows and
+    independent of how many breakdowns are read from the result. Sign is 1
+    for income, -1 for expenses and 0 for zero amounts.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=CELL_COLUMNS)
+    
+    months = df['Date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]').astype('int64')
+    amounts = df['Amount'].to_numpy(dtype='float64')
+    signs = np.sign(amounts).astype('int64') + 1
+    codes, categories = pd.factorize(df['Category'], use_na_sentinel=False)
+    
+    first_month = months.min()
+    n_categories = len(categories)
+    keys = ((months - first_month) * 3 + signs) * n_categories + codes
+    
+    sums = np.bincount(keys, weights=amounts)
+    counts = np.bincount(keys)
+    cells = np.flatnonzero(counts)
+    
+    month_index, rest = np.divmod(cells, 3 * n_categories)
+    sign_index, category_index = np.divmod(rest, n_categories)
+    absolute_month = month_index + first_month
+    
+    return pd.DataFrame({
+        'year': absolute_month // 12 + 1970,
+        'month': absolute_month % 12 + 1,
+        'category': np.asarray(categories, dtype=object)[category_index],
+        'sign': sign_index - 1,
+        'sum': sums[cells],
+        'count': counts[cells]
+    })
+
+
+def totals(cells: pd.DataFrame) -> Dict[str, float]:
+    """Income, expenses and net of a set of cells"""
+    income = float(cells.loc[cells['sign'] > 0, 'sum'].sum())
+    expenses = float(cells.loc[cells['sign'] < 0, 'sum'].sum())
+    return {
+        "income": income,
+        "expenses": expenses,
+        "net": income + expenses
+    }
+
+
+def by_category(cells: pd.DataFrame, sign: int, exclude: Iterable[str] = ()) -> Dict[str, float]:
+    """
+    Per-category sums for one sign, largest amounts first; categories in
+    exclude are matched case-insensitively
+    """
+    selected = cells[cells['sign'] == sign]
+    
+    excluded = {c.lower() for c in exclude}
+    if excluded and not selected.empty:
+        selected = selected[~selected['category'].str.lower().isin(excluded)]
+    
+    if selected.empty:
+        return {}
+    
+    sums = selected.groupby('category')['sum'].sum().sort_values(ascending=sign < 0)
+    return {k: float(v) for k, v in sums.items()}
+
+
+def merge_cells(partials: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Combine cells aggregated separately (e.g. one set per piggy bank) into
+    the cells a single aggregation over all their rows would produce
+    """
+    partials = [cells for cells in partials if not cells.empty]
+    if not partials:
+        return pd.DataFrame(columns=CELL_COLUMNS)
+    if len(partials) == 1:
+        return partials[0]
+    
+    keys = [c for c in CELL_COLUMNS if c not in ('sum', 'count') and c in partials[0].columns]
+    return (
+        pd.concat(partials, ignore_index=True)
+        .groupby(keys, sort=False, as_index=False)[['sum', 'count']]
+        .sum()
+    )
@@ -0,0 +1,81 @@
+"""
+Core Business Logic - Running Balance Engine
+"""
+import numpy as np
+import pandas as pd
+
+
+SORT_KEYS = ['Date', 'Transaction ID']
+
+
+def running_balance(amounts, opening_balance: float = 0.0) -> np.ndarray:
+    """
+    Balance after each amount, starting from an opening balance
+    """
+    values = np.asarray(amounts, dtype='float64')
+    return opening_balance + np.cumsum(values)
+
+
+def sorted_position(df: pd.DataFrame, date, transaction_id: int) -> int:
+    """
+    Binary search for the row position of (date, transaction_id) in a frame
+    sorted by SORT_KEYS
+    """
+    dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+    key = np.datetime64(pd.Timestamp(date), 'ns')
+    
+    left = int(np.searchsorted(dates, key, side='left'))
+    right = int(np.searchsorted(dates, key, side='right'))
+    if left == right:
+        return left
+    
+    # Same-day rows are ordered by ID
+    ids = df['Transaction ID'].to_numpy()[left:right]
+    return left + int(np.searchsorted(ids, transaction_id, side='left'))
+
+
+def insert_sorted(df: pd.DataFrame, row: dict, position: int) -> pd.DataFrame:
+    """
+    Insert a row at a known sorted position without re-sorting the frame
+    """
+    # Column-wise construction skips pandas' row inference and dtype casts
+    new_row = pd.DataFrame({
+        column: pd.array([row.get(column)], dtype=dtype)
+        for column, dtype in df.dtypes.items()
+    })
+    return pd.concat(
+        [df.iloc[:position], new_row, df.iloc[position:]],
+        ignore_index=True
+    )
+
+
+def refresh_balances_from(df: pd.DataFrame, position: int, opening_balance: float = 0.0) -> None:
+    """
+    Recompute the Balance column in place from a row position onward.
+    
+    Rows before the position are untouched; their last balance seeds the
+    cumulative sum for the rest of the frame.
+    """
+    if position >= len(df):
+        return
+    
+    start = float(df['Balance'].iat[position - 1]) if position > 0 else opening_balance
+    tail = running_balance(df['Amount'].to_numpy()[position:], start)
+    df.iloc[position:, df.columns.get_loc('Balance')] = tail
+
+
+def balance_as_of(df: pd.DataFrame, as_of, opening_balance: float = 0.0, inclusive: bool = True) -> float:
+    """
+    Balance after every row dated on or before as_of (before it when not
+    inclusive).
+    
+    The sorted Date column is the index and the Balance column its prefix
+    sums, so this is one binary search instead of a mask and a sum.
+    """
+    dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+    key = np.datetime64(pd.Timestamp(as_of), 'ns')
+    position = int(np.searchsorted(dates, key, side='right' if inclusive else 'left'))
+    if position == 0:
+        return float(opening_balance)
+    return float(df['Balance'].iat[position - 1])
+
@@ -0,0 +1,188 @@
+"""
+Core Business Logic - Transaction Cache
+"""
+import os
+import sys
+import threading
+import pandas as pd
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+from app.config import settings
+from app.domain.prefix_sums import CategoryPrefixSums
+from app.domain.metrics import registry
+
+
+@dataclass
+class CacheEntry:
+    """
+    Parsed transaction file together with its balance state
+    """
+    df: pd.DataFrame
+    transaction_counter: int
+    current_balance: float
+    signature: Hashable
+    nbytes: int
+    opening_balance: float = 0.0
+    category_sums: Optional[CategoryPrefixSums] = None
+
+
+def estimate_nbytes(df: pd.DataFrame, sample_size: int = 1000) -> int:
+    """
+    Approximate memory footprint of a frame.
+    
+    Object columns are estimated from a sample of their values; measuring
+    every string (memory_usage(deep=True)) costs more than parsing a
+    columnar file.
+    """
+    nbytes = int(df.memory_usage(index=True, deep=False).sum())
+    
+    for column in df.columns[df.dtypes == object]:
+        values = df[column].to_numpy()
+        if len(values) == 0:
+            continue
+        step = max(1, len(values) // sample_size)
+        sample = values[::step]
+        average = sum(sys.getsizeof(v) for v in sample) / len(sample)
+        nbytes += int(average * len(values))
+    
+    return nbytes
+
+
+class TransactionCache:
+    """
+    Process-wide LRU cache of parsed transaction files.
+    
+    Entries are keyed by (account, piggy bank, year) and validated against
+    the file's mtime and size, so edits made outside this process are
+    picked up on the next read.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def file_signature(filepath: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of a file, or None if it does not exist"""
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def get(
+        self,
+        key: Hashable,
+        filepath: str,
+        signature: Optional[Hashable] = None
+    ) -> Optional[CacheEntry]:
+        """
+        Look up a cached entry, dropping it if the file changed on disk.
+        
+        Storage that is not a plain file passes its own change signature.
+        """
+        if signature is None:
+            signature = self.file_signature(filepath)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            
+            if entry is None or signature is None or entry.signature != signature:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(
+        self,
+        key: Hashable,
+        filepath: str,
+        df: pd.DataFrame,
+        transaction_counter: int,
+        current_balance: float,
+        opening_balance: float = 0.0,
+        signature: Optional[Hashable] = None,
+        category_sums: Optional[CategoryPrefixSums] = None
+    ) -> None:
+        """
+        Store a parsed file, evicting least recently used entries over budget
+        """
+        if signature is None:
+            signature = self.file_signature(filepath)
+        if signature is None:
+            self.invalidate(key)
+            return
+        
+        nbytes = estimate_nbytes(df)
+        if category_sums is not None:
+            nbytes += category_sums.nbytes
+        if nbytes > self.max_bytes:
+            self.invalidate(key)
+            return
+        
+        entry = CacheEntry(
+            df=df.copy(),
+            transaction_counter=int(transaction_counter),
+            current_balance=float(current_balance),
+            signature=signature,
+            nbytes=nbytes,
+            opening_balance=float(opening_balance),
+            category_sums=category_sums.copy() if category_sums is not None else None
+        )
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            self._entries[key] = entry
+            self.current_bytes += nbytes
+            
+            while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+    
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop one entry, or every entry when no key is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.current_bytes = 0
+            elif key in self._entries:
+                self._remove(key)
+    
+    def stats(self) -> Dict:
+        """Return hit/miss counters and memory usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes
+            }
+    
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry; caller must hold the lock"""
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.nbytes
+
+
+# ---------------------------
+# Process-wide cache instance
+# ---------------------------
+transaction_cache = TransactionCache(settings.TRANSACTION_CACHE_MAX_BYTES)
+registry.register_cache("transactions", transaction_cache)
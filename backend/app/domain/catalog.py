@@ -0,0 +1,152 @@
+"""
+Core Business Logic - Account Catalog
+"""
+import json
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from app.config import settings
+from app.domain.metadata import PiggyBankMeta
+
+# One writer per account catalog at a time within the process
+_catalog_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+
+class AccountCatalog:
+    """
+    Per-account manifest of piggy banks stored at
+    <USER_DATA_DIR>/<account>/catalog.json.
+    
+    Each piggy bank entry holds the years present with their row counts,
+    closing balances and storage signatures, the current balance, the data
+    version from the piggy bank metadata and the time of the last write,
+    so listings and balances are answered without touching year files.
+    Entries are rewritten from the metadata after every write, and the
+    file is always replaced atomically. A year whose signature no longer
+    matches its file was edited outside the app; readers fall back to the
+    file, and rebuild() refreshes the entries.
+    """
+    
+    FILENAME = "catalog.json"
+    
+    def __init__(self, account_name: str):
+        self.account_name = account_name
+        self.account_path = os.path.join(settings.USER_DATA_DIR, account_name)
+        self.path = os.path.join(self.account_path, self.FILENAME)
+    
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+    
+    def read(self) -> dict:
+        """The catalog, starting empty if it is missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        
+        if not isinstance(data.get("piggy_banks"), dict):
+            data["piggy_banks"] = {}
+        data["account"] = self.account_name
+        data.setdefault("version", 0)
+        return data
+    
+    def _write(self, data: dict) -> None:
+        """Replace the catalog file atomically; caller must hold the account lock"""
+        data["version"] = int(data.get("version", 0)) + 1
+        data["updated"] = _now()
+        
+        os.makedirs(self.account_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.account_path, prefix=f"{self.FILENAME}.", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+    
+    def piggy_bank(self, piggy_bank_name: str) -> Optional[dict]:
+        """A piggy bank's entry, or None if it is not catalogued"""
+        return self.read()["piggy_banks"].get(piggy_bank_name)
+    
+    def record_piggy_bank(
+        self,
+        piggy_bank_name: str,
+        meta: PiggyBankMeta,
+        storage_format: str = None,
+        signatures: Dict[int, list] = None
+    ) -> dict:
+        """
+        Store a piggy bank's entry from its metadata and the storage
+        signatures of its years as written
+        """
+        signatures = signatures or {}
+        years = {
+            str(year): {
+                "count": int(snapshot["count"]),
+                "net": float(snapshot["net"]),
+                "closing_balance": float(snapshot["opening_balance"] + snapshot["net"]),
+                "signature": signatures.get(year)
+            }
+            for year, snapshot in meta.years.items()
+        }
+        entry = {
+            "years": years,
+            "count": sum(y["count"] for y in years.values()),
+            "balance": float(meta.closing_balance()),
+            "data_version": meta.version,
+            "storage_format": storage_format,
+            "last_modified": _now()
+        }
+        
+        with _catalog_locks[self.account_path]:
+            # Re-read under the lock so concurrent piggy bank writes both land
+            data = self.read()
+            data["piggy_banks"][piggy_bank_name] = entry
+            self._write(data)
+        return entry
+    
+    def rebuild(self) -> dict:
+        """
+        Recreate every entry from the piggy bank folders and their
+        metadata, backfilling metadata for year files written before it
+        existed
+        """
+        from app.domain.transactions import TransactionManager
+        
+        names = TransactionManager.list_piggy_banks(self.account_name)
+        for name in names:
+            tm = TransactionManager(self.account_name, name)
+            files = tm.list_transaction_files()
+            if files:
+                tm._carried_balance(max(files) + 1, files)
+            tm._record_catalog()
+        
+        with _catalog_locks[self.account_path]:
+            data = self.read()
+            stale = set(data["piggy_banks"]) - set(names)
+            for name in stale:
+                del data["piggy_banks"][name]
+            if stale or not self.exists():
+                self._write(data)
+        return data
+    
+    def summary(self) -> dict:
+        """Account totals and piggy bank entries"""
+        data = self.read()
+        piggy_banks = data["piggy_banks"]
+        return {
+            "name": self.account_name,
+            "path": self.account_path,
+            "exists": os.path.isdir(self.account_path),
+            "piggy_bank_count": len(piggy_banks),
+            "transaction_count": sum(e["count"] for e in piggy_banks.values()),
+            "balance": sum(e["balance"] for e in piggy_banks.values()),
+            "last_modified": max((e["last_modified"] for e in piggy_banks.values()), default=None),
+            "version": data["version"],
+            "piggy_banks": piggy_banks
+        }
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
@@ -1,32 +1,74 @@
 import os
 import json
-from typing import List
-from backend.app.config.config import settings
+import bisect
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
+from app.domain.lazy import lazy_import
+
+# These modules import pandas; only renames need them
+category_dictionary = lazy_import("app.domain.category_dictionary", "category_dictionary")
+get_storage = lazy_import("app.domain.storage", "get_storage")
 
 
 class CategoryManager:
     """
     Manages transaction categories
+    
+    The sorted category list is kept in memory and re-read only when the
+    file's mtime or size changes, so lookups are binary searches instead of
+    a parse per call. Every write replaces the file atomically. Renames
+    are applied to the category dictionary too, which relabels every
+    stored transaction without rewriting year files, and to SQLite rows,
+    which store names.
     """
     
     def __init__(self, categories_file: str = None):
-        self.categories_file = categories_file or os.path.join(
-            settings.DATA_BASE_DIR,
-            "categories.json"
-        )
-        os.makedirs(os.path.dirname(self.categories_file), exist_ok=True)
+        self._categories_file = categories_file
+        self._categories: List[str] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
     
-    def load_categories(self) -> List[str]:
-        """Load categories from file"""
-        if os.path.exists(self.categories_file):
-            try:
-                with open(self.categories_file, 'r', encoding='utf-8') as f:
-                    cats = json.load(f)
-                    if not isinstance(cats, list):
-                        cats = []
-            except (json.JSONDecodeError, IOError):
-                cats = []
-        else:
+    @property
+    def categories_file(self) -> str:
+        """
+        The categories file. The default is resolved on first use, so
+        creating a manager at import reads no configuration.
+        """
+        if self._categories_file is None:
+            self._categories_file = os.path.join(settings.DATA_BASE_DIR, "categories.json")
+        return self._categories_file
+    
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.categories_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _current(self) -> List[str]:
+        """The cached sorted list, re-read if the file changed on disk"""
+        with self._lock:
+            signature = self._file_signature()
+            if signature is None or signature != self._signature:
+                self.misses += 1
+                self._categories = self._read()
+                self._signature = self._file_signature()
+            else:
+                self.hits += 1
+            return self._categories
+    
+    def _read(self) -> List[str]:
+        """Parse the categories file, writing the defaults if it is empty"""
+        try:
+            with open(self.categories_file, 'r', encoding='utf-8') as f:
+                cats = json.load(f)
+                if not isinstance(cats, list):
+                    cats = []
+        except (FileNotFoundError, json.JSONDecodeError, IOError):
             cats = []
         
         # Use defaults if empty
@@ -34,13 +76,40 @@ class CategoryManager:
             cats = settings.DEFAULT_CATEGORIES.copy()
             self.save_categories(cats)
         
-        cats.sort()
-        return cats
+        return sorted(set(cats))
+    
+    @staticmethod
+    def _contains(categories: List[str], category: str) -> bool:
+        position = bisect.bisect_left(categories, category)
+        return position < len(categories) and categories[position] == category
+    
+    def load_categories(self) -> List[str]:
+        """Load categories, sorted"""
+        return list(self._current())
     
     def save_categories(self, categories: List[str]) -> None:
-        """Save categories to file"""
-        with open(self.categories_file, 'w', encoding='utf-8') as f:
-            json.dump(categories, f, ensure_ascii=False, indent=2)
+        """Save categories to file through a temp file and rename"""
+        categories = sorted(categories)
+        folder = os.path.dirname(self.categories_file)
+        os.makedirs(folder, exist_ok=True)
+        
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=folder, prefix="categories.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(categories, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.categories_file)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            
+            self._categories = categories
+            self._signature = self._file_signature()
+    
+    def has_category(self, category: str) -> bool:
+        """Membership test by binary search"""
+        return self._contains(self._current(), category)
     
     def add_category(self, category: str) -> dict:
         """Add a new category"""
@@ -52,17 +121,17 @@ class CategoryManager:
                 "error": "Category name cannot be empty."
             }
         
-        categories = self.load_categories()
-        
-        if category in categories:
-            return {
-                "success": False,
-                "error": f"Category '{category}' already exists."
-            }
-        
-        categories.append(category)
-        categories.sort()
-        self.save_categories(categories)
+        with self._lock:
+            categories = self.load_categories()
+            
+            if self._contains(categories, category):
+                return {
+                    "success": False,
+                    "error": f"Category '{category}' already exists."
+                }
+            
+            bisect.insort(categories, category)
+            self.save_categories(categories)
         
         return {
             "success": True,
@@ -70,18 +139,46 @@ class CategoryManager:
             "message": f"Category '{category}' added successfully."
         }
     
+    def add_categories(self, names: List[str]) -> dict:
+        """
+        Add several categories with a single write; empty names and names
+        that already exist are skipped
+        """
+        with self._lock:
+            categories = self.load_categories()
+            added, skipped = [], []
+            
+            for name in names:
+                category = name.strip()
+                if not category or self._contains(categories, category):
+                    skipped.append(name)
+                    continue
+                bisect.insort(categories, category)
+                added.append(category)
+            
+            if added:
+                self.save_categories(categories)
+        
+        return {
+            "success": True,
+            "added": added,
+            "skipped": skipped,
+            "message": f"Added {len(added)} categories."
+        }
+    
     def delete_category(self, category: str) -> dict:
         """Delete a category"""
-        categories = self.load_categories()
-        
-        if category not in categories:
-            return {
-                "success": False,
-                "error": f"Category '{category}' not found."
-            }
-        
-        categories.remove(category)
-        self.save_categories(categories)
+        with self._lock:
+            categories = self.load_categories()
+            
+            if not self._contains(categories, category):
+                return {
+                    "success": False,
+                    "error": f"Category '{category}' not found."
+                }
+            
+            categories.pop(bisect.bisect_left(categories, category))
+            self.save_categories(categories)
         
         return {
             "success": True,
@@ -90,32 +187,12 @@ class CategoryManager:
     
     def update_category(self, old_name: str, new_name: str) -> dict:
         """Update/rename a category"""
-        new_name = new_name.strip()
-        
-        if not new_name:
-            return {
-                "success": False,
-                "error": "New category name cannot be empty."
-            }
+        result = self.rename_categories({old_name: new_name})
         
-        categories = self.load_categories()
-        
-        if old_name not in categories:
-            return {
-                "success": False,
-                "error": f"Category '{old_name}' not found."
-            }
-        
-        if new_name in categories and new_name != old_name:
-            return {
-                "success": False,
-                "error": f"Category '{new_name}' already exists."
-            }
-        
-        categories[categories.index(old_name)] = new_name
-        categories.sort()
-        self.save_categories(categories)
+        if not result["success"]:
+            return result
         
+        new_name = result["renamed"][old_name]
         return {
             "success": True,
             "old_name": old_name,
@@ -123,6 +200,52 @@ class CategoryManager:
             "message": f"Category renamed from '{old_name}' to '{new_name}'."
         }
     
+    def rename_categories(self, renames: Dict[str, str]) -> dict:
+        """
+        Rename several categories with a single write.
+        
+        Either every rename is applied or none is; names may be swapped
+        within one batch.
+        """
+        renames = {old: new.strip() for old, new in renames.items()}
+        
+        with self._lock:
+            categories = self.load_categories()
+            
+            for old_name, new_name in renames.items():
+                if not new_name:
+                    return {
+                        "success": False,
+                        "error": "New category name cannot be empty."
+                    }
+                if not self._contains(categories, old_name):
+                    return {
+                        "success": False,
+                        "error": f"Category '{old_name}' not found."
+                    }
+            
+            renamed = [c for c in categories if c not in renames] + list(renames.values())
+            if len(set(renamed)) != len(renamed):
+                duplicate = next(
+                    new for old, new in renames.items()
+                    if new != old and renamed.count(new) > 1
+                )
+                return {
+                    "success": False,
+                    "error": f"Category '{duplicate}' already exists."
+                }
+            
+            self.save_categories(renamed)
+            category_dictionary.rename(renames)
+            # SQLite rows store names, not dictionary IDs
+            get_storage('sqlite').rename_categories(renames)
+        
+        return {
+            "success": True,
+            "renamed": renames,
+            "message": f"Renamed {len(renames)} categories."
+        }
+    
     def get_categories(self) -> List[str]:
         """Get all categories"""
         return self.load_categories()
@@ -0,0 +1,202 @@
+"""
+Core Business Logic - Category Dictionary
+"""
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from app.config import settings
+
+# Year file column holding the encoded category
+ID_COLUMN = 'Category ID'
+
+
+class CategoryDictionary:
+    """
+    Per-user mapping between category names and the integer IDs stored in
+    year files.
+    
+    IDs are assigned on first use and never reused, so renaming a category
+    changes one entry here instead of every row that uses it. A rename onto
+    an existing name leaves two IDs with the same name; new rows are
+    encoded with the lower one. The version increases with every rename so
+    frames decoded under the old names can be told apart.
+    """
+    
+    FILENAME = "category_dictionary.json"
+    
+    def __init__(self):
+        self._names: Dict[int, str] = {}
+        self._ids: Dict[str, int] = {}
+        self._version = 0
+        self._signature = None
+        # (sorted category names, ID -> position in them), built lazily
+        self._decoder: Optional[Tuple[pd.Index, np.ndarray]] = None
+        self._lock = threading.RLock()
+    
+    @property
+    def path(self) -> str:
+        return os.path.join(settings.USER_DATA_DIR, self.FILENAME)
+    
+    def _file_signature(self) -> tuple:
+        path = self.path
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return path, None
+        return path, stat.st_mtime_ns, stat.st_size
+    
+    def _refresh(self) -> None:
+        """Re-read the dictionary if the file changed; caller must hold the lock"""
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        
+        names = data.get("names")
+        self._names = {int(i): n for i, n in names.items()} if isinstance(names, dict) else {}
+        self._version = int(data.get("version", 0))
+        self._index()
+        self._signature = signature
+    
+    def _index(self) -> None:
+        """Rebuild the name -> ID lookup, preferring the lowest ID per name"""
+        self._ids = {}
+        for category_id, name in sorted(self._names.items()):
+            self._ids.setdefault(name, category_id)
+        self._decoder = None
+    
+    def _save(self) -> None:
+        """Write the dictionary atomically; caller must hold the lock"""
+        folder = os.path.dirname(self.path)
+        os.makedirs(folder, exist_ok=True)
+        data = {
+            "version": self._version,
+            "names": {str(i): name for i, name in sorted(self._names.items())}
+        }
+        
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{self.FILENAME}.", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._signature = self._file_signature()
+    
+    @property
+    def version(self) -> int:
+        """Rename counter; frames decoded under another version are stale"""
+        with self._lock:
+            self._refresh()
+            return self._version
+    
+    def names(self) -> Dict[int, str]:
+        """ID -> category name"""
+        with self._lock:
+            self._refresh()
+            return dict(self._names)
+    
+    def ids_for(self, names: Iterable[str]) -> List[int]:
+        """IDs of category names, assigning new IDs with a single write"""
+        names = list(names)
+        with self._lock:
+            self._refresh()
+            missing = [name for name in dict.fromkeys(names) if name not in self._ids]
+            if missing:
+                next_id = max(self._names, default=0) + 1
+                for offset, name in enumerate(missing):
+                    self._names[next_id + offset] = name
+                self._index()
+                self._save()
+            return [self._ids[name] for name in names]
+    
+    def ids_of(self, names: Iterable[str]) -> List[int]:
+        """Every ID that decodes to one of the names; nothing is assigned"""
+        wanted = set(names)
+        with self._lock:
+            self._refresh()
+            return sorted(i for i, name in self._names.items() if name in wanted)
+    
+    def rename(self, renames: Dict[str, str]) -> int:
+        """
+        Rename categories in one write, returning how many IDs changed.
+        
+        Renames apply simultaneously, so names can be swapped.
+        """
+        with self._lock:
+            self._refresh()
+            changed = {
+                category_id: renames[name]
+                for category_id, name in self._names.items()
+                if name in renames and renames[name] != name
+            }
+            if changed:
+                self._names.update(changed)
+                self._version += 1
+                self._index()
+                self._save()
+            return len(changed)
+    
+    # --------
+    # Encoding
+    # --------
+    def encode(self, categories: pd.Series) -> pd.arrays.IntegerArray:
+        """Category IDs of a column of names; missing names stay missing"""
+        codes, uniques = pd.factorize(categories)
+        ids = np.append(np.asarray(self.ids_for(uniques), dtype='int64'), 0)
+        return pd.arrays.IntegerArray(ids[codes], codes < 0)
+    
+    def decode(self, ids) -> pd.Categorical:
+        """
+        Categorical names of a column of IDs. The categories are the sorted
+        names of the whole dictionary; unknown IDs decode as missing.
+        """
+        with self._lock:
+            self._refresh()
+            if self._decoder is None:
+                categories = pd.Index(sorted(set(self._names.values())), dtype=object)
+                # The last slot catches missing and unknown IDs
+                lookup = np.full(max(self._names, default=0) + 2, -1, dtype='int64')
+                for category_id, name in self._names.items():
+                    lookup[category_id] = categories.get_loc(name)
+                self._decoder = (categories, lookup)
+            categories, lookup = self._decoder
+        
+        values = pd.array(ids, dtype='Int64').to_numpy(dtype='int64', na_value=-1)
+        values[(values < 0) | (values >= len(lookup))] = len(lookup) - 1
+        return pd.Categorical.from_codes(lookup[values], categories=categories)
+    
+    def encode_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Copy of a frame with its Category column replaced by Category ID"""
+        encoded = df.copy(deep=False)
+        encoded.insert(
+            df.columns.get_loc('Category'),
+            ID_COLUMN,
+            self.encode(encoded.pop('Category'))
+        )
+        return encoded
+    
+    def decode_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Frame with a Category ID column replaced by categorical names.
+        
+        Frames written before encoding keep their names; categorical ones
+        get sorted categories so they order like strings.
+        """
+        if ID_COLUMN in df.columns:
+            df.insert(df.columns.get_loc(ID_COLUMN), 'Category', self.decode(df.pop(ID_COLUMN)))
+        elif 'Category' in df.columns and isinstance(df['Category'].dtype, pd.CategoricalDtype):
+            df['Category'] = df['Category'].cat.reorder_categories(sorted(df['Category'].cat.categories))
+        return df
+
+
+# --------------------------------
+# Process-wide dictionary instance
+# --------------------------------
+category_dictionary = CategoryDictionary()
@@ -0,0 +1,130 @@
+"""
+Core Business Logic - Concurrency Control
+"""
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Iterable, Iterator, Tuple, TypeVar
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class ReadWriteLock:
+    """
+    asyncio lock allowing many readers or a single writer.
+    
+    A waiting writer blocks new readers so writes are not starved.
+    """
+    
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+    
+    @asynccontextmanager
+    async def read(self):
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: not self._writer and not self._waiting_writers
+            )
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+    
+    @asynccontextmanager
+    async def write(self):
+        async with self._condition:
+            self._waiting_writers += 1
+            try:
+                await self._condition.wait_for(
+                    lambda: not self._writer and not self._readers
+                )
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class PiggyBankLocks:
+    """
+    One read-write lock per piggy bank.
+    
+    Writers load, modify and persist a year as one critical section, so two
+    concurrent writes to the same piggy bank can no longer overwrite each
+    other. Different piggy banks never wait on each other.
+    """
+    
+    def __init__(self):
+        self._locks: Dict[Tuple[str, str], ReadWriteLock] = {}
+    
+    def _lock(self, account_name: str, piggy_bank_name: str) -> ReadWriteLock:
+        key = (account_name, piggy_bank_name)
+        if key not in self._locks:
+            self._locks[key] = ReadWriteLock()
+        return self._locks[key]
+    
+    def read(self, account_name: str, piggy_bank_name: str):
+        """Shared access for routes that only read"""
+        return self._lock(account_name, piggy_bank_name).read()
+    
+    def write(self, account_name: str, piggy_bank_name: str):
+        """Exclusive access for routes that persist changes"""
+        return self._lock(account_name, piggy_bank_name).write()
+
+
+# Bounded pool for blocking pandas and storage calls made from async routes
+storage_executor = ThreadPoolExecutor(
+    max_workers=settings.STORAGE_IO_WORKERS,
+    thread_name_prefix="storage-io"
+)
+
+# Year partitions read in parallel on behalf of a call that may itself be
+# running on the storage pool; a separate pool so it never waits on itself
+partition_executor = ThreadPoolExecutor(
+    max_workers=settings.STORAGE_IO_WORKERS,
+    thread_name_prefix="partition-read"
+)
+
+piggy_bank_locks = PiggyBankLocks()
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking call on the storage pool without stalling the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        storage_executor,
+        functools.partial(func, *args, **kwargs)
+    )
+
+
+def ordered_map(
+    func: Callable[..., T],
+    items: Iterable,
+    window: int = settings.STORAGE_IO_WORKERS
+) -> Iterator[T]:
+    """
+    Yield func(item) in input order, running up to `window` calls ahead on
+    the partition pool so at most that many results are held at once
+    """
+    pending = deque()
+    for item in items:
+        pending.append(partition_executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    
+    while pending:
+        yield pending.popleft().result()
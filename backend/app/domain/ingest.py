@@ -0,0 +1,161 @@
+"""
+Core Business Logic - Bulk Transaction Ingest
+"""
+import io
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+from app.domain.transactions import TransactionManager
+
+
+REQUIRED_FIELDS = ['date', 'amount', 'category']
+MAX_REPORTED_ERRORS = 100
+
+
+def read_json_array(payload: bytes) -> pd.DataFrame:
+    """Parse a JSON array of transaction objects"""
+    records = json.loads(payload or b"[]")
+    
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise ValueError("Expected a JSON array of transaction objects.")
+    
+    if not records:
+        return pd.DataFrame(columns=REQUIRED_FIELDS)
+    
+    return pd.DataFrame.from_records(records)
+
+
+def read_ndjson(payload: bytes) -> pd.DataFrame:
+    """Parse newline-delimited JSON, one transaction object per line"""
+    if not payload.strip():
+        return pd.DataFrame(columns=REQUIRED_FIELDS)
+    
+    return pd.read_json(
+        io.BytesIO(payload),
+        lines=True,
+        dtype=False,
+        convert_dates=False
+    )
+
+
+def read_csv(payload: bytes) -> pd.DataFrame:
+    """
+    Parse an uploaded CSV, either in API field names or in the
+    {year}_transactions.csv export layout
+    """
+    return pd.read_csv(
+        io.BytesIO(payload),
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8-sig'
+    )
+
+
+def validate_batch(raw: pd.DataFrame) -> Tuple[pd.DataFrame, List[Dict]]:
+    """
+    Validate and convert a raw batch column by column.
+    
+    Returns a frame with Date, Amount, Category and Description columns
+    plus a list of per-row errors; the frame is only meaningful when the
+    error list is empty.
+    """
+    df = raw.rename(columns=lambda c: str(c).strip().lower())
+    
+    missing = [c for c in REQUIRED_FIELDS if c not in df.columns]
+    if missing:
+        return pd.DataFrame(), [{
+            "row": None,
+            "error": f"Missing field(s): {', '.join(missing)}"
+        }]
+    
+    dates = _parse_dates(df['date'])
+    amounts = pd.to_numeric(df['amount'], errors='coerce').astype('float64')
+    categories = df['category'].astype('string').str.strip()
+    
+    if 'description' in df.columns:
+        descriptions = df['description'].fillna('').astype(str)
+    else:
+        descriptions = pd.Series('', index=df.index)
+    
+    bad_date = dates.isna().to_numpy()
+    bad_amount = ~np.isfinite(amounts.to_numpy())
+    bad_category = categories.fillna('').eq('').to_numpy()
+    
+    errors = []
+    for row in np.flatnonzero(bad_date | bad_amount | bad_category):
+        problems = []
+        if bad_date[row]:
+            problems.append(f"invalid date {df['date'].iat[row]!r}")
+        if bad_amount[row]:
+            problems.append(f"invalid amount {df['amount'].iat[row]!r}")
+        if bad_category[row]:
+            problems.append("category cannot be empty")
+        errors.append({"row": int(row), "error": "; ".join(problems)})
+    
+    clean = pd.DataFrame({
+        'Date': dates,
+        'Amount': amounts,
+        'Category': categories.astype(object),
+        'Description': descriptions
+    })
+    
+    return clean, errors
+
+
+def ingest_transactions(
+    account_name: str,
+    piggy_bank_name: str,
+    raw: pd.DataFrame
+) -> Dict:
+    """
+    Validate a batch and write it to the matching year files.
+    
+    The batch is all-or-nothing: any invalid row rejects the whole batch.
+    Each touched year is loaded, merged and persisted exactly once.
+    """
+    clean, errors = validate_batch(raw)
+    
+    if errors:
+        return {
+            "success": False,
+            "error": f"{len(errors)} invalid row(s); nothing was written.",
+            "rejected": len(errors),
+            "errors": errors[:MAX_REPORTED_ERRORS]
+        }
+    
+    years = {}
+    for year, rows in clean.groupby(clean['Date'].dt.year, sort=True):
+        year = int(year)
+        
+        tm = TransactionManager(account_name, piggy_bank_name)
+        tm.load(year)
+        tm.add_transactions(rows)
+        saved = tm.flush(year)
+        
+        years[year] = {
+            "inserted": len(rows),
+            "count": saved["count"],
+            "balance": tm.current_balance
+        }
+    
+    return {
+        "success": True,
+        "inserted": len(clean),
+        "years": years
+    }
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Vectorized date parsing; rows that do not share the inferred format
+    are retried individually
+    """
+    text = values.astype(str).str.strip()
+    parsed = pd.to_datetime(text, errors='coerce')
+    
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(text[retry], errors='coerce', format='mixed')
+    
+    return parsed
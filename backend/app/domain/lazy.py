@@ -0,0 +1,51 @@
+"""
+Core Business Logic - Deferred Imports
+"""
+import importlib
+
+_UNSET = object()
+
+
+class LazyImport:
+    """
+    Stand-in for a module, or a name defined in one, that is imported the
+    first time it is called or one of its attributes is read.
+    
+    Routers hold their domain classes through these so importing the app
+    does not import pandas; the first request that needs them pays for it.
+    """
+    
+    __slots__ = ("_module_name", "_attribute", "_target")
+    
+    def __init__(self, module_name: str, attribute: str = None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = _UNSET
+    
+    def _resolve(self):
+        if self._target is _UNSET:
+            # The import system serializes concurrent first imports
+            module = importlib.import_module(self._module_name)
+            self._target = module if self._attribute is None else getattr(module, self._attribute)
+        return self._target
+    
+    def __getattr__(self, name: str):
+        return getattr(self._resolve(), name)
+    
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+    
+    def __repr__(self) -> str:
+        name = self._module_name if self._attribute is None else f"{self._module_name}.{self._attribute}"
+        state = "loaded" if self._target is not _UNSET else "not loaded"
+        return f"<lazy {name} ({state})>"
+
+
+def lazy_import(module_name: str, attribute: str = None) -> LazyImport:
+    """
+    Module, or the named attribute of it, imported on first use:
+        
+        pd = lazy_import("pandas")
+        TransactionManager = lazy_import("app.domain.transactions", "TransactionManager")
+    """
+    return LazyImport(module_name, attribute)
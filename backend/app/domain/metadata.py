@@ -0,0 +1,107 @@
+"""
+Core Business Logic - Piggy Bank Metadata
+"""
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+
+
+class PiggyBankMeta:
+    """
+    Per-piggy-bank metadata stored next to the year files.
+    
+    Keeps a snapshot per year (opening balance, net amount, row count and
+    highest transaction ID) so balances can be carried across years
+    without loading earlier year files, and a data version that increases
+    with every write.
+    """
+    
+    FILENAME = "meta.json"
+    
+    def __init__(self, base_path: str):
+        self.path = os.path.join(base_path, self.FILENAME)
+        self.data = self._read()
+    
+    def _read(self) -> dict:
+        """Read the metadata file, starting fresh if it is missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        
+        if not isinstance(data.get("years"), dict):
+            data["years"] = {}
+        return data
+    
+    def save(self) -> None:
+        """Write the metadata file atomically"""
+        folder = os.path.dirname(self.path)
+        os.makedirs(folder, exist_ok=True)
+        
+        # Unique temp name: concurrent readers may backfill snapshots too
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{self.FILENAME}.", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+    
+    @property
+    def version(self) -> int:
+        """Data version, incremented every time a year is recorded"""
+        return int(self.data.get("version", 0))
+    
+    @property
+    def years(self) -> Dict[int, dict]:
+        """Year -> snapshot, in year order"""
+        return {int(y): s for y, s in sorted(self.data["years"].items(), key=lambda i: int(i[0]))}
+    
+    def year(self, year: int) -> Optional[dict]:
+        """Snapshot for a year, or None if it has not been recorded"""
+        return self.data["years"].get(str(year))
+    
+    def opening_balance(self, year: int) -> float:
+        """Balance carried into a year from all earlier years"""
+        snapshot = self.year(year)
+        if snapshot is not None:
+            return snapshot["opening_balance"]
+        return sum(s["net"] for y, s in self.years.items() if y < year)
+    
+    def closing_balance(self) -> float:
+        """Balance after the last recorded year"""
+        return sum(s["net"] for s in self.years.values())
+    
+    def next_id(self) -> int:
+        """Next transaction ID that is unused across every year"""
+        return max((s["max_id"] for s in self.years.values()), default=0) + 1
+    
+    def record_year(
+        self,
+        year: int,
+        net: float,
+        count: int,
+        max_id: int,
+        save: bool = True
+    ) -> None:
+        """
+        Store a year's snapshot and carry its net into later years.
+        
+        Only the opening balances from this year onward are touched.
+        """
+        self.data["version"] = self.version + 1
+        self.data["years"][str(year)] = {
+            "opening_balance": 0.0,
+            "net": float(net),
+            "count": int(count),
+            "max_id": int(max_id)
+        }
+        
+        opening = float(sum(s["net"] for y, s in self.years.items() if y < year))
+        for y, snapshot in self.years.items():
+            if y < year:
+                continue
+            snapshot["opening_balance"] = opening
+            opening += snapshot["net"]
+        
+        if save:
+            self.save()
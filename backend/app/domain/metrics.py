@@ -0,0 +1,263 @@
+"""
+Core Business Logic - Metrics
+"""
+import math
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+# Seconds; request latencies
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Seconds; in-process work such as storage calls and balance refreshes
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """A named family of samples keyed by label values"""
+    
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+    
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """(sample name, formatted labels, value) rows"""
+        raise NotImplementedError
+    
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}"
+        ]
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples())
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing total"""
+    
+    kind = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+    
+    def samples(self):
+        with self._lock:
+            return [
+                (self.name, _format_labels(self.labelnames, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Gauge(Counter):
+    """Value that goes up and down"""
+    
+    kind = "gauge"
+    
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+    
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """
+    Observations counted into cumulative buckets, with their sum and
+    count, so quantiles such as p99 can be estimated per label set
+    """
+    
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> [per-bucket counts, sum]
+        self._values: Dict[LabelValues, list] = {}
+    
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+    
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[0]) if state else 0
+    
+    def samples(self):
+        rows = []
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                    rows.append((f"{self.name}_bucket", labels, cumulative))
+                labels = _format_labels(self.labelnames, key)
+                rows.append((f"{self.name}_sum", labels, total))
+                rows.append((f"{self.name}_count", labels, cumulative))
+        return rows
+
+
+class Registry:
+    """
+    Process-wide metrics rendered in the Prometheus text format.
+    
+    Caches are registered by name and read when metrics are rendered, so
+    their own hit and miss counters stay the single source of truth.
+    """
+    
+    def __init__(self, prefix: str = "bookkeeping_"):
+        self.prefix = prefix
+        self._metrics: Dict[str, Metric] = {}
+        self._caches: Dict[str, object] = {}
+        self._lock = threading.Lock()
+    
+    def _add(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(self.prefix + name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(self.prefix + name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS
+    ) -> Histogram:
+        return self._add(Histogram(self.prefix + name, documentation, labelnames, buckets))
+    
+    def register_cache(self, name: str, cache) -> None:
+        """Report a cache's hits and misses attributes under the given name"""
+        with self._lock:
+            self._caches[name] = cache
+    
+    def _cache_metrics(self) -> List[Metric]:
+        hits = Counter(self.prefix + "cache_hits_total", "Cache lookups served from memory", ("cache",))
+        misses = Counter(self.prefix + "cache_misses_total", "Cache lookups that went to storage", ("cache",))
+        with self._lock:
+            caches = sorted(self._caches.items())
+        for name, cache in caches:
+            hits.inc(cache.hits, cache=name)
+            misses.inc(cache.misses, cache=name)
+        return [hits, misses]
+    
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics + self._cache_metrics():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# ---------------------
+# Process-wide registry
+# ---------------------
+registry = Registry()
+
+# ----
+# HTTP
+# ----
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "HTTP requests handled",
+    ("method", "route", "status")
+)
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from request start until the last response byte was sent",
+    ("method", "route", "account", "piggy_bank")
+)
+HTTP_IN_PROGRESS = registry.gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled"
+)
+HTTP_RESPONSE_BYTES = registry.counter(
+    "http_response_bytes_total",
+    "Response body bytes sent",
+    ("method", "route")
+)
+
+# -------
+# Storage
+# -------
+STORAGE_SECONDS = registry.histogram(
+    "storage_operation_duration_seconds",
+    "Time spent reading, writing and appending year files",
+    ("operation", "format", "account", "piggy_bank"),
+    buckets=FAST_BUCKETS
+)
+STORAGE_ROWS_READ = registry.counter(
+    "storage_rows_read_total",
+    "Rows read from year files",
+    ("format", "account", "piggy_bank")
+)
+STORAGE_ROWS_WRITTEN = registry.counter(
+    "storage_rows_written_total",
+    "Rows written or appended to year files",
+    ("format", "account", "piggy_bank")
+)
+BALANCE_SECONDS = registry.histogram(
+    "balance_recompute_duration_seconds",
+    "Time spent recomputing running balances",
+    ("account", "piggy_bank"),
+    buckets=FAST_BUCKETS
+)
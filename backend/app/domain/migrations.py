@@ -0,0 +1,178 @@
+"""
+Core Business Logic - Data Migrations
+"""
+import glob
+import os
+import re
+import time
+from typing import Dict, Iterator, Tuple
+from app.config import settings
+from app.domain.storage import STORAGE_FORMATS, get_storage
+from app.domain.transactions import TransactionManager
+
+
+def iter_year_files(storage_format: str) -> Iterator[Tuple[str, str, int, str]]:
+    """
+    Yield (account, piggy bank, year, filepath) for every year file stored
+    in the given format under USER_DATA_DIR
+    """
+    extension = get_storage(storage_format).extension
+    pattern = os.path.join(
+        settings.USER_DATA_DIR,
+        "*",
+        "piggy_banks",
+        "*",
+        extension,
+        f"*_transactions.{extension}"
+    )
+    
+    for filepath in sorted(glob.glob(pattern)):
+        m = re.match(r"(\d{4})_transactions\." + extension + "$", os.path.basename(filepath))
+        if not m:
+            continue
+        
+        piggy_bank_path = os.path.dirname(os.path.dirname(filepath))
+        account_path = os.path.dirname(os.path.dirname(piggy_bank_path))
+        yield (
+            os.path.basename(account_path),
+            os.path.basename(piggy_bank_path),
+            int(m.group(1)),
+            filepath
+        )
+
+
+def convert_storage(
+    target_format: str,
+    source_format: str = 'csv',
+    remove_source: bool = False
+) -> Dict:
+    """
+    Convert every year file under USER_DATA_DIR to another storage format.
+    
+    Tombstones are applied during the conversion, so the written files are
+    compacted. Source files are kept unless remove_source is set.
+    """
+    if get_storage(target_format) is get_storage(source_format):
+        return {
+            "success": False,
+            "error": "Source and target formats are the same."
+        }
+    
+    converted = []
+    started = time.perf_counter()
+    
+    for account, piggy_bank, year, source_path in iter_year_files(source_format):
+        reader = TransactionManager(account, piggy_bank, storage_format=source_format)
+        reader.load(year)
+        
+        writer = TransactionManager(account, piggy_bank, storage_format=target_format)
+        writer.adopt(reader)
+        saved = writer.save(year)
+        
+        converted.append({
+            "account": account,
+            "piggy_bank": piggy_bank,
+            "year": year,
+            "rows": saved["count"],
+            "source_bytes": os.path.getsize(source_path),
+            "target_bytes": os.path.getsize(saved["filepath"])
+        })
+        
+        if remove_source:
+            os.remove(source_path)
+    
+    return {
+        "success": True,
+        "files": converted,
+        "count": len(converted),
+        "source_bytes": sum(f["source_bytes"] for f in converted),
+        "target_bytes": sum(f["target_bytes"] for f in converted),
+        "seconds": round(time.perf_counter() - started, 3)
+    }
+
+
+def rebuild_rollups(
+    account_name: str = None,
+    piggy_bank_name: str = None,
+    storage_format: str = None
+) -> Dict:
+    """
+    Rebuild monthly rollups from the stored transactions, optionally
+    limited to one account or piggy bank
+    """
+    rebuilt = {}
+    started = time.perf_counter()
+    
+    for account, piggy_bank, year, filepath in iter_year_files(get_storage(storage_format).name):
+        if account_name and account != account_name:
+            continue
+        if piggy_bank_name and piggy_bank != piggy_bank_name:
+            continue
+        
+        tm = TransactionManager(account, piggy_bank, storage_format=storage_format)
+        tm.load(year)
+        tm.rollups.replace_year(year, tm.transactions_df, tm._signature(filepath))
+        tm.rollups.save()
+        
+        rebuilt.setdefault(f"{account}/{piggy_bank}", []).append(year)
+    
+    return {
+        "success": True,
+        "piggy_banks": rebuilt,
+        "years": sum(len(years) for years in rebuilt.values()),
+        "seconds": round(time.perf_counter() - started, 3)
+    }
+
+
+def encode_categories(storage_format: str = None) -> Dict:
+    """
+    Rewrite year files that still store category names so they store IDs
+    from the category dictionary, for one storage format or every format
+    that encodes categories.
+    
+    Rows, tombstones and stored balances are written back unchanged.
+    """
+    formats = (
+        [get_storage(storage_format)] if storage_format
+        else [s for s in STORAGE_FORMATS.values() if s.encodes_categories]
+    )
+    unsupported = [s.name for s in formats if not s.encodes_categories]
+    if unsupported:
+        return {
+            "success": False,
+            "error": f"{unsupported[0]} storage does not encode categories."
+        }
+    
+    encoded = []
+    skipped = 0
+    started = time.perf_counter()
+    
+    for storage in formats:
+        for account, piggy_bank, year, filepath in iter_year_files(storage.name):
+            if storage.category_encoded(filepath):
+                skipped += 1
+                continue
+            
+            source_bytes = os.path.getsize(filepath)
+            df = storage.read(filepath)
+            storage.write(filepath, df, fsync=settings.TRANSACTION_FSYNC)
+            
+            encoded.append({
+                "account": account,
+                "piggy_bank": piggy_bank,
+                "year": year,
+                "format": storage.name,
+                "rows": len(df),
+                "source_bytes": source_bytes,
+                "target_bytes": os.path.getsize(filepath)
+            })
+    
+    return {
+        "success": True,
+        "files": encoded,
+        "count": len(encoded),
+        "skipped": skipped,
+        "source_bytes": sum(f["source_bytes"] for f in encoded),
+        "target_bytes": sum(f["target_bytes"] for f in encoded),
+        "seconds": round(time.perf_counter() - started, 3)
+    }
@@ -0,0 +1,76 @@
+"""
+Core Business Logic - Transaction Pagination and Serialization
+"""
+import base64
+import json
+from typing import Iterator, List, Optional, Tuple
+import pandas as pd
+from app.config import settings
+from app.domain.balances import sorted_position
+
+# Rows serialized per chunk when streaming
+STREAM_CHUNK_SIZE = 1000
+MAX_PAGE_SIZE = settings.MAX_PAGE_SIZE
+
+
+def encode_cursor(date, transaction_id: int) -> str:
+    """Opaque cursor pointing just after the (Date, Transaction ID) key"""
+    payload = json.dumps([pd.Timestamp(date).isoformat(), int(transaction_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[pd.Timestamp, int]:
+    """Decode a cursor; raises ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date, transaction_id = json.loads(base64.urlsafe_b64decode(padded))
+        return pd.Timestamp(date), int(transaction_id)
+    except (TypeError, ValueError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def paginate(
+    df: pd.DataFrame,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Tuple[pd.DataFrame, Optional[str]]:
+    """
+    Keyset page of a frame sorted by (Date, Transaction ID).
+    
+    The page starts right after the cursor key, found by binary search, so
+    later pages cost the same as the first. Returns the page and the
+    cursor for the next one (None on the last page).
+    """
+    start = 0
+    if cursor:
+        date, transaction_id = decode_cursor(cursor)
+        start = sorted_position(df, date, transaction_id + 1)
+    
+    if limit is None:
+        return df.iloc[start:], None
+    
+    page = df.iloc[start:start + limit]
+    if start + limit >= len(df) or page.empty:
+        return page, None
+    
+    last = page.iloc[-1]
+    return page, encode_cursor(last['Date'], last['Transaction ID'])
+
+
+def _with_iso_dates(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of a frame with Date formatted as ISO strings, vectorized"""
+    out = df.copy()
+    out['Date'] = out['Date'].dt.strftime('%Y-%m-%dT%H:%M:%S')
+    return out
+
+
+def serialize_records(df: pd.DataFrame) -> List[dict]:
+    """Rows as JSON-ready dicts"""
+    return _with_iso_dates(df).to_dict('records')
+
+
+def iter_ndjson(df: pd.DataFrame, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Serialize rows as newline-delimited JSON, one chunk at a time"""
+    for i in range(0, len(df), chunk_size):
+        chunk = _with_iso_dates(df.iloc[i:i + chunk_size])
+        yield chunk.to_json(orient='records', lines=True, force_ascii=False).encode('utf-8')
@@ -0,0 +1,128 @@
+"""
+Core Business Logic - Category Prefix Sums
+"""
+import numpy as np
+import pandas as pd
+from typing import List
+
+# Column slots per category: expenses, zero amounts, income
+SIGNS = 3
+
+
+def _cumulative(per_day: np.ndarray) -> np.ndarray:
+    """Prefix sums over days with a leading zero row"""
+    out = np.zeros((per_day.shape[0] + 1, per_day.shape[1]), dtype=per_day.dtype)
+    np.cumsum(per_day, axis=0, out=out[1:])
+    return out
+
+
+class CategoryPrefixSums:
+    """
+    Per-day x per-(category, sign) cumulative sums and counts of a frame.
+    
+    Row i holds the totals of every day before days[i], so the breakdown of
+    any date range is two binary searches and one row subtraction,
+    independent of how many transactions fall inside it. Adds and deletes
+    update the rows from their day onward in place.
+    """
+    
+    def __init__(self, days: np.ndarray, categories: List[str], sums: np.ndarray, counts: np.ndarray):
+        self.days = days
+        self.categories = categories
+        self.sums = sums
+        self.counts = counts
+        self._codes = {category: code for code, category in enumerate(categories)}
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "CategoryPrefixSums":
+        """Build the matrices from a transactions frame in one pass"""
+        if df.empty:
+            return cls(
+                np.array([], dtype='datetime64[D]'),
+                [],
+                np.zeros((1, 0), dtype='float64'),
+                np.zeros((1, 0), dtype='int64')
+            )
+        
+        days, day_index = np.unique(
+            df['Date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]'),
+            return_inverse=True
+        )
+        codes, categories = pd.factorize(df['Category'], use_na_sentinel=False)
+        amounts = df['Amount'].to_numpy(dtype='float64')
+        signs = np.sign(amounts).astype('int64') + 1
+        
+        n_columns = SIGNS * len(categories)
+        keys = day_index * n_columns + codes * SIGNS + signs
+        size = len(days) * n_columns
+        
+        sums = np.bincount(keys, weights=amounts, minlength=size).reshape(len(days), n_columns)
+        counts = np.bincount(keys, minlength=size).reshape(len(days), n_columns)
+        return cls(days, list(categories), _cumulative(sums), _cumulative(counts))
+    
+    @property
+    def nbytes(self) -> int:
+        return int(self.days.nbytes + self.sums.nbytes + self.counts.nbytes)
+    
+    def copy(self) -> "CategoryPrefixSums":
+        return CategoryPrefixSums(
+            self.days.copy(),
+            list(self.categories),
+            self.sums.copy(),
+            self.counts.copy()
+        )
+    
+    def add(self, date, category: str, amount: float) -> None:
+        """Account for one new transaction"""
+        self._update(date, category, int(np.sign(amount)), amount, 1)
+    
+    def remove(self, date, category: str, amount: float) -> None:
+        """Account for one deleted transaction"""
+        self._update(date, category, int(np.sign(amount)), -amount, -1)
+    
+    def _update(self, date, category: str, sign: int, amount: float, count: int) -> None:
+        code = self._codes.get(category)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(category)
+            self._codes[category] = code
+            self.sums = np.hstack([self.sums, np.zeros((len(self.sums), SIGNS), dtype=self.sums.dtype)])
+            self.counts = np.hstack([self.counts, np.zeros((len(self.counts), SIGNS), dtype=self.counts.dtype)])
+        
+        day = np.datetime64(pd.Timestamp(date), 'D')
+        position = int(np.searchsorted(self.days, day))
+        if position == len(self.days) or self.days[position] != day:
+            # A new day starts with the totals of the days before it
+            self.days = np.insert(self.days, position, day)
+            self.sums = np.insert(self.sums, position + 1, self.sums[position], axis=0)
+            self.counts = np.insert(self.counts, position + 1, self.counts[position], axis=0)
+        
+        column = code * SIGNS + sign + 1
+        self.sums[position + 1:, column] += amount
+        self.counts[position + 1:, column] += count
+    
+    def cells(self, start_date=None, end_date=None) -> pd.DataFrame:
+        """
+        (category, sign, sum, count) cells of the days between two dates
+        (inclusive), in the same layout as aggregate() without the month
+        """
+        first = 0
+        if start_date:
+            first = int(np.searchsorted(self.days, np.datetime64(pd.Timestamp(start_date), 'D'), side='left'))
+        
+        last = len(self.days)
+        if end_date:
+            last = int(np.searchsorted(self.days, np.datetime64(pd.Timestamp(end_date), 'D'), side='right'))
+        last = max(first, last)
+        
+        sums = self.sums[last] - self.sums[first]
+        counts = self.counts[last] - self.counts[first]
+        columns = np.flatnonzero(counts)
+        codes, signs = np.divmod(columns, SIGNS)
+        
+        return pd.DataFrame({
+            'category': np.asarray(self.categories, dtype=object)[codes],
+            'sign': signs - 1,
+            'sum': sums[columns],
+            'count': counts[columns]
+        })
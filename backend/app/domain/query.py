@@ -0,0 +1,148 @@
+"""
+Core Business Logic - Transaction Queries
+"""
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import List, Optional
+from app.domain.category_dictionary import ID_COLUMN
+
+# Sort keys -> frame columns; the ID breaks ties so results are stable
+SORT_KEYS = {
+    'date': ['Date', 'Transaction ID'],
+    'amount': ['Amount', 'Transaction ID'],
+    'category': ['Category', 'Date', 'Transaction ID'],
+    'id': ['Transaction ID']
+}
+SIGNS = ('income', 'expense')
+
+
+@dataclass
+class TransactionQuery:
+    """
+    Row filters, sort order and limit for a transaction search.
+    
+    The same query is evaluated in memory against cached frames, turned
+    into a pyarrow expression for columnar files and into SQL for the
+    database, so each storage format only materializes matching rows.
+    Categories match exactly; the description matches as a
+    case-insensitive substring. Sort by a key from SORT_KEYS, prefixed
+    with '-' for descending order.
+    """
+    
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    categories: List[str] = field(default_factory=list)
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    sign: Optional[str] = None
+    description: Optional[str] = None
+    sort: str = 'date'
+    limit: Optional[int] = None
+    
+    def __post_init__(self):
+        if self.sort_key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort '{self.sort}'. Choose from: {', '.join(SORT_KEYS)}")
+        if self.sign is not None and self.sign not in SIGNS:
+            raise ValueError(f"Unknown sign '{self.sign}'. Choose from: {', '.join(SIGNS)}")
+        if self.limit is not None and self.limit < 1:
+            raise ValueError("Limit must be positive")
+        
+        # Raises ValueError on unparseable dates
+        self.start = pd.to_datetime(self.start_date) if self.start_date else None
+        self.end = pd.to_datetime(self.end_date) if self.end_date else None
+    
+    @property
+    def sort_key(self) -> str:
+        return self.sort.lstrip('-')
+    
+    @property
+    def descending(self) -> bool:
+        return self.sort.startswith('-')
+    
+    @property
+    def sort_columns(self) -> List[str]:
+        return SORT_KEYS[self.sort_key]
+    
+    # ---------
+    # In memory
+    # ---------
+    def mask(self, df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask of the rows matching every filter"""
+        keep = np.ones(len(df), dtype=bool)
+        if df.empty:
+            return keep
+        
+        if self.start is not None or self.end is not None:
+            dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+            if self.start is not None:
+                keep &= dates >= np.datetime64(self.start, 'ns')
+            if self.end is not None:
+                keep &= dates <= np.datetime64(self.end, 'ns')
+        
+        amounts = df['Amount'].to_numpy(dtype='float64')
+        if self.min_amount is not None:
+            keep &= amounts >= self.min_amount
+        if self.max_amount is not None:
+            keep &= amounts <= self.max_amount
+        if self.sign == 'income':
+            keep &= amounts > 0
+        elif self.sign == 'expense':
+            keep &= amounts < 0
+        
+        if self.categories:
+            keep &= df['Category'].isin(self.categories).to_numpy()
+        if self.description:
+            keep &= df['Description'].str.contains(self.description, case=False, regex=False, na=False).to_numpy()
+        
+        return keep
+    
+    def order(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Sort matching rows and apply the limit"""
+        if not (self.sort_key == 'date' and not self.descending):
+            df = df.sort_values(by=self.sort_columns, ascending=not self.descending, kind='stable')
+        if self.limit is not None:
+            df = df.iloc[:self.limit]
+        return df.reset_index(drop=True)
+    
+    # --------
+    # Pushdown
+    # --------
+    def arrow_filter(self, category_ids: Optional[List[int]] = None):
+        """
+        pyarrow dataset expression for the filters, or None without any.
+        
+        Files storing category IDs are filtered on the IDs the categories
+        decode from. Tombstone records (null Amount) always pass so deletes
+        can still be applied to the rows that were read.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        terms = []
+        if self.start is not None:
+            terms.append(pc.field('Date') >= pa.scalar(self.start.to_datetime64()))
+        if self.end is not None:
+            terms.append(pc.field('Date') <= pa.scalar(self.end.to_datetime64()))
+        if self.min_amount is not None:
+            terms.append(pc.field('Amount') >= self.min_amount)
+        if self.max_amount is not None:
+            terms.append(pc.field('Amount') <= self.max_amount)
+        if self.sign == 'income':
+            terms.append(pc.field('Amount') > 0)
+        elif self.sign == 'expense':
+            terms.append(pc.field('Amount') < 0)
+        if self.categories and category_ids is not None:
+            terms.append(pc.field(ID_COLUMN).isin(category_ids))
+        elif self.categories:
+            terms.append(pc.field('Category').isin(self.categories))
+        if self.description:
+            terms.append(pc.match_substring(pc.field('Description'), self.description, ignore_case=True))
+        
+        if not terms:
+            return None
+        
+        expression = terms[0]
+        for term in terms[1:]:
+            expression = expression & term
+        return expression | pc.field('Amount').is_null()
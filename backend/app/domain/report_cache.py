@@ -0,0 +1,95 @@
+"""
+Core Business Logic - Report Result Cache
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+from app.config import settings
+from app.domain.metrics import registry
+
+
+class ReportCache:
+    """
+    Process-wide LRU cache of computed reports.
+    
+    Entries are keyed by (account, piggy bank, endpoint, params, version).
+    A write bumps the piggy bank's data version, so stale reports are
+    never matched again and simply age out of the LRU.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(
+        account_name: str,
+        piggy_bank_name: str,
+        endpoint: str,
+        params: dict,
+        version: Hashable
+    ) -> Tuple:
+        return (
+            account_name,
+            piggy_bank_name,
+            endpoint,
+            tuple(sorted(params.items())),
+            version
+        )
+    
+    @staticmethod
+    def etag(key: Tuple) -> str:
+        """Strong ETag identifying a report at a data version"""
+        digest = hashlib.sha1(json.dumps(key, default=str).encode('utf-8')).hexdigest()
+        return f'"{digest[:20]}"'
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+    
+    def put(self, key: Hashable, result: Any) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+# ---------------------------
+# Process-wide cache instance
+# ---------------------------
+report_cache = ReportCache(settings.REPORT_CACHE_MAX_ENTRIES)
+registry.register_cache("reports", report_cache)
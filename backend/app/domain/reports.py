@@ -2,9 +2,118 @@
 Core Business Logic - Report Generation
 """
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List
-from app.core.transactions import TransactionManager
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.domain.transactions import TransactionManager
+from app.domain.aggregation import by_category, merge_cells, totals
+from app.domain.balances import balance_as_of
+
+
+def monthly_report(cells: pd.DataFrame, opening_balance: float, year: int, month: int) -> Dict:
+    """
+    Monthly report from a year's rollup cells and its opening balance
+    """
+    month_cells = cells[cells['month'] == month]
+    summary = totals(month_cells)
+    
+    # Balance before month: carried into the year plus earlier months
+    balance_before = opening_balance + cells.loc[cells['month'] < month, 'sum'].sum()
+    
+    return {
+        "year": year,
+        "month": month,
+        "period": f"{year}-{month:02d}",
+        "balance_before": float(balance_before),
+        "income": summary["income"],
+        "expenses": summary["expenses"],
+        "net": summary["net"],
+        "balance_after": float(balance_before + summary["net"]),
+        "transaction_count": int(month_cells['count'].sum()),
+        "expense_by_category": by_category(month_cells, -1, exclude=['savings']),
+        "income_by_category": by_category(month_cells, 1)
+    }
+
+
+def yearly_report(cells: pd.DataFrame, opening_balance: float, year: int) -> Dict:
+    """Yearly report from a year's rollup cells and its opening balance"""
+    summary = totals(cells)
+    
+    # Balance before year, carried forward from earlier years
+    balance_before = float(opening_balance)
+    
+    # Monthly summary
+    by_month = cells.groupby(['month', 'sign'])['sum'].sum()
+    monthly_summary = []
+    for month in range(1, 13):
+        monthly_income = by_month.get((month, 1), 0.0)
+        monthly_expenses = by_month.get((month, -1), 0.0)
+        
+        monthly_summary.append({
+            "month": month,
+            "income": float(monthly_income),
+            "expenses": float(monthly_expenses),
+            "net": float(monthly_income + monthly_expenses)
+        })
+    
+    return {
+        "year": year,
+        "balance_before": balance_before,
+        "income": summary["income"],
+        "expenses": summary["expenses"],
+        "net": summary["net"],
+        "balance_after": float(balance_before + summary["net"]),
+        "transaction_count": int(cells['count'].sum()),
+        "expense_by_category": by_category(cells, -1),
+        "income_by_category": by_category(cells, 1),
+        "monthly_summary": monthly_summary
+    }
+
+
+def category_summary(cells: pd.DataFrame, balance_before: float, balance_after: float) -> Dict:
+    """Category summary from aggregated cells and the balances around the range"""
+    summary = totals(cells)
+    
+    return {
+        "balance_before": float(balance_before),
+        "balance_after": float(balance_after),
+        "total_income": summary["income"],
+        "total_expenses": summary["expenses"],
+        "expense_by_category": by_category(cells, -1),
+        "income_by_category": by_category(cells, 1)
+    }
+
+
+def range_balances(tm: TransactionManager, start_date: str = None, end_date: str = None) -> Tuple[float, float]:
+    """
+    Balances before and after a date range of the loaded transactions,
+    by binary search over the date index instead of masking and summing
+    """
+    df = tm.transactions_df
+    before = balance_as_of(df, start_date, tm.opening_balance, inclusive=False) if start_date else tm.opening_balance
+    after = balance_as_of(df, end_date, tm.opening_balance) if end_date else (
+        float(df['Balance'].iat[-1]) if not df.empty else tm.opening_balance
+    )
+    return before, after
+
+
+def range_parts(tm: TransactionManager, start_date: str = None, end_date: str = None) -> Tuple[pd.DataFrame, float, float]:
+    """
+    Cells and surrounding balances of a date range across every year file
+    it overlaps; the years are read in parallel and their cells merged
+    """
+    parts = [
+        (year_tm.category_sums.cells(start_date, end_date), *range_balances(year_tm, start_date, end_date))
+        for year_tm in tm.load_years(start_date, end_date)
+    ]
+    if not parts:
+        # Nothing stored in range: the balance carried over it is unchanged
+        balance = tm.balance_as_of(end_date or start_date)["balance"] if (start_date or end_date) else 0.0
+        return merge_cells([]), balance, balance
+    
+    return (
+        merge_cells(cells for cells, _, _ in parts),
+        parts[0][1],
+        parts[-1][2]
+    )
 
 
 class ReportGenerator:
@@ -17,182 +126,100 @@ class ReportGenerator:
     
     def generate_monthly_report(self, year: int, month: int) -> Dict:
         """
-        Generate monthly financial report
+        Generate monthly financial report from the rollups
         """
-        start = datetime(year, month, 1)
-        end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
-        
-        # Filter transactions for the month
-        month_df = self.tm.transactions_df[
-            (self.tm.transactions_df['Date'] >= start) &
-            (self.tm.transactions_df['Date'] < end)
-        ]
-        
-        # Calculate balance before month
-        balance_before = self.tm.transactions_df[
-            self.tm.transactions_df['Date'] < start
-        ]['Amount'].sum()
-        
-        # Calculate income and expenses
-        income = month_df[month_df['Amount'] > 0]['Amount'].sum()
-        expenses = month_df[month_df['Amount'] < 0]['Amount'].sum()
-        net = income + expenses
-        balance_after = balance_before + net
-        
-        # Expense breakdown by category
-        expense_by_category = {}
-        if not month_df.empty:
-            expense_df = month_df[
-                (month_df['Amount'] < 0) &
-                (month_df['Category'].str.lower() != 'savings')
-            ]
-            if not expense_df.empty:
-                expense_by_category = (
-                    expense_df.groupby('Category')['Amount']
-                    .sum()
-                    .sort_values()
-                    .to_dict()
-                )
-        
-        # Income breakdown by category
-        income_by_category = {}
-        if not month_df.empty:
-            income_df = month_df[month_df['Amount'] > 0]
-            if not income_df.empty:
-                income_by_category = (
-                    income_df.groupby('Category')['Amount']
-                    .sum()
-                    .sort_values(ascending=False)
-                    .to_dict()
-                )
-        
-        return {
-            "year": year,
-            "month": month,
-            "period": f"{year}-{month:02d}",
-            "balance_before": float(balance_before),
-            "income": float(income),
-            "expenses": float(expenses),
-            "net": float(net),
-            "balance_after": float(balance_after),
-            "transaction_count": len(month_df),
-            "expense_by_category": {k: float(v) for k, v in expense_by_category.items()},
-            "income_by_category": {k: float(v) for k, v in income_by_category.items()}
-        }
+        return monthly_report(self.tm.rollups.cells(year), self.tm.opening_balance, year, month)
     
     def generate_yearly_report(self, year: int) -> Dict:
-        """Generate yearly financial report"""
-        start = datetime(year, 1, 1)
-        end = datetime(year + 1, 1, 1)
-        
-        # Filter transactions for the year
-        year_df = self.tm.transactions_df[
-            (self.tm.transactions_df['Date'] >= start) &
-            (self.tm.transactions_df['Date'] < end)
-        ]
-        
-        # Calculate balance before year
-        balance_before = self.tm.transactions_df[
-            self.tm.transactions_df['Date'] < start
-        ]['Amount'].sum()
-        
-        # Calculate income and expenses
-        income = year_df[year_df['Amount'] > 0]['Amount'].sum()
-        expenses = year_df[year_df['Amount'] < 0]['Amount'].sum()
-        net = income + expenses
-        balance_after = balance_before + net
-        
-        # Expense breakdown by category
-        expense_by_category = {}
-        if not year_df.empty:
-            expense_df = year_df[year_df['Amount'] < 0]
-            if not expense_df.empty:
-                expense_by_category = (
-                    expense_df.groupby('Category')['Amount']
-                    .sum()
-                    .sort_values()
-                    .to_dict()
-                )
-        
-        # Income breakdown by category
-        income_by_category = {}
-        if not year_df.empty:
-            income_df = year_df[year_df['Amount'] > 0]
-            if not income_df.empty:
-                income_by_category = (
-                    income_df.groupby('Category')['Amount']
-                    .sum()
-                    .sort_values(ascending=False)
-                    .to_dict()
-                )
-        
-        # Monthly summary
-        monthly_summary = []
-        for month in range(1, 13):
-            month_start = datetime(year, month, 1)
-            month_end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
-            
-            month_df = year_df[
-                (year_df['Date'] >= month_start) &
-                (year_df['Date'] < month_end)
-            ]
-            
-            monthly_income = month_df[month_df['Amount'] > 0]['Amount'].sum()
-            monthly_expenses = month_df[month_df['Amount'] < 0]['Amount'].sum()
-            
-            monthly_summary.append({
-                "month": month,
-                "income": float(monthly_income),
-                "expenses": float(monthly_expenses),
-                "net": float(monthly_income + monthly_expenses)
-            })
-        
-        return {
-            "year": year,
-            "balance_before": float(balance_before),
-            "income": float(income),
-            "expenses": float(expenses),
-            "net": float(net),
-            "balance_after": float(balance_after),
-            "transaction_count": len(year_df),
-            "expense_by_category": {k: float(v) for k, v in expense_by_category.items()},
-            "income_by_category": {k: float(v) for k, v in income_by_category.items()},
-            "monthly_summary": monthly_summary
-        }
+        """Generate yearly financial report from the rollups"""
+        return yearly_report(self.tm.rollups.cells(year), self.tm.opening_balance, year)
     
     def get_category_summary(self, start_date: str = None, end_date: str = None) -> Dict:
         """
         Get spending summary by category for a date range
         """
-        df = self.tm.transactions_df.copy()
-        
-        if start_date:
-            df = df[df['Date'] >= pd.to_datetime(start_date)]
-        
-        if end_date:
-            df = df[df['Date'] <= pd.to_datetime(end_date)]
+        return category_summary(
+            self.tm.category_sums.cells(start_date, end_date),
+            *range_balances(self.tm, start_date, end_date)
+        )
+    
+    def get_range_category_summary(self, start_date: str = None, end_date: str = None) -> Dict:
+        """
+        Get spending summary by category for a date range spanning any
+        number of years
+        """
+        return category_summary(*range_parts(self.tm, start_date, end_date))
+
+
+class AccountReportGenerator:
+    """
+    Consolidated reports across the piggy banks of an account.
+    
+    Each piggy bank contributes partial aggregates that can be computed
+    independently (and in parallel); the merged cells go through the same
+    report functions as a single piggy bank, so the totals are identical
+    to adding up the per-piggy-bank reports.
+    """
+    
+    def __init__(self, account_name: str):
+        self.account_name = account_name
+    
+    def piggy_banks(self) -> List[str]:
+        return TransactionManager.list_piggy_banks(self.account_name)
+    
+    def year_partial(self, piggy_bank_name: str, year: int) -> Optional[Tuple[pd.DataFrame, float]]:
+        """One piggy bank's rollup cells and opening balance, None without data for the year"""
+        tm = TransactionManager(self.account_name, piggy_bank_name)
+        if not tm.load_rollups(year)["success"]:
+            return None
+        return tm.rollups.cells(year), tm.opening_balance
+    
+    def range_partial(
+        self,
+        piggy_bank_name: str,
+        start_date: str = None,
+        end_date: str = None,
+        year: int = None
+    ) -> Optional[Tuple[pd.DataFrame, float, float]]:
+        """
+        One piggy bank's aggregated cells and balances around a date range,
+        None without data
+        """
+        tm = TransactionManager(self.account_name, piggy_bank_name)
         
-        # Separate income and expenses
-        expense_df = df[df['Amount'] < 0]
-        income_df = df[df['Amount'] > 0]
+        # A date range without a year spans every year file it overlaps
+        if year is None and (start_date or end_date):
+            if not tm.list_transaction_files():
+                return None
+            return range_parts(tm, start_date, end_date)
         
-        expense_by_category = (
-            expense_df.groupby('Category')['Amount']
-            .sum()
-            .sort_values()
-            .to_dict()
+        if not tm.load(year)["success"]:
+            return None
+        return (tm.category_sums.cells(start_date, end_date), *range_balances(tm, start_date, end_date))
+    
+    @staticmethod
+    def _merge_year(partials: Iterable[Tuple[pd.DataFrame, float]]) -> Tuple[pd.DataFrame, float]:
+        partials = list(partials)
+        return (
+            merge_cells(cells for cells, _ in partials),
+            sum(opening for _, opening in partials)
         )
-        
-        income_by_category = (
-            income_df.groupby('Category')['Amount']
-            .sum()
-            .sort_values(ascending=False)
-            .to_dict()
+    
+    def generate_monthly_report(self, partials: Iterable[Tuple[pd.DataFrame, float]], year: int, month: int) -> Dict:
+        """Consolidated monthly report from year_partial results"""
+        cells, opening_balance = self._merge_year(partials)
+        return monthly_report(cells, opening_balance, year, month)
+    
+    def generate_yearly_report(self, partials: Iterable[Tuple[pd.DataFrame, float]], year: int) -> Dict:
+        """Consolidated yearly report from year_partial results"""
+        cells, opening_balance = self._merge_year(partials)
+        return yearly_report(cells, opening_balance, year)
+    
+    def get_category_summary(self, partials: Iterable[Tuple[pd.DataFrame, float, float]]) -> Dict:
+        """Consolidated category summary from range_partial results"""
+        partials = list(partials)
+        return category_summary(
+            merge_cells(cells for cells, _, _ in partials),
+            sum(before for _, before, _ in partials),
+            sum(after for _, _, after in partials)
         )
-        
-        return {
-            "total_income": float(income_df['Amount'].sum()),
-            "total_expenses": float(expense_df['Amount'].sum()),
-            "expense_by_category": {k: float(v) for k, v in expense_by_category.items()},
-            "income_by_category": {k: float(v) for k, v in income_by_category.items()}
-        }
@@ -0,0 +1,135 @@
+"""
+Core Business Logic - Monthly Rollups
+"""
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from app.domain.aggregation import aggregate
+
+# (month, category, sign) -> [sum, count]
+Cells = Dict[Tuple[int, str, int], List[float]]
+
+
+class RollupStore:
+    """
+    Per-piggy-bank monthly totals stored next to the year files.
+    
+    Each year keeps (month, category, sign) -> (sum, count) cells, where
+    sign is 1 for income, -1 for expenses and 0 for zero amounts. Adds and
+    deletes update a single cell; reports read the cells instead of the
+    raw transactions. Every year also records the storage signature its
+    cells were built against, so files changed elsewhere are detected.
+    """
+    
+    FILENAME = "rollups.json"
+    
+    def __init__(self, base_path: str):
+        self.path = os.path.join(base_path, self.FILENAME)
+        self.years: Dict[int, Cells] = {}
+        self.signatures: Dict[int, Optional[list]] = {}
+        self.dirty = False
+        self._read()
+    
+    def _read(self) -> None:
+        """Read the rollup file, starting empty if it is missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        
+        for year, entry in data.get("years", {}).items():
+            self.years[int(year)] = {
+                (int(month), category, int(sign)): [float(total), int(count)]
+                for month, category, sign, total, count in entry.get("cells", [])
+            }
+            self.signatures[int(year)] = entry.get("signature")
+    
+    def save(self) -> None:
+        """Write the rollup file atomically if anything changed"""
+        if not self.dirty:
+            return
+        
+        data = {"years": {
+            str(year): {
+                "signature": self.signatures.get(year),
+                "cells": [
+                    [month, category, sign, total, count]
+                    for (month, category, sign), (total, count) in sorted(cells.items())
+                ]
+            }
+            for year, cells in sorted(self.years.items())
+        }}
+        
+        folder = os.path.dirname(self.path)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{self.FILENAME}.", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+    
+    def has_year(self, year: int) -> bool:
+        return year in self.years
+    
+    def signature(self, year: int) -> Optional[list]:
+        return self.signatures.get(year)
+    
+    def set_signature(self, year: int, signature) -> None:
+        signature = list(signature) if signature is not None else None
+        if self.signatures.get(year) != signature or year not in self.years:
+            self.signatures[year] = signature
+            self.years.setdefault(year, {})
+            self.dirty = True
+    
+    def _apply(self, date, amount: float, category: str, count: int) -> None:
+        """Add (count=1) or remove (count=-1) one transaction from its cell"""
+        date = pd.Timestamp(date)
+        key = (date.month, category, int(np.sign(amount)))
+        cells = self.years.setdefault(date.year, {})
+        
+        cell = cells.setdefault(key, [0.0, 0])
+        cell[0] += amount * count
+        cell[1] += count
+        if cell[1] <= 0:
+            del cells[key]
+        
+        self.dirty = True
+    
+    def add(self, date, amount: float, category: str) -> None:
+        self._apply(date, float(amount), category, 1)
+    
+    def remove(self, date, amount: float, category: str) -> None:
+        self._apply(date, float(amount), category, -1)
+    
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """Add a batch of transactions, one cell update per group"""
+        if df.empty:
+            return
+        
+        for row in aggregate(df).itertuples(index=False):
+            cells = self.years.setdefault(int(row.year), {})
+            cell = cells.setdefault((int(row.month), row.category, int(row.sign)), [0.0, 0])
+            cell[0] += float(row.sum)
+            cell[1] += int(row.count)
+        
+        self.dirty = True
+    
+    def replace_year(self, year: int, df: pd.DataFrame, signature=None) -> None:
+        """Rebuild a year's cells from all of its transactions"""
+        self.years[year] = {}
+        self.add_frame(df)
+        self.set_signature(year, signature)
+        self.dirty = True
+    
+    def cells(self, year: int, month: int = None) -> pd.DataFrame:
+        """Cells of a year, or of one month, as a frame"""
+        rows = [
+            (m, category, sign, total, count)
+            for (m, category, sign), (total, count) in self.years.get(year, {}).items()
+            if month is None or m == month
+        ]
+        return pd.DataFrame(rows, columns=['month', 'category', 'sign', 'sum', 'count'])
@@ -0,0 +1,266 @@
+"""
+Core Business Logic - Description Search Index
+"""
+import bisect
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+import pandas as pd
+from app.domain.metrics import registry
+
+TOKEN = re.compile(r"\w+")
+# A word, optionally followed by '*' to match it as a prefix
+TERM = re.compile(r"(\w+)(\*?)")
+MATCH_MODES = ('all', 'any')
+
+# token -> transaction IDs
+Postings = Dict[str, Set[int]]
+
+
+def tokenize(text) -> Set[str]:
+    """Lower-cased words of a description"""
+    if not isinstance(text, str):
+        return set()
+    return set(TOKEN.findall(text.lower()))
+
+
+def parse_terms(text: str) -> List[Tuple[str, bool]]:
+    """(word, is_prefix) pairs of a search string such as 'coffee sho*'"""
+    return [(word, bool(star)) for word, star in TERM.findall(text.lower())]
+
+
+class SearchIndex:
+    """
+    Per-piggy-bank inverted index over transaction descriptions, stored
+    next to the year files.
+    
+    Each year maps description words to the IDs of the transactions that
+    use them, and records the storage signature it was built against, so
+    years changed elsewhere are rebuilt on the next search. A sorted
+    vocabulary answers prefix terms by binary search.
+    """
+    
+    FILENAME = "search_index.json"
+    
+    def __init__(self, base_path: str):
+        self.path = os.path.join(base_path, self.FILENAME)
+        self.years: Dict[int, Postings] = {}
+        self.signatures: Dict[int, Optional[list]] = {}
+        self.dirty = False
+        self.file_signature = None
+        self._vocabulary: Optional[List[str]] = None
+        self._lock = threading.RLock()
+        self._read()
+    
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the index file, or None if it does not exist"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _read(self) -> None:
+        """Read the index file, starting empty if it is missing or corrupt"""
+        self.file_signature = self._stat()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        
+        for year, entry in data.get("years", {}).items():
+            self.years[int(year)] = {
+                token: set(ids) for token, ids in entry.get("postings", {}).items()
+            }
+            self.signatures[int(year)] = entry.get("signature")
+    
+    def save(self) -> None:
+        """Write the index file atomically if anything changed"""
+        with self._lock:
+            if not self.dirty:
+                return
+            
+            data = {"years": {
+                str(year): {
+                    "signature": self.signatures.get(year),
+                    "postings": {token: sorted(ids) for token, ids in sorted(postings.items())}
+                }
+                for year, postings in sorted(self.years.items())
+            }}
+            
+            folder = os.path.dirname(self.path)
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f"{self.FILENAME}.", suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self.file_signature = self._stat()
+            self.dirty = False
+    
+    def replaced_on_disk(self) -> bool:
+        """Whether the file changed since this index read or wrote it"""
+        return self.file_signature != self._stat()
+    
+    def is_current(self, year: int, signature) -> bool:
+        """Whether a year was indexed from the year as stored with this signature"""
+        signature = list(signature) if signature is not None else None
+        # A year that is not stored yet is trivially indexed
+        return self.signatures.get(year) == signature and (year in self.years or signature is None)
+    
+    def set_signature(self, year: int, signature) -> None:
+        with self._lock:
+            self.signatures[year] = list(signature) if signature is not None else None
+            self.years.setdefault(year, {})
+            self.dirty = True
+    
+    # -------
+    # Updates
+    # -------
+    @staticmethod
+    def _group(ids, descriptions) -> Postings:
+        """
+        Postings of a batch of transactions; each distinct description is
+        tokenized once
+        """
+        ids = np.asarray(ids, dtype='int64')
+        codes, uniques = pd.factorize(pd.Series(descriptions, dtype=object).fillna(''))
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        
+        postings: Postings = {}
+        for code, text in enumerate(uniques):
+            group = ids[order[bounds[code]:bounds[code + 1]]].tolist()
+            for token in tokenize(text):
+                postings.setdefault(token, set()).update(group)
+        return postings
+    
+    def add(self, year: int, ids, descriptions) -> None:
+        """Index a batch of transactions of a year"""
+        with self._lock:
+            postings = self.years.setdefault(year, {})
+            for token, group in self._group(ids, descriptions).items():
+                if token not in postings:
+                    postings[token] = set()
+                    self._vocabulary = None
+                postings[token] |= group
+            self.dirty = True
+    
+    def remove(self, year: int, ids, descriptions) -> None:
+        """Drop a batch of transactions of a year from the index"""
+        with self._lock:
+            postings = self.years.get(year, {})
+            for token, group in self._group(ids, descriptions).items():
+                if token not in postings:
+                    continue
+                postings[token] -= group
+                if not postings[token]:
+                    del postings[token]
+                    self._vocabulary = None
+            self.dirty = True
+    
+    def replace_year(self, year: int, ids, descriptions, signature=None) -> None:
+        """Rebuild a year's postings from all of its transactions"""
+        with self._lock:
+            self.years[year] = self._group(ids, descriptions)
+            self._vocabulary = None
+            self.set_signature(year, signature)
+    
+    # ------
+    # Search
+    # ------
+    @property
+    def vocabulary(self) -> List[str]:
+        """Sorted words of every year, rebuilt after words come or go"""
+        with self._lock:
+            if self._vocabulary is None:
+                self._vocabulary = sorted(set().union(*self.years.values()))
+            return self._vocabulary
+    
+    def _expand(self, word: str, prefix: bool) -> List[str]:
+        """Indexed words a term matches"""
+        if not prefix:
+            return [word]
+        
+        vocabulary = self.vocabulary
+        start = bisect.bisect_left(vocabulary, word)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(word):
+            end += 1
+        return vocabulary[start:end]
+    
+    def search(
+        self,
+        terms: List[Tuple[str, bool]],
+        years: Iterable[int] = None,
+        match: str = 'all'
+    ) -> Dict[int, Set[int]]:
+        """
+        Year -> IDs of the transactions whose descriptions match every
+        term (match='all') or any term (match='any'); years without
+        matches are left out
+        """
+        with self._lock:
+            words = [self._expand(word, prefix) for word, prefix in terms]
+            hits = {}
+            
+            for year in (self.years if years is None else years):
+                postings = self.years.get(year, {})
+                matched = None
+                for candidates in words:
+                    ids = set().union(*(postings.get(w, ()) for w in candidates))
+                    if matched is None:
+                        matched = ids
+                    elif match == 'all':
+                        matched &= ids
+                    else:
+                        matched |= ids
+                    if match == 'all' and not matched:
+                        break
+                
+                if matched:
+                    hits[year] = matched
+            
+            return hits
+
+
+class SearchIndexes:
+    """
+    Search indexes held in memory across requests, keyed by piggy bank
+    folder. An index is re-read when its file was replaced by another
+    process.
+    """
+    
+    def __init__(self):
+        self._indexes: Dict[str, SearchIndex] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def open(self, base_path: str) -> SearchIndex:
+        """The piggy bank's index, reading it from disk if needed"""
+        with self._lock:
+            index = self._indexes.get(base_path)
+            if index is None or index.replaced_on_disk():
+                self.misses += 1
+                index = SearchIndex(base_path)
+                self._indexes[base_path] = index
+            else:
+                self.hits += 1
+            return index
+    
+    def loaded(self, base_path: str) -> Optional[SearchIndex]:
+        """The piggy bank's index if it is already in memory"""
+        with self._lock:
+            return self._indexes.get(base_path)
+
+
+# -----------------------------
+# Process-wide index collection
+# -----------------------------
+search_indexes = SearchIndexes()
+registry.register_cache("search_index", search_indexes)
@@ -0,0 +1,416 @@
+"""
+Core Business Logic - Transaction Storage Formats
+"""
+import os
+import re
+import glob
+import pandas as pd
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from app.config import settings
+from app.domain.category_dictionary import ID_COLUMN, category_dictionary
+
+
+class TransactionStorage:
+    """
+    Reads and writes one year of transactions in a specific file format
+    """
+    
+    name = None
+    extension = None
+    supports_append = False
+    # Formats that derive balances on read can take back-dated rows as appends
+    stores_balance = True
+    supports_range_reads = False
+    # Formats that store category IDs from the user's category dictionary
+    encodes_categories = False
+    
+    def list_files(self, folder: str) -> Dict[int, str]:
+        """Year -> filepath for every year stored in a folder"""
+        pattern = os.path.join(folder, f"*_transactions.{self.extension}")
+        
+        year_map = {}
+        for f in glob.glob(pattern):
+            m = re.match(r"(\d{4})_transactions\." + self.extension + "$", os.path.basename(f))
+            if m:
+                year_map[int(m.group(1))] = f
+        
+        return year_map
+    
+    def exists(self, filepath: str) -> bool:
+        return os.path.exists(filepath)
+    
+    def signature(self, filepath: str) -> Optional[Tuple[int, int]]:
+        """Change marker for cached reads; None falls back to the file stat"""
+        return None
+    
+    def category_encoded(self, filepath: str) -> bool:
+        """Whether a stored year holds category IDs rather than names"""
+        return False
+    
+    def read(self, filepath: str) -> pd.DataFrame:
+        """Read a year file; raises FileNotFoundError if it does not exist"""
+        raise NotImplementedError
+    
+    def read_query(self, filepath: str, query) -> pd.DataFrame:
+        """
+        Read the rows of a year file matching a TransactionQuery, plus any
+        tombstone records; formats override this to filter while reading
+        """
+        df = self.read(filepath)
+        return df[query.mask(df) | df['Amount'].isna().to_numpy()]
+    
+    def write(self, filepath: str, df: pd.DataFrame, fsync: bool = False) -> None:
+        """Replace a year file with the given frame"""
+        raise NotImplementedError
+    
+    def append(self, filepath: str, rows: pd.DataFrame, fsync: bool = False) -> None:
+        """Append records to an existing year file"""
+        raise NotImplementedError(f"{self.name} storage does not support appends")
+
+
+class CsvStorage(TransactionStorage):
+    """
+    Row-oriented CSV files; the only format that supports appends.
+    
+    Categories are written as IDs. Files written before that keep their
+    names, and appends to them stay in names until the next rewrite.
+    """
+    
+    name = 'csv'
+    extension = 'csv'
+    supports_append = True
+    encodes_categories = True
+    
+    QUERY_CHUNK_SIZE = 100_000
+    
+    # Balance may be missing from hand-written files
+    READ_DTYPES = {
+        'Transaction ID': 'int64',
+        'Amount': 'float64',
+        'Category': 'object',
+        ID_COLUMN: 'Int64',
+        'Description': 'object',
+        'Balance': 'float64'
+    }
+    
+    @staticmethod
+    def _header(filepath: str) -> list:
+        with open(filepath, 'r', encoding='utf-8-sig') as f:
+            return f.readline().rstrip('\r\n').split(',')
+    
+    def category_encoded(self, filepath: str) -> bool:
+        return ID_COLUMN in self._header(filepath)
+    
+    def read(self, filepath: str) -> pd.DataFrame:
+        return category_dictionary.decode_frame(pd.read_csv(
+            filepath,
+            parse_dates=['Date'],
+            dtype=self.READ_DTYPES,
+            encoding='utf-8-sig'
+        ))
+    
+    def read_query(self, filepath: str, query) -> pd.DataFrame:
+        """Filter chunk by chunk so only matching rows are kept in memory"""
+        chunks = pd.read_csv(
+            filepath,
+            parse_dates=['Date'],
+            dtype=self.READ_DTYPES,
+            encoding='utf-8-sig',
+            chunksize=self.QUERY_CHUNK_SIZE
+        )
+        matches = []
+        for chunk in chunks:
+            chunk = category_dictionary.decode_frame(chunk)
+            matches.append(chunk[query.mask(chunk) | chunk['Amount'].isna().to_numpy()])
+        return pd.concat(matches, ignore_index=True) if matches else self.read(filepath)
+    
+    def write(self, filepath: str, df: pd.DataFrame, fsync: bool = False) -> None:
+        with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+            category_dictionary.encode_frame(df).to_csv(f, index=False)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def append(self, filepath: str, rows: pd.DataFrame, fsync: bool = False) -> None:
+        # Match the layout of the rows already in the file: its category
+        # encoding and its columns, which may lack Balance or be reordered
+        header = self._header(filepath)
+        if ID_COLUMN in header:
+            rows = category_dictionary.encode_frame(rows)
+        rows = rows.reindex(columns=header)
+        with open(filepath, 'a', encoding='utf-8', newline='') as f:
+            rows.to_csv(f, header=False, index=False)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class ColumnarStorage(TransactionStorage):
+    """
+    Base for Arrow-backed formats with a fixed schema.
+    
+    Categories are stored as IDs from the user's category dictionary and
+    decoded to a categorical column on read; files written before that
+    hold Arrow dictionary-encoded names.
+    """
+    
+    encodes_categories = True
+    
+    SCHEMA = {
+        'Transaction ID': 'int64',
+        'Date': 'datetime64[ns]',
+        'Amount': 'float64',
+        'Category': 'category',
+        ID_COLUMN: 'Int32',
+        'Description': 'string',
+        'Balance': 'float64'
+    }
+    
+    def _to_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Encode categories and cast a frame to the storage schema"""
+        df = category_dictionary.encode_frame(df)
+        return df.astype({c: t for c, t in self.SCHEMA.items() if c in df.columns})
+    
+    @staticmethod
+    def _from_schema(df: pd.DataFrame) -> pd.DataFrame:
+        """Decode categories and cast storage dtypes back to the in-memory ones"""
+        return category_dictionary.decode_frame(df).astype({'Description': 'object'})
+    
+    def category_encoded(self, filepath: str) -> bool:
+        import pyarrow.dataset as ds
+        return ID_COLUMN in ds.dataset(filepath, format=self.arrow_format).schema.names
+    
+    @staticmethod
+    def _sync(filepath: str) -> None:
+        """fsync a file written by a library that does not expose its handle"""
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def read_query(self, filepath: str, query) -> pd.DataFrame:
+        """
+        Evaluate the query inside pyarrow: row groups and batches that
+        cannot match are skipped and only matching rows reach pandas
+        """
+        import pyarrow.dataset as ds
+        
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(filepath)
+        
+        dataset = ds.dataset(filepath, format=self.arrow_format)
+        encoded = ID_COLUMN in dataset.schema.names
+        table = dataset.to_table(
+            columns=[c for c in dataset.schema.names if c != 'Balance'],
+            filter=query.arrow_filter(
+                category_dictionary.ids_of(query.categories) if encoded else None
+            )
+        )
+        return self._from_schema(table.to_pandas())
+    
+    def _replace(self, filepath: str, writer, fsync: bool) -> None:
+        """Write to a temp file and rename it over the target"""
+        tmp_path = f"{filepath}.tmp"
+        writer(tmp_path)
+        if fsync:
+            self._sync(tmp_path)
+        os.replace(tmp_path, filepath)
+
+
+class ParquetStorage(ColumnarStorage):
+    """Apache Parquet files (zstd compressed)"""
+    
+    name = 'parquet'
+    extension = 'parquet'
+    arrow_format = 'parquet'
+    
+    def read(self, filepath: str) -> pd.DataFrame:
+        return self._from_schema(pd.read_parquet(filepath))
+    
+    def write(self, filepath: str, df: pd.DataFrame, fsync: bool = False) -> None:
+        table = self._to_schema(df)
+        self._replace(
+            filepath,
+            lambda path: table.to_parquet(path, index=False, compression='zstd'),
+            fsync
+        )
+
+
+class FeatherStorage(ColumnarStorage):
+    """Arrow IPC (Feather v2) files, fastest to load (zstd compressed)"""
+    
+    name = 'feather'
+    extension = 'feather'
+    arrow_format = 'ipc'
+    
+    def read(self, filepath: str) -> pd.DataFrame:
+        return self._from_schema(pd.read_feather(filepath))
+    
+    def write(self, filepath: str, df: pd.DataFrame, fsync: bool = False) -> None:
+        table = self._to_schema(df).reset_index(drop=True)
+        self._replace(
+            filepath,
+            lambda path: table.to_feather(path, compression='zstd'),
+            fsync
+        )
+
+
+class SqliteStorage(TransactionStorage):
+    """
+    Rows in the DATABASE_URL database, one ledger per piggy bank.
+    
+    Year "files" are logical paths that name the ledger and year; nothing
+    is written under them. Balances are derived on read, so inserts and
+    deletes touch single rows whatever the size of the year.
+    """
+    
+    name = 'sqlite'
+    extension = 'sqlite'
+    supports_append = True
+    stores_balance = False
+    supports_range_reads = True
+    
+    def __init__(self):
+        self._ledgers: Dict[Tuple[str, str], int] = {}
+    
+    @staticmethod
+    def _session():
+        from app.db.session import SessionLocal, init_db
+        init_db()
+        return SessionLocal()
+    
+    @staticmethod
+    def _repository(db):
+        from app.db.repositories.transaction_repo import TransactionRepository
+        return TransactionRepository(db)
+    
+    @staticmethod
+    def _locate(folder: str) -> Tuple[str, str]:
+        """(account, piggy bank) named by a <account>/piggy_banks/<pb>/sqlite folder"""
+        piggy_bank_path = os.path.dirname(folder)
+        account_path = os.path.dirname(os.path.dirname(piggy_bank_path))
+        return os.path.basename(account_path), os.path.basename(piggy_bank_path)
+    
+    @staticmethod
+    def _year(filepath: str) -> int:
+        return int(os.path.basename(filepath).split('_', 1)[0])
+    
+    def _ledger_id(self, repo, folder: str, create: bool = False) -> Optional[int]:
+        key = self._locate(folder)
+        if key not in self._ledgers:
+            ledger_id = repo.get_ledger_id(*key, create=create)
+            if ledger_id is None:
+                return None
+            self._ledgers[key] = ledger_id
+        return self._ledgers[key]
+    
+    @staticmethod
+    def has_database() -> bool:
+        """Whether DATABASE_URL may hold rows; a missing SQLite file holds none"""
+        url = settings.DATABASE_URL
+        if not url.startswith("sqlite"):
+            return True
+        database = url.split("///", 1)[-1]
+        return database == ":memory:" or os.path.exists(database)
+    
+    def rename_categories(self, renames: Dict[str, str]) -> int:
+        """
+        Relabel stored rows. Rows hold category names rather than
+        dictionary IDs, so renames are applied to them directly.
+        """
+        if not self.has_database():
+            return 0
+        with self._session() as db:
+            return self._repository(db).rename_categories(renames)
+    
+    def list_files(self, folder: str) -> Dict[int, str]:
+        with self._session() as db:
+            repo = self._repository(db)
+            ledger_id = self._ledger_id(repo, folder)
+            if ledger_id is None:
+                return {}
+            return {
+                year: os.path.join(folder, f"{year}_transactions.{self.extension}")
+                for year in repo.years(ledger_id)
+            }
+    
+    def exists(self, filepath: str) -> bool:
+        return self._year(filepath) in self.list_files(os.path.dirname(filepath))
+    
+    def signature(self, filepath: str) -> Optional[Tuple[int, int]]:
+        with self._session() as db:
+            repo = self._repository(db)
+            ledger_id = self._ledger_id(repo, os.path.dirname(filepath))
+            if ledger_id is None:
+                return None
+            return ledger_id, repo.version(ledger_id)
+    
+    def read(self, filepath: str) -> pd.DataFrame:
+        with self._session() as db:
+            repo = self._repository(db)
+            ledger_id = self._ledger_id(repo, os.path.dirname(filepath))
+            df = repo.read_year(ledger_id, self._year(filepath)) if ledger_id else None
+        
+        if df is None or df.empty:
+            raise FileNotFoundError(filepath)
+        return df
+    
+    def read_range(
+        self,
+        folder: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Rows between two dates with balances carried from all earlier rows"""
+        with self._session() as db:
+            repo = self._repository(db)
+            ledger_id = self._ledger_id(repo, folder)
+            if ledger_id is None:
+                return pd.DataFrame(columns=['Transaction ID', 'Date', 'Amount', 'Category', 'Description', 'Balance'])
+            return repo.read_range(ledger_id, start, end)
+    
+    def read_query(self, filepath: str, query) -> pd.DataFrame:
+        """Filters, sort order and limit run as one indexed SQL query"""
+        with self._session() as db:
+            repo = self._repository(db)
+            ledger_id = self._ledger_id(repo, os.path.dirname(filepath))
+            if ledger_id is None:
+                raise FileNotFoundError(filepath)
+            return repo.query(ledger_id, self._year(filepath), query)
+    
+    def write(self, filepath: str, df: pd.DataFrame, fsync: bool = False) -> None:
+        with self._session() as db:
+            repo = self._repository(db)
+            ledger_id = self._ledger_id(repo, os.path.dirname(filepath), create=True)
+            repo.replace_year(ledger_id, self._year(filepath), df)
+    
+    def append(self, filepath: str, rows: pd.DataFrame, fsync: bool = False) -> None:
+        """Insert new rows and delete tombstoned IDs in one transaction"""
+        tombstones = rows['Amount'].isna()
+        with self._session() as db:
+            repo = self._repository(db)
+            ledger_id = self._ledger_id(repo, os.path.dirname(filepath), create=True)
+            repo.apply(ledger_id, rows[~tombstones], rows.loc[tombstones, 'Transaction ID'])
+
+
+STORAGE_FORMATS: Dict[str, TransactionStorage] = {
+    storage.name: storage
+    for storage in (CsvStorage(), ParquetStorage(), FeatherStorage(), SqliteStorage())
+}
+
+
+def get_storage(name: str = None) -> TransactionStorage:
+    """
+    Get a storage format by name, defaulting to TRANSACTION_STORAGE_FORMAT
+    """
+    name = (name or settings.TRANSACTION_STORAGE_FORMAT).lower()
+    
+    if name not in STORAGE_FORMATS:
+        raise ValueError(
+            f"Unknown storage format '{name}'. "
+            f"Choose from: {', '.join(sorted(STORAGE_FORMATS))}"
+        )
+    
+    return STORAGE_FORMATS[name]
@@ -2,109 +2,288 @@
 Core Business Logic - Transaction Management
 """
 import os
-import glob
-import re
+import time
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-from backend.app.config.config import settings
+from app.config import settings
+from app.domain.cache import TransactionCache, transaction_cache
+from app.domain.category_dictionary import category_dictionary
+from app.domain.storage import get_storage
+from app.domain.metadata import PiggyBankMeta
+from app.domain.catalog import AccountCatalog
+from app.domain.metrics import (
+    BALANCE_SECONDS,
+    STORAGE_ROWS_READ,
+    STORAGE_ROWS_WRITTEN,
+    STORAGE_SECONDS
+)
+from app.domain.rollups import RollupStore
+from app.domain.prefix_sums import CategoryPrefixSums
+from app.domain.concurrency import ordered_map
+from app.domain.query import TransactionQuery
+from app.domain.search_index import MATCH_MODES, parse_terms, search_indexes
+from app.domain.balances import (
+    SORT_KEYS,
+    balance_as_of,
+    insert_sorted,
+    refresh_balances_from,
+    running_balance,
+    sorted_position
+)
 
 
 class TransactionManager:
     """
-    Manages financial transactions
+    Manages financial transactions.
+    
+    Transaction IDs are stable: they are never renumbered. Deletes are
+    written as tombstone records (the deleted ID repeated with an empty
+    Amount) and physically removed when the year file is compacted.
+    Categories are held as a categorical column with sorted categories.
     """
     
     COLUMNS = ['Transaction ID', 'Date', 'Amount', 'Category', 'Description', 'Balance']
+    DTYPES = {
+        'Transaction ID': 'int64',
+        'Date': 'datetime64[ns]',
+        'Amount': 'float64',
+        'Category': 'category',
+        'Description': 'object',
+        'Balance': 'float64'
+    }
     
-    def __init__(self, account_name: str, piggy_bank_name: str):
+    def __init__(
+        self,
+        account_name: str,
+        piggy_bank_name: str,
+        storage_format: str = None
+    ):
         self.account_name = account_name
         self.piggy_bank_name = piggy_bank_name
-        self.base_path = os.path.join(
+        self.storage = get_storage(storage_format)
+        self.base_path = self.piggy_bank_path(account_name, piggy_bank_name)
+        self.transactions_df = self._empty_frame()
+        self.category_sums = CategoryPrefixSums.from_frame(self.transactions_df)
+        self.transaction_counter = 1
+        self.current_balance = 0.0
+        self.opening_balance = 0.0
+        self.loaded_year = None
+        self.meta = PiggyBankMeta(self.base_path)
+        self.rollups = RollupStore(self.base_path)
+        
+        # Number of rows at the end of the frame not yet written to disk
+        self._pending_count = 0
+        # IDs from here on have not been written yet
+        self._persisted_counter = 1
+        self._pending_tombstones = []
+        # (ID, description) of stored rows deleted since the last write
+        self._deleted_descriptions = []
+        self._needs_rewrite = False
+        
+        # Transaction ID -> row position, built lazily
+        self._id_positions = None
+        self._id_offset = 0
+    
+    def adopt(self, other: "TransactionManager") -> None:
+        """
+        Take over the loaded year of another manager of the same piggy
+        bank, e.g. to write it in another storage format
+        """
+        self.transactions_df = other.transactions_df
+        self.category_sums = other.category_sums
+        self.transaction_counter = other.transaction_counter
+        self.current_balance = other.current_balance
+        self.opening_balance = other.opening_balance
+        self.loaded_year = other.loaded_year
+        self.meta = other.meta
+        self.rollups = other.rollups
+        
+        self._pending_count = other._pending_count
+        self._persisted_counter = other._persisted_counter
+        self._pending_tombstones = list(other._pending_tombstones)
+        self._deleted_descriptions = list(other._deleted_descriptions)
+        self._needs_rewrite = other._needs_rewrite
+        self._id_positions = None
+    
+    @staticmethod
+    def piggy_bank_path(account_name: str, piggy_bank_name: str) -> str:
+        """Folder holding a piggy bank's year files and metadata"""
+        return os.path.join(
             settings.USER_DATA_DIR,
             account_name,
             "piggy_banks",
             piggy_bank_name
         )
-        self.transactions_df = pd.DataFrame(columns=self.COLUMNS)
-        self.transaction_counter = 1
-        self.current_balance = 0.0
-        self.loaded_year = None
     
-    def get_file_path(self, year: int = None, extension: str = 'csv') -> str:
+    @staticmethod
+    def list_piggy_banks(account_name: str) -> list:
+        """Names of the piggy banks holding data under an account"""
+        folder = os.path.join(settings.USER_DATA_DIR, account_name, "piggy_banks")
+        if not os.path.isdir(folder):
+            return []
+        return sorted(
+            name for name in os.listdir(folder)
+            if os.path.isdir(os.path.join(folder, name))
+        )
+    
+    def get_file_path(self, year: int = None, extension: str = None) -> str:
         """
         Get file path for a specific year
         """
         if year is None:
             year = datetime.now().year
         
+        if extension is None:
+            extension = self.storage.extension
+        
         folder = os.path.join(self.base_path, extension)
         os.makedirs(folder, exist_ok=True)
         
         filename = f"{year}_transactions.{extension}"
         return os.path.join(folder, filename)
     
-    def list_transaction_files(self, extension: str = 'csv') -> Dict[int, str]:
+    def _cache_key(self, year: int = None) -> tuple:
+        """Key identifying a year's data in the shared transaction cache"""
+        if year is None:
+            year = datetime.now().year
+        return (
+            self.account_name,
+            self.piggy_bank_name,
+            int(year),
+            self.storage.name
+        )
+    
+    def list_transaction_files(self, extension: str = None) -> Dict[int, str]:
         """
         List all transaction files and return year -> filepath mapping
         """
-        folder = os.path.join(self.base_path, extension)
-        pattern = os.path.join(folder, f"*_transactions.{extension}")
-        files = glob.glob(pattern)
-        
-        year_map = {}
-        for f in files:
-            name = os.path.basename(f)
-            m = re.match(r"(\d{4})_transactions\." + extension + "$", name)
-            if m:
-                year_map[int(m.group(1))] = f
-        
-        return year_map
+        storage = self.storage if extension is None else get_storage(extension)
+        return storage.list_files(os.path.join(self.base_path, storage.extension))
     
-    def load_from_csv(self, year: int = None) -> dict:
-        """Load transactions from CSV file"""
-        files = self.list_transaction_files('csv')
+    def load(self, year: int = None) -> dict:
+        """
+        Load a year of transactions, defaulting to the latest year.
+        
+        Balances start from the year's opening balance, carried forward
+        from earlier years through the piggy bank metadata.
+        """
+        files = self.list_transaction_files()
         
         if not files:
             return {
                 "success": False,
-                "error": "No CSV files available."
+                "error": f"No {self.storage.name.upper()} files available."
             }
         
         if year is None:
             year = max(files.keys())
         
         self.loaded_year = year
-        filepath = self.get_file_path(year, 'csv')
+        self._pending_count = 0
+        self._pending_tombstones = []
+        self._deleted_descriptions = []
+        self._needs_rewrite = False
+        self._id_positions = None
+        filepath = self.get_file_path(year)
+        
+        self.meta = PiggyBankMeta(self.base_path)
+        self.rollups = RollupStore(self.base_path)
+        self.opening_balance = self._carried_balance(year, files)
+        
+        # Serve from the shared cache while the file is unchanged on disk
+        cached = transaction_cache.get(
+            self._cache_key(year),
+            filepath,
+            signature=self._signature(filepath)
+        )
+        if cached is not None:
+            self.transactions_df = cached.df.copy()
+            self.category_sums = (
+                cached.category_sums.copy() if cached.category_sums is not None
+                else CategoryPrefixSums.from_frame(self.transactions_df)
+            )
+            
+            # An earlier year may have changed since the entry was cached
+            shift = self.opening_balance - cached.opening_balance
+            if shift:
+                self.transactions_df['Balance'] += shift
+            
+            self.transaction_counter = max(cached.transaction_counter, self.meta.next_id())
+            self._persisted_counter = self.transaction_counter
+            self.current_balance = cached.current_balance + shift
+            self._sync_rollups(year, filepath)
+            return {
+                "success": True,
+                "year": year,
+                "count": len(self.transactions_df),
+                "balance": self.current_balance
+            }
         
         try:
-            self.transactions_df = pd.read_csv(filepath, parse_dates=['Date'])
+            started = time.perf_counter()
+            self.transactions_df = self.storage.read(filepath)
+            self._observe_storage("read", started, len(self.transactions_df))
         except FileNotFoundError:
-            self.transactions_df = pd.DataFrame(columns=self.COLUMNS)
-            self.current_balance = 0.0
+            self.transactions_df = self._empty_frame()
+            self.category_sums = CategoryPrefixSums.from_frame(self.transactions_df)
+            self.transaction_counter = self.meta.next_id()
+            self._persisted_counter = self.transaction_counter
+            self.current_balance = self.opening_balance
             return {
                 "success": False,
                 "error": f"File not found: {filepath}"
             }
         
-        # Ensure Balance column exists
-        if 'Balance' not in self.transactions_df.columns:
-            self._recalculate_balance()
+        # IDs are never reused, including IDs of tombstoned rows and IDs
+        # used in other years
+        self.transactions_df, max_id = self._apply_tombstones(self.transactions_df)
+        self.transaction_counter = max(max_id + 1, self.meta.next_id())
+        self._persisted_counter = self.transaction_counter
         
         self.transactions_df.sort_values(
-            by=['Date', 'Transaction ID'],
+            by=SORT_KEYS,
             inplace=True,
             ignore_index=True
         )
         
-        self.transaction_counter = (
-            self.transactions_df['Transaction ID'].max() + 1
-            if not self.transactions_df.empty else 1
-        )
+        # Stored balances go stale after deletes and edits in earlier years
+        self.transactions_df['Description'] = self.transactions_df['Description'].fillna('')
+        self.transactions_df['Balance'] = 0.0
+        self.transactions_df = self.transactions_df.astype(self.DTYPES)
+        self._recalculate_balance()
+        self.category_sums = CategoryPrefixSums.from_frame(self.transactions_df)
         
         self.current_balance = (
-            self.transactions_df['Balance'].iloc[-1]
-            if not self.transactions_df.empty else 0.0
+            float(self.transactions_df['Balance'].iat[-1])
+            if not self.transactions_df.empty else self.opening_balance
+        )
+        
+        # Keep the year snapshot in step with files edited outside the app
+        snapshot = self.meta.year(year)
+        net = float(self.transactions_df['Amount'].sum())
+        if (
+            snapshot is None or
+            snapshot["count"] != len(self.transactions_df) or
+            abs(snapshot["net"] - net) > 1e-6
+        ):
+            self._record_year(year)
+        elif not self._catalog_current(year):
+            # Same rows under a new signature, e.g. after a touch or a sync
+            self._record_catalog()
+        
+        self._sync_rollups(year, filepath)
+        
+        transaction_cache.put(
+            self._cache_key(year),
+            filepath,
+            self.transactions_df,
+            self.transaction_counter,
+            self.current_balance,
+            opening_balance=self.opening_balance,
+            signature=self._signature(filepath),
+            category_sums=self.category_sums
         )
         
         return {
@@ -114,16 +293,248 @@ class TransactionManager:
             "balance": self.current_balance
         }
     
-    def save_to_csv(self, year: int = None) -> dict:
-        """Save transactions to CSV file"""
+    def year_partitions(self, start_date: str = None, end_date: str = None) -> List[int]:
+        """Years whose files can hold rows between two dates (inclusive)"""
+        start = pd.to_datetime(start_date) if start_date else None
+        end = pd.to_datetime(end_date) if end_date else None
+        return [
+            y for y in sorted(self.list_transaction_files())
+            if (start is None or y >= start.year) and (end is None or y <= end.year)
+        ]
+    
+    def load_years(self, start_date: str = None, end_date: str = None) -> Iterator["TransactionManager"]:
+        """
+        Yield one loaded manager per year partition overlapping a date
+        range, in year order.
+        
+        Years outside the range are never opened; the overlapping ones are
+        read ahead in parallel, a bounded number at a time.
+        """
+        years = self.year_partitions(start_date, end_date)
+        if not years:
+            return iter(())
+        
+        # Backfill missing year snapshots once, instead of racing to write
+        # the metadata from every parallel load
+        self.meta = PiggyBankMeta(self.base_path)
+        self._carried_balance(years[-1] + 1, self.list_transaction_files())
+        
+        def load_year(year: int) -> "TransactionManager":
+            tm = TransactionManager(self.account_name, self.piggy_bank_name, self.storage.name)
+            tm.load(year)
+            return tm
+        
+        return ordered_map(load_year, years)
+    
+    def iter_range(self, start_date: str = None, end_date: str = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the transactions between two dates one year at a time.
+        
+        Year files hold disjoint date ranges, so the per-year slices come
+        out in (Date, Transaction ID) order without a merge step.
+        """
+        for tm in self.load_years(start_date, end_date):
+            df = tm.get_transactions(start_date, end_date)
+            if not df.empty:
+                yield df
+    
+    def load_range(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+        """
+        Get transactions between two dates across year files.
+        
+        Only the rows in range are kept from each year; each year keeps the
+        balances carried forward from earlier years.
+        """
+        # Indexed storage reads just the rows in range
+        if self.storage.supports_range_reads:
+            start = pd.to_datetime(start_date) if start_date else None
+            end = pd.to_datetime(end_date) if end_date else None
+            started = time.perf_counter()
+            df = self.storage.read_range(os.path.join(self.base_path, self.storage.extension), start, end)
+            self._observe_storage("read", started, len(df))
+            return df.astype(self.DTYPES) if not df.empty else self._empty_frame()
+        
+        frames = list(self.iter_range(start_date, end_date))
+        if not frames:
+            return self._empty_frame()
+        return pd.concat(frames, ignore_index=True)
+    
+    def query(self, query: TransactionQuery, year: int = None) -> pd.DataFrame:
+        """
+        Transactions matching a query, without balances.
+        
+        Only the given year, or the years the query's dates overlap, are
+        read. Years held in the shared cache are filtered in memory; the
+        rest go through the storage format's pushdown so only matching rows
+        are materialized. Each year contributes at most `limit` rows, and in
+        date order the scan stops as soon as the limit is reached.
+        """
+        years = [year] if year is not None else self.year_partitions(query.start_date, query.end_date)
+        
+        def read_year(y: int) -> pd.DataFrame:
+            filepath = self.get_file_path(y)
+            cached = transaction_cache.get(
+                self._cache_key(y),
+                filepath,
+                signature=self._signature(filepath)
+            )
+            if cached is not None:
+                df = cached.df
+            else:
+                try:
+                    started = time.perf_counter()
+                    df = self.storage.read_query(filepath, query)
+                    self._observe_storage("read", started, len(df))
+                except FileNotFoundError:
+                    return self._empty_frame()
+                df, _ = self._apply_tombstones(df)
+                df = df.sort_values(by=SORT_KEYS, kind='stable')
+                df['Description'] = df['Description'].fillna('')
+            return query.order(df[query.mask(df)])
+        
+        frames = []
+        matched = 0
+        for df in ordered_map(read_year, years):
+            if df.empty:
+                continue
+            frames.append(df)
+            matched += len(df)
+            if query.limit is not None and matched >= query.limit and query.sort == 'date':
+                break
+        
+        columns = [c for c in self.COLUMNS if c != 'Balance']
+        if not frames:
+            return self._empty_frame()[columns]
+        return query.order(pd.concat(frames, ignore_index=True))[columns].astype(
+            {c: t for c, t in self.DTYPES.items() if c in columns}
+        )
+    
+    def search(
+        self,
+        text: str,
+        match: str = 'all',
+        limit: int = None,
+        year: int = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Transactions whose descriptions contain the words of a search
+        string, newest first, and the total number of matches.
+        
+        Words ending in '*' match as prefixes; match='any' accepts rows
+        with any of the words. The search index answers which rows match,
+        so only years with matches are loaded. Years stored differently
+        from when they were indexed are re-indexed first.
+        """
+        terms = parse_terms(text)
+        if not terms:
+            raise ValueError("Search text has no words")
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown match '{match}'. Choose from: {', '.join(MATCH_MODES)}")
+        
+        files = self.list_transaction_files()
+        years = [y for y in ([year] if year is not None else sorted(files)) if y in files]
+        
+        index = search_indexes.open(self.base_path)
+        for y in years:
+            signature = self._stored_signature(files[y])
+            if not index.is_current(y, signature):
+                tm = TransactionManager(self.account_name, self.piggy_bank_name, self.storage.name)
+                tm.load(y)
+                df = tm.transactions_df
+                index.replace_year(y, df['Transaction ID'], df['Description'], signature)
+        index.save()
+        
+        hits = index.search(terms, years, match)
+        total = sum(len(ids) for ids in hits.values())
+        
+        frames = []
+        found = 0
+        for y in sorted(hits, reverse=True):
+            tm = TransactionManager(self.account_name, self.piggy_bank_name, self.storage.name)
+            tm.load(y)
+            df = tm.transactions_df
+            ids = np.fromiter(hits[y], dtype='int64', count=len(hits[y]))
+            matches = df[np.isin(df['Transaction ID'].to_numpy(), ids)].iloc[::-1]
+            if matches.empty:
+                continue
+            frames.append(matches)
+            found += len(matches)
+            if limit is not None and found >= limit:
+                break
+        
+        if not frames:
+            return self._empty_frame(), total
+        df = pd.concat(frames, ignore_index=True)
+        return df.iloc[:limit].reset_index(drop=True).astype(self.DTYPES), total
+    
+    def load_rollups(self, year: int) -> dict:
+        """
+        Prepare a year's rollups and opening balance for reporting without
+        reading its transactions, unless the rollups are missing or stale
+        """
+        files = self.list_transaction_files()
+        if year not in files:
+            return {
+                "success": False,
+                "error": f"File not found: {self.get_file_path(year)}"
+            }
+        
+        if not self._rollups_current(year, files[year]):
+            return self.load(year)
+        
+        self.meta = PiggyBankMeta(self.base_path)
+        self.opening_balance = self._carried_balance(year, files)
+        self.loaded_year = year
+        return {
+            "success": True,
+            "year": year
+        }
+    
+    def load_from_csv(self, year: int = None) -> dict:
+        """Load transactions; kept for callers predating pluggable storage"""
+        return self.load(year)
+    
+    def save(self, year: int = None, fsync: bool = None) -> dict:
+        """Save transactions, rewriting the year file completely"""
+        if fsync is None:
+            fsync = settings.TRANSACTION_FSYNC
+        
+        if year is None:
+            year = datetime.now().year
+        
         self.transactions_df.sort_values(
-            by=['Date', 'Transaction ID'],
+            by=SORT_KEYS,
             inplace=True,
             ignore_index=True
         )
         
-        filepath = self.get_file_path(year, 'csv')
-        self.transactions_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        filepath = self.get_file_path(year)
+        before = self._stored_signature(filepath)
+        started = time.perf_counter()
+        self.storage.write(filepath, self.transactions_df, fsync=fsync)
+        self._observe_storage("write", started, len(self.transactions_df))
+        self._record_year(year)
+        self._record_rollups(year, filepath)
+        self._record_search(year, filepath, before)
+        
+        self._pending_count = 0
+        self._pending_tombstones = []
+        self._deleted_descriptions = []
+        self._needs_rewrite = False
+        self._id_positions = None
+        self._persisted_counter = self.transaction_counter
+        
+        # The in-memory frame is now exactly what is on disk
+        transaction_cache.put(
+            self._cache_key(year),
+            filepath,
+            self.transactions_df,
+            self.transaction_counter,
+            self.current_balance,
+            opening_balance=self.opening_balance,
+            signature=self._signature(filepath),
+            category_sums=self.category_sums
+        )
         
         return {
             "success": True,
@@ -131,6 +542,96 @@ class TransactionManager:
             "count": len(self.transactions_df)
         }
     
+    def save_to_csv(self, year: int = None, fsync: bool = None) -> dict:
+        """Save transactions; kept for callers predating pluggable storage"""
+        return self.save(year, fsync=fsync)
+    
+    def flush(self, year: int = None, fsync: bool = None) -> dict:
+        """
+        Persist pending changes.
+        
+        New rows dated on or after the last stored row and tombstones for
+        deleted rows are appended to the year file as single records. The
+        file is only rewritten when a back-dated entry changed earlier
+        balances, when the target file does not hold the loaded year yet,
+        or when the storage format cannot append. Formats that derive
+        balances on read take back-dated rows as appends as well.
+        """
+        if fsync is None:
+            fsync = settings.TRANSACTION_FSYNC
+        
+        if year is None:
+            year = datetime.now().year
+        
+        filepath = self.get_file_path(year)
+        
+        if (
+            (self._needs_rewrite and self.storage.stores_balance) or
+            not self.storage.supports_append or
+            year != self.loaded_year or
+            not self.storage.exists(filepath)
+        ):
+            return self.save(year, fsync=fsync)
+        
+        if self.storage.stores_balance:
+            new_rows = self.transactions_df.iloc[len(self.transactions_df) - self._pending_count:]
+        else:
+            new_rows = self.transactions_df[
+                self.transactions_df['Transaction ID'] >= self._persisted_counter
+            ]
+        
+        appended = len(new_rows)
+        tombstoned = len(self._pending_tombstones)
+        if appended or tombstoned:
+            rows = new_rows
+            if tombstoned:
+                # Typed like the new rows; pandas deprecates concatenating
+                # empty frames or all-NA columns of another dtype
+                tombstones = pd.DataFrame(
+                    self._pending_tombstones,
+                    columns=self.COLUMNS
+                ).astype(new_rows.dtypes.to_dict())
+                rows = pd.concat([new_rows, tombstones], ignore_index=True) if appended else tombstones
+            before = self._stored_signature(filepath)
+            started = time.perf_counter()
+            self.storage.append(filepath, rows, fsync=fsync)
+            self._observe_storage("append", started, len(rows))
+            self._record_search(year, filepath, before)
+            self._pending_count = 0
+            self._pending_tombstones = []
+            self._deleted_descriptions = []
+            self._needs_rewrite = False
+            self._persisted_counter = self.transaction_counter
+            self._record_year(year)
+            self._record_rollups(year, filepath)
+        
+        transaction_cache.put(
+            self._cache_key(year),
+            filepath,
+            self.transactions_df,
+            self.transaction_counter,
+            self.current_balance,
+            opening_balance=self.opening_balance,
+            signature=self._signature(filepath),
+            category_sums=self.category_sums
+        )
+        
+        return {
+            "success": True,
+            "filepath": filepath,
+            "count": len(self.transactions_df),
+            "appended": appended,
+            "tombstoned": tombstoned
+        }
+    
+    def compact(self, year: int = None) -> dict:
+        """
+        Rewrite a year file in sorted order with fresh balances, physically
+        removing tombstoned rows
+        """
+        self._refresh_balance()
+        return self.save(year)
+    
     def add_transaction(
         self,
         date: str,
@@ -147,22 +648,41 @@ class TransactionManager:
                 "error": f"Invalid date format: {str(e)}"
             }
         
-        balance = self.current_balance + amount
-        
+        self._align_categories([category])
         new_transaction = {
             'Transaction ID': self.transaction_counter,
             'Date': date_obj,
             'Amount': amount,
             'Category': category,
             'Description': description,
-            'Balance': balance
+            'Balance': 0.0
         }
         
-        self.transactions_df.loc[len(self.transactions_df)] = new_transaction
-        self.current_balance = balance
+        # Binary-search the sorted position and recompute balances from there
+        position = sorted_position(
+            self.transactions_df,
+            date_obj,
+            self.transaction_counter
+        )
+        self.transactions_df = insert_sorted(
+            self.transactions_df,
+            new_transaction,
+            position
+        )
+        self._refresh_balances_from(position)
+        self._id_positions = None
+        
+        new_transaction['Balance'] = float(self.transactions_df['Balance'].iat[position])
+        self.current_balance = float(self.transactions_df['Balance'].iat[-1])
         self.transaction_counter += 1
+        self.rollups.add(date_obj, amount, category)
+        self.category_sums.add(date_obj, category, amount)
         
-        self._refresh_balance()
+        # Entries dated before the last row shift every later balance
+        if position < len(self.transactions_df) - 1:
+            self._needs_rewrite = True
+        else:
+            self._pending_count += 1
         
         return {
             "success": True,
@@ -170,49 +690,190 @@ class TransactionManager:
             "balance": self.current_balance
         }
     
+    def add_transactions(self, rows: pd.DataFrame) -> dict:
+        """
+        Add a batch of validated transactions in one pass.
+        
+        Expects Date, Amount, Category and Description columns. IDs are
+        assigned in input order, the batch is merged into the sorted frame
+        and balances are recomputed once from the earliest affected row.
+        """
+        if rows.empty:
+            return {
+                "success": True,
+                "count": 0,
+                "balance": self.current_balance
+            }
+        
+        first_id = self.transaction_counter
+        batch = pd.DataFrame({
+            'Transaction ID': np.arange(first_id, first_id + len(rows), dtype='int64'),
+            'Date': pd.to_datetime(rows['Date']).to_numpy(),
+            'Amount': rows['Amount'].to_numpy(dtype='float64'),
+            'Category': pd.Categorical(
+                rows['Category'].to_numpy(dtype=object),
+                dtype=self._align_categories(rows['Category'])
+            ),
+            'Description': rows['Description'].to_numpy(dtype=object),
+            'Balance': 0.0
+        })
+        batch.sort_values(by=SORT_KEYS, kind='stable', inplace=True, ignore_index=True)
+        
+        position = sorted_position(
+            self.transactions_df,
+            batch['Date'].iat[0],
+            int(batch['Transaction ID'].iat[0])
+        )
+        at_tail = position == len(self.transactions_df)
+        
+        self.transactions_df = pd.concat(
+            [self.transactions_df, batch],
+            ignore_index=True
+        )
+        if not at_tail:
+            self.transactions_df.sort_values(
+                by=SORT_KEYS,
+                kind='stable',
+                inplace=True,
+                ignore_index=True
+            )
+        
+        self._refresh_balances_from(position)
+        self._id_positions = None
+        self.current_balance = float(self.transactions_df['Balance'].iat[-1])
+        self.transaction_counter = first_id + len(batch)
+        self.rollups.add_frame(batch)
+        self.category_sums = CategoryPrefixSums.from_frame(self.transactions_df)
+        
+        if at_tail:
+            self._pending_count += len(batch)
+        else:
+            self._needs_rewrite = True
+        
+        return {
+            "success": True,
+            "count": len(batch),
+            "first_id": first_id,
+            "last_id": self.transaction_counter - 1,
+            "balance": self.current_balance
+        }
+    
     def get_transactions(
         self,
         start_date: str = None,
         end_date: str = None,
         category: str = None
     ) -> pd.DataFrame:
-        """Get filtered transactions"""
-        df = self.transactions_df.copy()
+        """
+        Get filtered transactions.
+        
+        The date range is located by binary search on the sorted frame;
+        only the category filter scans rows, and only inside the range.
+        """
+        df = self.transactions_df
+        dates = df['Date'].to_numpy(dtype='datetime64[ns]')
         
+        start = 0
         if start_date:
-            df = df[df['Date'] >= pd.to_datetime(start_date)]
+            start = int(np.searchsorted(dates, np.datetime64(pd.to_datetime(start_date), 'ns'), side='left'))
         
+        end = len(df)
         if end_date:
-            df = df[df['Date'] <= pd.to_datetime(end_date)]
+            end = int(np.searchsorted(dates, np.datetime64(pd.to_datetime(end_date), 'ns'), side='right'))
+        
+        df = df.iloc[start:max(start, end)]
         
         if category:
-            df = df[df['Category'] == category]
+            df = df[(df['Category'] == category).to_numpy()]
         
         return df
     
+    def balance_as_of(self, as_of: str) -> dict:
+        """
+        Balance after every transaction dated on or before a date.
+        
+        Only the date's year is consulted: its opening balance comes from
+        the metadata and the position within the year from a binary search
+        over the loaded (and cached) frame. Years without transactions just
+        carry the balance forward.
+        """
+        try:
+            as_of = pd.to_datetime(as_of)
+        except (ValueError, TypeError):
+            return {
+                "success": False,
+                "error": f"Invalid date: {as_of}"
+            }
+        
+        files = self.list_transaction_files()
+        if as_of.year not in files:
+            self.meta = PiggyBankMeta(self.base_path)
+            balance = float(self._carried_balance(as_of.year, files))
+        else:
+            if self.loaded_year != as_of.year:
+                load_result = self.load(as_of.year)
+                if not load_result["success"]:
+                    return load_result
+            balance = balance_as_of(self.transactions_df, as_of, self.opening_balance)
+        
+        return {
+            "success": True,
+            "as_of": as_of.strftime('%Y-%m-%d'),
+            "balance": balance
+        }
+    
+    def get_transaction(self, transaction_id: int) -> Optional[dict]:
+        """Get a single transaction by its ID"""
+        position = self._position_of(transaction_id)
+        if position is None:
+            return None
+        return self.transactions_df.iloc[position].to_dict()
+    
     def delete_transaction_by_id(self, transaction_id: int) -> dict:
-        """Delete a transaction by its ID"""
-        idx = self.transactions_df[
-            self.transactions_df['Transaction ID'] == transaction_id
-        ].index
+        """
+        Delete a transaction by its ID.
+        
+        Other IDs are left unchanged; the delete is persisted as a tombstone
+        on the next flush().
+        """
+        position = self._position_of(transaction_id)
         
-        if len(idx) == 0:
+        if position is None:
             return {
                 "success": False,
                 "error": f"Transaction ID {transaction_id} not found."
             }
         
-        removed = self.transactions_df.loc[idx[0]]
-        self.transactions_df = self.transactions_df.drop(idx).reset_index(drop=True)
+        removed = self.transactions_df.iloc[position]
+        unwritten_from = len(self.transactions_df) - self._pending_count
         
-        # Reassign IDs and recalculate balances
-        self.transactions_df['Transaction ID'] = range(1, len(self.transactions_df) + 1)
-        self._recalculate_balance()
+        self.transactions_df = pd.concat(
+            [self.transactions_df.iloc[:position], self.transactions_df.iloc[position + 1:]],
+            ignore_index=True
+        )
+        
+        # Rows after the removed one move up by one position
+        self._id_positions[int(transaction_id) - self._id_offset] = -1
+        later_ids = self.transactions_df['Transaction ID'].to_numpy()[position:]
+        self._id_positions[later_ids - self._id_offset] -= 1
+        
+        self._refresh_balances_from(position)
+        self.rollups.remove(removed['Date'], removed['Amount'], removed['Category'])
+        self.category_sums.remove(removed['Date'], removed['Category'], removed['Amount'])
+        
+        if position >= unwritten_from:
+            # Never written, so there is nothing to tombstone
+            self._pending_count -= 1
+        else:
+            self._pending_tombstones.append({
+                'Transaction ID': int(transaction_id),
+                'Date': removed['Date']
+            })
+            self._deleted_descriptions.append((int(transaction_id), removed['Description']))
         
-        self.transaction_counter = len(self.transactions_df) + 1
         self.current_balance = (
-            self.transactions_df['Balance'].iloc[-1]
-            if not self.transactions_df.empty else 0.0
+            float(self.transactions_df['Balance'].iat[-1])
+            if not self.transactions_df.empty else self.opening_balance
         )
         
         return {
@@ -221,33 +882,236 @@ class TransactionManager:
             "balance": self.current_balance
         }
     
+    def _position_of(self, transaction_id: int) -> Optional[int]:
+        """Row position of a transaction ID in O(1), or None"""
+        if self._id_positions is None:
+            self._build_id_index()
+        
+        slot = transaction_id - self._id_offset
+        if not 0 <= slot < len(self._id_positions):
+            return None
+        
+        position = int(self._id_positions[slot])
+        return position if position >= 0 else None
+    
+    def _build_id_index(self) -> None:
+        """
+        Build the direct-address ID -> position index, offset by the
+        smallest ID since IDs continue across years
+        """
+        ids = self.transactions_df['Transaction ID'].to_numpy(dtype='int64')
+        self._id_offset = int(ids.min()) if len(ids) else 0
+        size = int(ids.max()) - self._id_offset + 1 if len(ids) else 1
+        
+        self._id_positions = np.full(size, -1, dtype='int64')
+        self._id_positions[ids - self._id_offset] = np.arange(len(ids))
+    
     def _refresh_balance(self) -> None:
         """Refresh balance for all transactions"""
         if self.transactions_df.empty:
             return
         
         self.transactions_df.sort_values(
-            by=['Date', 'Transaction ID'],
+            by=SORT_KEYS,
             inplace=True,
             ignore_index=True
         )
+        self._id_positions = None
         
-        balance = 0
-        balances = []
-        for amount in self.transactions_df['Amount']:
-            balance += amount
-            balances.append(balance)
-        
-        self.transactions_df['Balance'] = balances
-        self.transaction_counter = self.transactions_df['Transaction ID'].max() + 1
-        self.current_balance = balances[-1] if balances else 0.0
+        self._recalculate_balance()
+        self.transaction_counter = max(
+            self.transaction_counter,
+            int(self.transactions_df['Transaction ID'].max()) + 1
+        )
+        self.current_balance = float(self.transactions_df['Balance'].iat[-1])
     
     def _recalculate_balance(self) -> None:
         """Recalculate balance column"""
-        balance = 0
-        balances = []
-        for amount in self.transactions_df['Amount']:
-            balance += amount
-            balances.append(balance)
+        started = time.perf_counter()
+        self.transactions_df['Balance'] = running_balance(
+            self.transactions_df['Amount'],
+            self.opening_balance
+        )
+        self._observe_balance(started)
+    
+    def _refresh_balances_from(self, position: int) -> None:
+        """Recompute balances from a row position to the end"""
+        started = time.perf_counter()
+        refresh_balances_from(self.transactions_df, position, self.opening_balance)
+        self._observe_balance(started)
+    
+    def _observe_balance(self, started: float) -> None:
+        BALANCE_SECONDS.observe(
+            time.perf_counter() - started,
+            account=self.account_name,
+            piggy_bank=self.piggy_bank_name
+        )
+    
+    def _observe_storage(self, operation: str, started: float, rows: int) -> None:
+        """Record the time and rows of a year file read, write or append"""
+        labels = {
+            "format": self.storage.name,
+            "account": self.account_name,
+            "piggy_bank": self.piggy_bank_name
+        }
+        STORAGE_SECONDS.observe(time.perf_counter() - started, operation=operation, **labels)
+        (STORAGE_ROWS_READ if operation == "read" else STORAGE_ROWS_WRITTEN).inc(rows, **labels)
+    
+    def _carried_balance(self, year: int, files: Dict[int, str]) -> float:
+        """
+        Opening balance for a year, backfilling snapshots of earlier year
+        files written before metadata existed
+        """
+        backfilled = False
+        for y in sorted(files):
+            if y >= year or self.meta.year(y) is not None:
+                continue
+            
+            try:
+                started = time.perf_counter()
+                df = self.storage.read(files[y])
+                self._observe_storage("read", started, len(df))
+            except FileNotFoundError:
+                continue
+            df, max_id = self._apply_tombstones(df)
+            
+            self.meta.record_year(
+                y,
+                net=df['Amount'].sum(),
+                count=len(df),
+                max_id=max_id,
+                save=False
+            )
+            backfilled = True
+        
+        if backfilled:
+            self.meta.save()
+            self._record_catalog()
         
-        self.transactions_df['Balance'] = balances
+        return self.meta.opening_balance(year)
+    
+    def _stored_signature(self, filepath: str):
+        """Change marker of a stored year, from the storage or the file stat"""
+        return self.storage.signature(filepath) or TransactionCache.file_signature(filepath)
+    
+    def _signature(self, filepath: str):
+        """
+        Change marker of a stored year as decoded. Years stored as category
+        IDs decode differently after a rename, so their marker includes the
+        category dictionary version.
+        """
+        signature = self._stored_signature(filepath)
+        if signature is not None and self.storage.encodes_categories:
+            signature = (*signature, category_dictionary.version)
+        return signature
+    
+    def _rollups_current(self, year: int, filepath: str) -> bool:
+        """Whether a year's rollups were built from the year as stored now"""
+        signature = self._signature(filepath)
+        return self.rollups.signature(year) == (list(signature) if signature else None)
+    
+    def _sync_rollups(self, year: int, filepath: str) -> None:
+        """Rebuild the loaded year's rollups if the file changed behind their back"""
+        if not self._rollups_current(year, filepath):
+            self.rollups.replace_year(year, self.transactions_df, self._signature(filepath))
+            self.rollups.save()
+    
+    def _record_rollups(self, year: int, filepath: str) -> None:
+        """Persist rollup changes, marking them current with the written year"""
+        self.rollups.set_signature(year, self._signature(filepath))
+        self.rollups.save()
+    
+    def _record_search(self, year: int, filepath: str, before) -> None:
+        """
+        Apply the rows added and deleted since the last write to the
+        piggy bank's search index, if one is held in memory and was current
+        for the year before this write. Otherwise the next search rebuilds
+        the year.
+        """
+        index = search_indexes.loaded(self.base_path)
+        if index is None or year != self.loaded_year or not index.is_current(year, before):
+            return
+        
+        if self._deleted_descriptions:
+            ids, descriptions = zip(*self._deleted_descriptions)
+            index.remove(year, ids, descriptions)
+        
+        new_rows = self.transactions_df[
+            self.transactions_df['Transaction ID'].to_numpy() >= self._persisted_counter
+        ]
+        index.add(year, new_rows['Transaction ID'], new_rows['Description'])
+        index.set_signature(year, self._stored_signature(filepath))
+    
+    def _record_year(self, year: int) -> None:
+        """Store the snapshot of the frame just written as the given year"""
+        self.meta.record_year(
+            year,
+            net=self.transactions_df['Amount'].sum(),
+            count=len(self.transactions_df),
+            max_id=self.transaction_counter - 1
+        )
+        self._record_catalog()
+    
+    def _record_catalog(self) -> None:
+        """Publish the piggy bank's metadata to its account catalog"""
+        signatures = {}
+        for year in self.meta.years:
+            signature = self._stored_signature(self.get_file_path(year))
+            signatures[year] = list(signature) if signature is not None else None
+        
+        AccountCatalog(self.account_name).record_piggy_bank(
+            self.piggy_bank_name,
+            self.meta,
+            self.storage.name,
+            signatures
+        )
+    
+    def is_catalogued(self, year: int, snapshot: dict) -> bool:
+        """
+        Whether a year's catalog snapshot was recorded from the year as
+        stored now, rather than before an edit made outside the app
+        """
+        signature = self._stored_signature(self.get_file_path(year))
+        return signature is not None and snapshot.get("signature") == list(signature)
+    
+    def _catalog_current(self, year: int) -> bool:
+        """Whether the account catalog holds this year as stored now"""
+        entry = AccountCatalog(self.account_name).piggy_bank(self.piggy_bank_name)
+        snapshot = entry["years"].get(str(year)) if entry else None
+        return snapshot is not None and self.is_catalogued(year, snapshot)
+    
+    def _align_categories(self, categories) -> pd.CategoricalDtype:
+        """
+        Add unseen names to the frame's categories, keeping them sorted,
+        and return the column's dtype for new rows to share
+        """
+        column = self.transactions_df['Category']
+        known = column.cat.categories
+        missing = [
+            c for c in pd.unique(np.asarray(categories, dtype=object))
+            if not pd.isna(c) and c not in known
+        ]
+        if missing:
+            column = column.cat.set_categories(known.append(pd.Index(missing)).sort_values())
+            self.transactions_df['Category'] = column
+        return column.dtype
+    
+    @staticmethod
+    def _apply_tombstones(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """
+        Drop tombstone records and the rows they delete.
+        
+        Returns the live rows and the highest ID seen, tombstones included.
+        """
+        max_id = int(df['Transaction ID'].max()) if not df.empty else 0
+        
+        tombstones = df['Amount'].isna()
+        if tombstones.any():
+            deleted_ids = df.loc[tombstones, 'Transaction ID']
+            df = df[~df['Transaction ID'].isin(deleted_ids)]
+        
+        return df, max_id
+    
+    def _empty_frame(self) -> pd.DataFrame:
+        """Empty transactions frame with the expected column dtypes"""
+        return pd.DataFrame(columns=self.COLUMNS).astype(self.DTYPES)
\ No newline at end of file
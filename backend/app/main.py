@@ -2,10 +2,26 @@
 FastAPI Backend - Main Entry Point
 Personal Finance Bookkeeping Application
 """
+import sys
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from app.config import settings
 from app.api.v1 import transactions, accounts, categories, reports
+from app.domain.lazy import lazy_import
+from app.domain.report_cache import report_cache
+from app.domain.metrics import (
+    HTTP_IN_PROGRESS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS,
+    HTTP_RESPONSE_BYTES,
+    registry
+)
+
+# The cache module imports pandas; /health should not be what loads it
+CACHE_MODULE = "app.domain.cache"
+transaction_cache = lazy_import(CACHE_MODULE, "transaction_cache")
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -23,6 +39,62 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+class MetricsMiddleware:
+    """
+    Records latency, status and response bytes per route template, plus
+    requests in flight. Latency is also labelled with the account and
+    piggy bank from the path, so slow piggy banks stand out.
+    
+    Plain ASGI rather than BaseHTTPMiddleware, so streamed responses are
+    timed to their last chunk and every chunk is counted.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        status = 500
+        sent = 0
+        
+        async def send_and_count(message):
+            nonlocal status, sent
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                sent += len(message.get("body", b""))
+            await send(message)
+        
+        HTTP_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_and_count)
+        finally:
+            HTTP_IN_PROGRESS.dec()
+            # The router stores the matched route in the shared scope
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            params = scope.get("path_params", {})
+            method = scope["method"]
+            
+            HTTP_REQUESTS.inc(method=method, route=path, status=status)
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=method,
+                route=path,
+                account=params.get("account_name", ""),
+                piggy_bank=params.get("piggy_bank_name", "")
+            )
+            HTTP_RESPONSE_BYTES.inc(sent, method=method, route=path)
+
+
+# Outermost, so CORS handling is part of the measured time
+app.add_middleware(MetricsMiddleware)
+
 # Include API routers
 app.include_router(transactions.router, prefix="/api/v1", tags=["transactions"])
 app.include_router(accounts.router, prefix="/api/v1", tags=["accounts"])
@@ -41,7 +113,18 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # Nothing is cached before a request has imported the cache module
+    return {
+        "status": "healthy",
+        "transaction_cache": transaction_cache.stats() if CACHE_MODULE in sys.modules else None,
+        "report_cache": report_cache.stats()
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of request, storage and cache metrics"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from app.db.base import Base
+
+
+class Ledger(Base):
+    """Transaction storage key for one piggy bank"""
+
+    __tablename__ = "ledgers"
+
+    id = Column(Integer, primary_key=True)
+    account_name = Column(String(100), nullable=False)
+    piggy_bank_name = Column(String(100), nullable=False)
+    # Bumped on every write so readers can tell when cached data is stale
+    version = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("account_name", "piggy_bank_name", name="uq_ledger_piggy_bank"),
+    )
+
+
+class Transaction(Base):
+    """
+    One transaction. Balances are not stored; they are derived from the
+    amounts in (date, id) order when rows are read.
+    """
+
+    __tablename__ = "transactions"
+
+    piggy_bank_id = Column(Integer, ForeignKey("ledgers.id", ondelete="CASCADE"), primary_key=True)
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    date = Column(DateTime, nullable=False)
+    amount = Column(Float, nullable=False)
+    category = Column(String(100), nullable=False, default="")
+    description = Column(String, nullable=False, default="")
+
+    __table_args__ = (
+        # Range scans and running balances walk this index in order
+        Index("ix_transactions_piggy_bank_date_id", "piggy_bank_id", "date", "id"),
+        Index("ix_transactions_piggy_bank_category", "piggy_bank_id", "category", "date"),
+    )
@@ -3,14 +3,18 @@ Google Drive Integration Service
 """
 import io
 import os
-import pandas as pd
 from typing import Optional
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
 from app.config import settings
+from app.domain.lazy import lazy_import
+
+# The Google client stack and pandas are imported by the first Drive call
+pd = lazy_import("pandas")
+Credentials = lazy_import("google.oauth2.credentials", "Credentials")
+Request = lazy_import("google.auth.transport.requests", "Request")
+InstalledAppFlow = lazy_import("google_auth_oauthlib.flow", "InstalledAppFlow")
+build = lazy_import("googleapiclient.discovery", "build")
+MediaIoBaseDownload = lazy_import("googleapiclient.http", "MediaIoBaseDownload")
+MediaFileUpload = lazy_import("googleapiclient.http", "MediaFileUpload")
 
 
 class GoogleDriveService:
@@ -107,7 +111,7 @@ class GoogleDriveService:
                 "error": str(e)
             }
     
-    def download_csv(self, file_id: str) -> Optional[pd.DataFrame]:
+    def download_csv(self, file_id: str) -> Optional["pd.DataFrame"]:
         """Download CSV/Spreadsheet from Google Drive"""
         if not self.service:
             if not self.authenticate():
@@ -129,7 +133,7 @@ class GoogleDriveService:
             fh.seek(0)
             df = pd.read_csv(fh, parse_dates=['Date'])
             return df
-            
+        
         except Exception as e:
             print(f"Error downloading file: {e}")
             return None
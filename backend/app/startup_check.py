@@ -0,0 +1,118 @@
+"""
+Startup Import Check
+Run from the backend directory: python -m app.cli startup-check [options]
+
+Imports the app in fresh interpreters with -X importtime, reports which
+packages the time goes to and fails when the import exceeds its budget or
+loads a dependency that should wait for the first request.
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy dependencies that are only imported on first use
+DEFERRED_MODULES = (
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "sqlalchemy",
+    "yaml",
+    "googleapiclient",
+    "google_auth_oauthlib",
+)
+
+# Runs in the child: times the import itself and lists deferred modules it loaded
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"import_ms": elapsed, "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) of each line of -X importtime output"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def by_package(rows: List[Tuple[str, int, int]]) -> Dict[str, float]:
+    """Self import time in ms per top-level package"""
+    totals = defaultdict(int)
+    for name, self_us, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return {package: us / 1000 for package, us in totals.items()}
+
+
+def measure(module: str = "app.main", python: str = None) -> dict:
+    """
+    Import a module once in a new interpreter. Returns the import time,
+    the deferred modules it loaded and the -X importtime rows.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [BACKEND_DIR, env.get("PYTHONPATH")]))
+    probe = _PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    completed = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", probe],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+    
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    probe["rows"] = parse_importtime(completed.stderr)
+    return probe
+
+
+def check(
+    budget_ms: Optional[float] = None,
+    module: str = "app.main",
+    runs: int = 3,
+    top: int = 10
+) -> dict:
+    """
+    Startup report for a module, taking the fastest of several cold
+    imports. Fails if it is over budget or loads a deferred module.
+    """
+    budget_ms = settings.STARTUP_IMPORT_BUDGET_MS if budget_ms is None else budget_ms
+    try:
+        samples = [measure(module) for _ in range(max(runs, 1))]
+    except RuntimeError as e:
+        return {"success": False, "error": str(e)}
+    
+    fastest = min(samples, key=lambda s: s["import_ms"])
+    packages = sorted(by_package(fastest["rows"]).items(), key=lambda p: p[1], reverse=True)
+    
+    errors = []
+    if fastest["import_ms"] > budget_ms:
+        errors.append(f"import took {fastest['import_ms']:.0f} ms, budget is {budget_ms:.0f} ms")
+    if fastest["loaded"]:
+        errors.append(f"deferred modules imported at startup: {', '.join(fastest['loaded'])}")
+    
+    return {
+        "success": not errors,
+        "module": module,
+        "import_ms": round(fastest["import_ms"], 1),
+        "budget_ms": budget_ms,
+        "runs_ms": [round(s["import_ms"], 1) for s in samples],
+        "deferred_loaded": fastest["loaded"],
+        "slowest_packages": [{"package": p, "self_ms": round(ms, 1)} for p, ms in packages[:top]],
+        "error": "; ".join(errors) or None
+    }
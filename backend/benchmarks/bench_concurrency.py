@@ -0,0 +1,101 @@
+"""
+Concurrency Benchmark
+Run from the backend directory: python benchmarks/bench_concurrency.py [options]
+
+Fires concurrent POSTs at one piggy bank through the ASGI app and checks
+that none of them are lost.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def seed(account: str, piggy_bank: str, rows: int) -> None:
+    """Give the piggy bank a year of history so requests do real I/O"""
+    from app.domain.transactions import TransactionManager
+
+    rng = np.random.default_rng(0)
+    tm = TransactionManager(account, piggy_bank)
+    tm.load(2024)
+    tm.add_transactions(pd.DataFrame({
+        'Date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 180, rows), unit='D'),
+        'Amount': rng.normal(0, 50, rows).round(2),
+        'Category': rng.choice(['Food', 'Transport', 'Salary'], rows),
+        'Description': 'seed'
+    }))
+    tm.flush(2024)
+
+
+async def post_many(client, urls: list, clients: int, date: str) -> float:
+    """POST one transaction per URL with at most `clients` in flight; returns seconds"""
+    semaphore = asyncio.Semaphore(clients)
+
+    async def post(i, url):
+        async with semaphore:
+            response = await client.post(url, json={
+                "date": date,
+                "amount": 1.0,
+                "category": "Bench",
+                "description": f"bench-{i}"
+            })
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(post(i, url) for i, url in enumerate(urls)))
+    return time.perf_counter() - started
+
+
+async def run(args: argparse.Namespace) -> int:
+    from app.main import app
+
+    account, piggy_bank = "bench", "pb0"
+    seed(account, piggy_bank, args.rows)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        base = f"/api/v1/accounts/{account}/piggy-banks/{piggy_bank}"
+
+        # Lost updates: every client writes to the same piggy bank
+        balance_url = f"{base}/balance"
+        before = (await client.get(balance_url, params={"year": 2024})).json()
+        urls = [f"{base}/transactions"] * args.requests
+        seconds = await post_many(client, urls, args.clients, "2024-12-31")
+        after = (await client.get(balance_url, params={"year": 2024})).json()
+
+        lost = args.requests - (after["transaction_count"] - before["transaction_count"])
+        print(f"{args.requests} POSTs by {args.clients} clients in {seconds:.2f}s, lost updates: {lost}")
+
+    return 1 if lost else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=16, help="parallel clients (default: 16)")
+    parser.add_argument("--requests", type=int, default=200, help="POSTs to send (default: 200)")
+    parser.add_argument("--rows", type=int, default=20000, help="seed rows in the piggy bank")
+    parser.add_argument("--storage-format", help="override TRANSACTION_STORAGE_FORMAT")
+    parser.add_argument("--fsync", action="store_true", help="fsync every write (TRANSACTION_FSYNC)")
+    args = parser.parse_args(argv)
+
+    if args.storage_format:
+        os.environ["TRANSACTION_STORAGE_FORMAT"] = args.storage_format
+    if args.fsync:
+        os.environ["TRANSACTION_FSYNC"] = "true"
+
+    # Keep benchmark data out of the real data directory
+    os.environ.setdefault("USER_DATA_DIR", os.path.join(tempfile.mkdtemp(prefix="bench-"), "user"))
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
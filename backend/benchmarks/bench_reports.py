@@ -0,0 +1,190 @@
+"""
+Report Aggregation Benchmark
+Run from the backend directory: python benchmarks/bench_reports.py [options]
+
+Compares the previous mask-per-breakdown report code with the single-pass
+aggregation engine on synthetic years of transactions, and checks that
+both produce the same numbers.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.domain.aggregation import aggregate, by_category, totals
+
+CATEGORIES = ['Food', 'Transport', 'Entertainment', 'Salary', 'Savings', 'Rent', 'Others']
+
+
+def synthetic_year(rows: int, year: int = 2024, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Transaction ID': np.arange(1, rows + 1),
+        'Date': pd.Timestamp(f'{year}-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D'),
+        'Amount': rng.normal(-20, 80, rows).round(2),
+        'Category': rng.choice(CATEGORIES, rows),
+        'Description': ''
+    })
+    return df.sort_values(['Date', 'Transaction ID'], ignore_index=True)
+
+
+# ---------------------------------------
+# Previous implementation (one mask each)
+# ---------------------------------------
+def legacy_monthly(df: pd.DataFrame, year: int, month: int) -> dict:
+    start = datetime(year, month, 1)
+    end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
+    month_df = df[(df['Date'] >= start) & (df['Date'] < end)]
+    income = month_df[month_df['Amount'] > 0]['Amount'].sum()
+    expenses = month_df[month_df['Amount'] < 0]['Amount'].sum()
+    expense_df = month_df[(month_df['Amount'] < 0) & (month_df['Category'].str.lower() != 'savings')]
+    return {
+        "income": float(income),
+        "expenses": float(expenses),
+        "net": float(income + expenses),
+        "expense_by_category": expense_df.groupby('Category')['Amount'].sum().sort_values().to_dict(),
+        "income_by_category": month_df[month_df['Amount'] > 0].groupby('Category')['Amount'].sum()
+        .sort_values(ascending=False).to_dict()
+    }
+
+
+def legacy_yearly(df: pd.DataFrame, year: int) -> dict:
+    year_df = df[(df['Date'] >= datetime(year, 1, 1)) & (df['Date'] < datetime(year + 1, 1, 1))]
+    monthly = []
+    for month in range(1, 13):
+        start = datetime(year, month, 1)
+        end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
+        month_df = year_df[(year_df['Date'] >= start) & (year_df['Date'] < end)]
+        monthly.append((
+            float(month_df[month_df['Amount'] > 0]['Amount'].sum()),
+            float(month_df[month_df['Amount'] < 0]['Amount'].sum())
+        ))
+    income = float(year_df[year_df['Amount'] > 0]['Amount'].sum())
+    expenses = float(year_df[year_df['Amount'] < 0]['Amount'].sum())
+    return {
+        "income": income,
+        "expenses": expenses,
+        "net": income + expenses,
+        "expense_by_category": year_df[year_df['Amount'] < 0].groupby('Category')['Amount'].sum()
+        .sort_values().to_dict(),
+        "income_by_category": year_df[year_df['Amount'] > 0].groupby('Category')['Amount'].sum()
+        .sort_values(ascending=False).to_dict(),
+        "monthly": monthly
+    }
+
+
+def legacy_category_summary(df: pd.DataFrame, start_date: str, end_date: str) -> dict:
+    df = df.copy()
+    df = df[(df['Date'] >= pd.to_datetime(start_date)) & (df['Date'] <= pd.to_datetime(end_date))]
+    expense_df = df[df['Amount'] < 0]
+    income_df = df[df['Amount'] > 0]
+    return {
+        "income": float(income_df['Amount'].sum()),
+        "expenses": float(expense_df['Amount'].sum()),
+        "net": float(income_df['Amount'].sum() + expense_df['Amount'].sum()),
+        "expense_by_category": expense_df.groupby('Category')['Amount'].sum().sort_values().to_dict(),
+        "income_by_category": income_df.groupby('Category')['Amount'].sum()
+        .sort_values(ascending=False).to_dict()
+    }
+
+
+# ------------------
+# Aggregation engine
+# ------------------
+def date_slice(df: pd.DataFrame, start, end, inclusive: bool = False) -> pd.DataFrame:
+    """Rows in [start, end) of a date-sorted frame, found by binary search"""
+    dates = df['Date'].to_numpy()
+    first = np.searchsorted(dates, np.datetime64(pd.Timestamp(start)), side='left')
+    last = np.searchsorted(dates, np.datetime64(pd.Timestamp(end)), side='right' if inclusive else 'left')
+    return df.iloc[first:last]
+
+
+def engine_monthly(df: pd.DataFrame, year: int, month: int) -> dict:
+    end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
+    cells = aggregate(date_slice(df, datetime(year, month, 1), end))
+    return {
+        **totals(cells),
+        "expense_by_category": by_category(cells, -1, exclude=['savings']),
+        "income_by_category": by_category(cells, 1)
+    }
+
+
+def engine_yearly(df: pd.DataFrame, year: int) -> dict:
+    cells = aggregate(date_slice(df, datetime(year, 1, 1), datetime(year + 1, 1, 1)))
+    by_month = cells.groupby(['month', 'sign'])['sum'].sum()
+    return {
+        **totals(cells),
+        "expense_by_category": by_category(cells, -1),
+        "income_by_category": by_category(cells, 1),
+        "monthly": [
+            (float(by_month.get((m, 1), 0.0)), float(by_month.get((m, -1), 0.0)))
+            for m in range(1, 13)
+        ]
+    }
+
+
+def engine_category_summary(df: pd.DataFrame, start_date: str, end_date: str) -> dict:
+    cells = aggregate(date_slice(df, start_date, end_date, inclusive=True))
+    return {
+        **totals(cells),
+        "expense_by_category": by_category(cells, -1),
+        "income_by_category": by_category(cells, 1)
+    }
+
+
+def same(a, b) -> bool:
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+    return a == b
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 500_000], help="dataset sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case; the best is reported")
+    args = parser.parse_args(argv)
+
+    cases = [
+        ("yearly", legacy_yearly, engine_yearly, (2024,)),
+        ("monthly", legacy_monthly, engine_monthly, (2024, 6)),
+        ("category summary", legacy_category_summary, engine_category_summary, ("2024-03-01", "2024-09-30")),
+    ]
+
+    mismatches = 0
+    print(f"{'rows':>8}  {'report':<17} {'legacy ms':>10} {'engine ms':>10} {'speedup':>8}")
+    for rows in args.rows:
+        df = synthetic_year(rows)
+        for name, legacy, engine, params in cases:
+            if not same(legacy(df, *params), engine(df, *params)):
+                mismatches += 1
+                print(f"MISMATCH: {name} on {rows} rows")
+
+            legacy_s = best_of(lambda: legacy(df, *params), args.repeat)
+            engine_s = best_of(lambda: engine(df, *params), args.repeat)
+            print(f"{rows:>8}  {name:<17} {legacy_s * 1000:>10.1f} {engine_s * 1000:>10.1f} {legacy_s / engine_s:>7.1f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
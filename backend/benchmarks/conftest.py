@@ -0,0 +1,69 @@
+"""
+Domain Benchmark Suite
+Run from the backend directory: python -m pytest benchmarks [options]
+
+Timings are stored with and compared against the baselines checked in
+under benchmarks/baselines/<machine>:
+
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=min:25%
+    python -m pytest benchmarks --benchmark-save=baseline    # refresh after intended changes
+
+BENCH_ROWS sets the rows per synthetic year (default: 50000).
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCHMARK_DIR)
+BASELINE_DIR = os.path.join(BENCHMARK_DIR, "baselines")
+
+sys.path.insert(0, BACKEND_DIR)
+
+# Keep benchmark data out of the real data directory
+DATA_DIR = tempfile.mkdtemp(prefix="bench-")
+os.environ["DATA_BASE_DIR"] = DATA_DIR
+os.environ["USER_DATA_DIR"] = os.path.join(DATA_DIR, "user")
+
+ACCOUNT = "bench"
+PIGGY_BANK = "synthetic"
+ROWS_PER_YEAR = int(os.environ.get("BENCH_ROWS", 50000))
+YEARS = 3
+CATEGORIES = 12
+START_YEAR = 2022
+YEAR = START_YEAR + YEARS - 1
+
+
+def pytest_configure(config):
+    # Default to the checked-in baselines instead of ./.benchmarks
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BASELINE_DIR}"
+
+
+@pytest.fixture(scope="session")
+def dataset() -> dict:
+    """Synthetic piggy bank shared by every benchmark in the session"""
+    from app.domain.synthetic import generate_dataset
+
+    result = generate_dataset(
+        ACCOUNT,
+        PIGGY_BANK,
+        rows_per_year=ROWS_PER_YEAR,
+        years=YEARS,
+        categories=CATEGORIES,
+        start_year=START_YEAR
+    )
+    assert result["success"], result
+    return result
+
+
+@pytest.fixture
+def manager(dataset):
+    """Fresh manager with the latest synthetic year loaded; changes are never flushed"""
+    from app.domain.transactions import TransactionManager
+
+    tm = TransactionManager(ACCOUNT, PIGGY_BANK)
+    assert tm.load_from_csv(YEAR)["success"]
+    return tm
@@ -0,0 +1,104 @@
+"""
+Benchmarks for TransactionManager and ReportGenerator on synthetic data
+"""
+import pytest
+
+from conftest import ACCOUNT, PIGGY_BANK, START_YEAR, YEAR
+
+pytest.importorskip("pytest_benchmark")
+
+
+def new_manager():
+    from app.domain.transactions import TransactionManager
+    return TransactionManager(ACCOUNT, PIGGY_BANK)
+
+
+# -------------------
+# TransactionManager
+# -------------------
+def test_load_from_csv_cold(benchmark, dataset):
+    from app.domain.cache import transaction_cache
+
+    result = benchmark.pedantic(
+        lambda: new_manager().load_from_csv(YEAR),
+        setup=transaction_cache.invalidate,
+        rounds=10
+    )
+    assert result["success"]
+
+
+def test_load_from_csv_cached(benchmark, dataset):
+    new_manager().load_from_csv(YEAR)
+    result = benchmark(lambda: new_manager().load_from_csv(YEAR))
+    assert result["success"]
+
+
+def test_save_to_csv(benchmark, manager):
+    result = benchmark.pedantic(manager.save_to_csv, args=(YEAR,), rounds=10)
+    assert result["success"]
+
+
+def test_add_transaction_append(benchmark, manager):
+    result = benchmark(manager.add_transaction, f"{YEAR}-12-31", -12.5, "Food", "bench")
+    assert result["success"]
+
+
+def test_add_transaction_backdated(benchmark, manager):
+    result = benchmark(manager.add_transaction, f"{YEAR}-03-01", -12.5, "Food", "bench")
+    assert result["success"]
+
+
+def test_delete_transaction_by_id(benchmark, manager):
+    ids = iter(manager.transactions_df['Transaction ID'].sample(frac=1.0, random_state=0).tolist())
+    result = benchmark.pedantic(
+        manager.delete_transaction_by_id,
+        setup=lambda: ((next(ids),), {}),
+        rounds=200
+    )
+    assert result["success"]
+
+
+def test_get_transactions_range(benchmark, manager):
+    df = benchmark(manager.get_transactions, f"{YEAR}-03-01", f"{YEAR}-09-30")
+    assert not df.empty
+
+
+def test_get_transactions_category(benchmark, manager):
+    df = benchmark(manager.get_transactions, f"{YEAR}-03-01", f"{YEAR}-09-30", "Food")
+    assert not df.empty
+
+
+def test_search_descriptions(benchmark, dataset):
+    manager = new_manager()
+    manager.search("online", limit=50)
+    df, total = benchmark(manager.search, "online ord*", limit=50)
+    assert total > 0
+
+
+# ---------------
+# ReportGenerator
+# ---------------
+@pytest.fixture
+def reports(manager):
+    from app.domain.reports import ReportGenerator
+    return ReportGenerator(manager)
+
+
+def test_generate_monthly_report(benchmark, reports):
+    report = benchmark(reports.generate_monthly_report, YEAR, 6)
+    assert report["transaction_count"] > 0
+
+
+def test_generate_yearly_report(benchmark, reports):
+    report = benchmark(reports.generate_yearly_report, YEAR)
+    assert report["transaction_count"] > 0
+
+
+def test_get_category_summary(benchmark, reports):
+    summary = benchmark(reports.get_category_summary, f"{YEAR}-03-01", f"{YEAR}-09-30")
+    assert summary["expense_by_category"]
+
+
+def test_get_range_category_summary(benchmark, reports):
+    summary = benchmark(reports.get_range_category_summary, f"{START_YEAR}-07-01", f"{YEAR}-06-30")
+    assert summary["expense_by_category"]
@@ -0,0 +1,71 @@
+"""
+Cold-start budget for the FastAPI app
+
+Imports app.main in fresh interpreters and fails when the import breaks,
+when the fastest import exceeds STARTUP_IMPORT_BUDGET_MS or when it loads
+a deferred dependency. Print the full report with:
+python -m app.cli startup-check
+"""
+import importlib
+import os
+import subprocess
+import sys
+
+# Modules whose domain dependencies are deferred with lazy_import
+LAZY_MODULES = (
+    "app.main",
+    "app.api.v1.transactions",
+    "app.api.v1.reports",
+    "app.domain.categories",
+)
+
+
+def test_app_imports():
+    from app.startup_check import measure
+
+    # Raises with the child interpreter's traceback if the import fails
+    measure()
+
+
+def test_lazy_imports_resolve():
+    from app.domain.lazy import LazyImport
+
+    for name in LAZY_MODULES:
+        module = importlib.import_module(name)
+        for attribute, value in vars(module).items():
+            if isinstance(value, LazyImport):
+                assert value._resolve() is not None, f"{name}.{attribute}"
+
+
+def test_config_file_is_read_on_first_use(monkeypatch):
+    from app.startup_check import BACKEND_DIR, measure
+
+    monkeypatch.setenv("CONFIG_FILE", os.path.join(BACKEND_DIR, "config.yaml"))
+    assert "yaml" not in measure()["loaded"]
+
+
+def test_health_check_does_not_import_pandas():
+    from app.startup_check import BACKEND_DIR
+
+    probe = (
+        "import sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "from app.main import app\n"
+        "assert TestClient(app).get('/health').status_code == 200\n"
+        "print('pandas' in sys.modules)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    assert completed.stdout.strip() == "False"
+
+
+def test_startup_import_budget():
+    from app.startup_check import check
+
+    result = check()
+    assert result["success"], f"{result['error']}\n{result.get('slowest_packages')}"
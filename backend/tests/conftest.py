@@ -0,0 +1,53 @@
+"""
+Domain Test Suite
+Run from the backend directory: python -m pytest tests
+
+Every test gets its own user data directory; accounts are named
+uniquely because some process-wide caches are never cleared.
+"""
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(TESTS_DIR)
+
+sys.path.insert(0, BACKEND_DIR)
+
+# Keep test data out of the real data directory
+DATA_DIR = tempfile.mkdtemp(prefix="tests-")
+os.environ["DATA_BASE_DIR"] = DATA_DIR
+os.environ["USER_DATA_DIR"] = os.path.join(DATA_DIR, "user")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(DATA_DIR, 'bookkeeping.db')}"
+os.environ["CONFIG_FILE"] = os.path.join(DATA_DIR, "config.yaml")
+
+PIGGY_BANK = "savings"
+
+
+@pytest.fixture(autouse=True)
+def user_data_dir(tmp_path, monkeypatch) -> str:
+    """Fresh user data directory and an empty transaction cache"""
+    from app.config import settings
+    from app.domain.cache import transaction_cache
+
+    folder = str(tmp_path / "user")
+    monkeypatch.setattr(settings, "USER_DATA_DIR", folder)
+    transaction_cache.invalidate()
+    yield folder
+    transaction_cache.invalidate()
+
+
+@pytest.fixture
+def account() -> str:
+    return f"account-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
@@ -0,0 +1,89 @@
+"""
+Account catalog
+"""
+import os
+
+import pytest
+
+from conftest import PIGGY_BANK
+from app.domain.cache import transaction_cache
+from app.domain.catalog import AccountCatalog
+from app.domain.storage import CsvStorage
+from app.domain.transactions import TransactionManager
+
+
+@pytest.fixture
+def loads(monkeypatch) -> list:
+    """Years loaded from storage while the test runs"""
+    calls = []
+    load = TransactionManager.load
+    
+    def counting_load(self, year=None):
+        calls.append(year)
+        return load(self, year)
+    
+    monkeypatch.setattr(TransactionManager, "load", counting_load)
+    return calls
+
+
+def balance_url(account: str) -> str:
+    return f"/api/v1/accounts/{account}/piggy-banks/{PIGGY_BANK}/balance"
+
+
+def seed(account: str) -> str:
+    manager = TransactionManager(account, PIGGY_BANK)
+    manager.add_transaction("2024-03-01", 100.0, "Food")
+    manager.add_transaction("2024-03-02", -25.0, "Food")
+    manager.save(2024)
+    return manager.get_file_path(2024)
+
+
+def test_balance_is_served_from_catalog(client, account, loads):
+    seed(account)
+    
+    response = client.get(balance_url(account))
+    assert response.json() == {"balance": 75.0, "transaction_count": 2, "year": 2024}
+    assert loads == []
+
+
+def test_touched_year_is_catalogued_again(client, account, loads):
+    filepath = seed(account)
+    stat = os.stat(filepath)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    transaction_cache.invalidate()
+    
+    # Same rows, new signature: the first request reads the file
+    assert client.get(balance_url(account)).json()["balance"] == 75.0
+    assert len(loads) == 1
+    
+    assert client.get(balance_url(account)).json()["balance"] == 75.0
+    assert len(loads) == 1
+
+
+def test_account_details_come_from_catalog(client, account, monkeypatch):
+    seed(account)
+    client.post(
+        f"/api/v1/accounts/{account}/piggy-banks/{PIGGY_BANK}/transactions",
+        json={"date": "2024-03-03", "amount": 10.0, "category": "Food", "description": ""}
+    )
+    
+    def read(self, filepath):
+        raise AssertionError(f"read {filepath}")
+    
+    monkeypatch.setattr(CsvStorage, "read", read)
+    account_details = client.get(f"/api/v1/accounts/{account}").json()
+    listed = [a for a in client.get("/api/v1/accounts").json() if a["name"] == account]
+    
+    assert (account_details["transaction_count"], account_details["balance"]) == (3, 85.0)
+    assert account_details["piggy_banks"][PIGGY_BANK]["years"]["2024"]["closing_balance"] == 85.0
+    assert (listed[0]["transaction_count"], listed[0]["balance"]) == (3, 85.0)
+
+
+def test_missing_catalog_is_rebuilt_once(client, account):
+    seed(account)
+    catalog = AccountCatalog(account)
+    os.remove(catalog.path)
+    
+    assert client.get(f"/api/v1/accounts/{account}").json()["balance"] == 75.0
+    assert catalog.exists()
+    assert catalog.piggy_bank(PIGGY_BANK)["years"]["2024"]["count"] == 2
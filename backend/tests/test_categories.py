@@ -0,0 +1,81 @@
+"""
+Categories and the category dictionary
+"""
+import pytest
+
+from conftest import PIGGY_BANK
+from app.domain.categories import CategoryManager
+from app.domain.transactions import TransactionManager
+
+FORMATS = ['csv', 'parquet', 'feather', 'sqlite']
+
+
+@pytest.fixture
+def categories(tmp_path) -> CategoryManager:
+    manager = CategoryManager(str(tmp_path / "categories.json"))
+    manager.save_categories(["Food", "Rent", "Travel"])
+    return manager
+
+
+def seed(account: str, storage_format: str) -> TransactionManager:
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    manager.add_transaction("2024-01-01", -10.0, "Food")
+    manager.add_transaction("2024-01-02", -500.0, "Rent")
+    manager.add_transaction("2024-01-03", -20.0, "Food")
+    manager.save(2024)
+    return manager
+
+
+def stored_categories(account: str, storage_format: str) -> list:
+    # Loads go through the shared cache, which must not serve the old names
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    assert manager.load(2024)["success"]
+    return list(manager.transactions_df['Category'])
+
+
+@pytest.mark.parametrize("storage_format", FORMATS)
+def test_rename_relabels_stored_rows(account, categories, storage_format):
+    seed(account, storage_format)
+    assert stored_categories(account, storage_format) == ["Food", "Rent", "Food"]
+    
+    assert categories.update_category("Food", "Groceries")["success"]
+    assert stored_categories(account, storage_format) == ["Groceries", "Rent", "Groceries"]
+    assert categories.get_categories() == ["Groceries", "Rent", "Travel"]
+
+
+@pytest.mark.parametrize("storage_format", FORMATS)
+def test_renames_can_swap_names(account, categories, storage_format):
+    seed(account, storage_format)
+    
+    assert categories.rename_categories({"Food": "Rent", "Rent": "Food"})["success"]
+    assert stored_categories(account, storage_format) == ["Rent", "Food", "Rent"]
+
+
+def test_rename_leaves_year_files_untouched(account, categories):
+    filepath = seed(account, 'parquet').get_file_path(2024)
+    with open(filepath, 'rb') as f:
+        before = f.read()
+    
+    categories.update_category("Food", "Groceries")
+    with open(filepath, 'rb') as f:
+        assert f.read() == before
+
+
+def test_rows_added_after_a_rename_share_the_category(account, categories):
+    seed(account, 'csv')
+    categories.update_category("Food", "Groceries")
+    
+    manager = TransactionManager(account, PIGGY_BANK, 'csv')
+    manager.load(2024)
+    manager.add_transaction("2024-01-04", -5.0, "Groceries")
+    manager.flush(2024)
+    
+    assert stored_categories(account, 'csv') == ["Groceries", "Rent", "Groceries", "Groceries"]
+
+
+def test_rename_onto_an_existing_name_is_rejected(account, categories):
+    seed(account, 'csv')
+    
+    result = categories.update_category("Food", "Rent")
+    assert result == {"success": False, "error": "Category 'Rent' already exists."}
+    assert stored_categories(account, 'csv') == ["Food", "Rent", "Food"]
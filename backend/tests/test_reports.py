@@ -0,0 +1,63 @@
+"""
+Report caching and conditional requests
+"""
+from conftest import PIGGY_BANK
+
+
+def add(client, account: str, amount: float, piggy_bank_name: str = PIGGY_BANK) -> None:
+    response = client.post(
+        f"/api/v1/accounts/{account}/piggy-banks/{piggy_bank_name}/transactions",
+        json={"date": "2024-05-01", "amount": amount, "category": "Food", "description": ""}
+    )
+    assert response.status_code == 200, response.text
+
+
+def test_matching_etag_gets_304(client, account):
+    add(client, account, 100.0)
+    url = f"/api/v1/accounts/{account}/piggy-banks/{PIGGY_BANK}/reports/yearly?year=2024"
+    
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get(url, headers={"If-None-Match": header})
+        assert response.status_code == 304, header
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+    
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_write_changes_etag(client, account):
+    add(client, account, 100.0)
+    url = f"/api/v1/accounts/{account}/piggy-banks/{PIGGY_BANK}/reports/yearly?year=2024"
+    before = client.get(url)
+    
+    add(client, account, -30.0)
+    after = client.get(url, headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert after.json() != before.json()
+
+
+def test_etag_depends_on_parameters(client, account):
+    add(client, account, 100.0)
+    url = f"/api/v1/accounts/{account}/piggy-banks/{PIGGY_BANK}/reports/monthly?year=2024"
+    may = client.get(f"{url}&month=5")
+    
+    june = client.get(f"{url}&month=6", headers={"If-None-Match": may.headers["ETag"]})
+    assert june.status_code == 200
+    assert june.headers["ETag"] != may.headers["ETag"]
+
+
+def test_consolidated_etag_covers_every_piggy_bank(client, account):
+    add(client, account, 100.0, "first")
+    add(client, account, 50.0, "second")
+    url = f"/api/v1/accounts/{account}/reports/yearly?year=2024"
+    
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    
+    add(client, account, 5.0, "second")
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,97 @@
+"""
+Storage formats
+"""
+import os
+
+from conftest import PIGGY_BANK
+from app.domain.cache import transaction_cache
+from app.domain.transactions import TransactionManager
+
+
+def write_year(manager: TransactionManager, year: int, text: str) -> str:
+    filepath = manager.get_file_path(year)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return filepath
+
+
+def test_csv_append_follows_existing_header(account):
+    manager = TransactionManager(account, PIGGY_BANK, 'csv')
+    filepath = write_year(manager, 2024, (
+        "Transaction ID,Date,Amount,Category,Description\n"
+        "1,2024-01-01,100.0,Food,lunch\n"
+    ))
+    assert manager.load(2024)["success"]
+    
+    manager.add_transaction("2024-02-01", -30.0, "Food", "dinner")
+    assert manager.flush(2024)["appended"] == 1
+    
+    with open(filepath, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "Transaction ID,Date,Amount,Category,Description"
+    assert all(line.count(',') == 4 for line in lines)
+    
+    transaction_cache.invalidate()
+    reloaded = TransactionManager(account, PIGGY_BANK, 'csv')
+    assert reloaded.load(2024)["success"]
+    assert list(reloaded.transactions_df['Transaction ID']) == [1, 2]
+    assert reloaded.current_balance == 70.0
+
+
+def test_csv_append_follows_reordered_header(account):
+    manager = TransactionManager(account, PIGGY_BANK, 'csv')
+    write_year(manager, 2024, (
+        "Date,Transaction ID,Description,Amount,Category,Balance\n"
+        "2024-01-01,1,lunch,100.0,Food,100.0\n"
+    ))
+    assert manager.load(2024)["success"]
+    
+    manager.add_transaction("2024-02-01", -30.0, "Rent", "dinner")
+    manager.flush(2024)
+    
+    transaction_cache.invalidate()
+    reloaded = TransactionManager(account, PIGGY_BANK, 'csv')
+    assert reloaded.load(2024)["success"]
+    row = reloaded.get_transaction(2)
+    assert (row['Amount'], row['Category'], row['Description']) == (-30.0, "Rent", "dinner")
+    assert reloaded.current_balance == 70.0
+
+
+FORMATS = ['csv', 'parquet', 'feather', 'sqlite']
+
+
+def replay(account: str, storage_format: str) -> dict:
+    """Run the same edits against one storage format and read the result back"""
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    for day, amount in [(1, 100.0), (3, -20.0), (5, 40.0)]:
+        manager.add_transaction(f"2024-03-{day:02d}", amount, "Food", f"day {day}")
+    manager.save(2024)
+    
+    transaction_cache.invalidate()
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    manager.load(2024)
+    manager.add_transaction("2024-03-02", -5.0, "Rent", "back-dated")
+    manager.add_transaction("2024-03-06", 7.5, "Food", "latest")
+    manager.delete_transaction_by_id(1)
+    manager.flush(2024)
+    
+    transaction_cache.invalidate()
+    reloaded = TransactionManager(account, PIGGY_BANK, storage_format)
+    assert reloaded.load(2024)["success"]
+    columns = ['Transaction ID', 'Date', 'Amount', 'Category', 'Description', 'Balance']
+    return {
+        "rows": reloaded.transactions_df[columns].astype({'Category': 'object'}).to_dict('records'),
+        "balance": reloaded.current_balance,
+        "as_of": reloaded.balance_as_of("2024-03-03")["balance"],
+        "range": reloaded.load_range("2024-03-02", "2024-03-05")['Transaction ID'].tolist(),
+        "next_id": reloaded.transaction_counter
+    }
+
+
+def test_storage_formats_agree(account):
+    expected = replay(f"{account}-csv", 'csv')
+    assert [row['Transaction ID'] for row in expected["rows"]] == [4, 2, 3, 5]
+    assert expected["balance"] == 22.5
+    
+    for storage_format in FORMATS[1:]:
+        assert replay(f"{account}-{storage_format}", storage_format) == expected, storage_format
@@ -0,0 +1,80 @@
+"""
+Transaction manager
+"""
+from conftest import PIGGY_BANK
+from app.domain.cache import transaction_cache
+from app.domain.transactions import TransactionManager
+
+
+def make_manager(account: str, amounts: list, storage_format: str = 'csv') -> TransactionManager:
+    """
+    Manager freshly loaded from a year file holding one transaction per
+    amount, a day apart in March 2024
+    """
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    for day, amount in enumerate(amounts, start=1):
+        manager.add_transaction(f"2024-03-{day:02d}", amount, "Food", f"row {day}")
+    manager.save(2024)
+    return reload(account, storage_format)
+
+
+def reload(account: str, storage_format: str = 'csv') -> TransactionManager:
+    transaction_cache.invalidate()
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    assert manager.load(2024)["success"]
+    return manager
+
+
+def test_delete_refreshes_later_balances(account):
+    manager = make_manager(account, [100.0, 50.0, -40.0, -20.0])
+    
+    first = manager.delete_transaction_by_id(2)
+    assert first["balance"] == 40.0
+    assert manager.get_transaction(4)["Balance"] == 40.0
+    assert manager.get_transaction(2) is None
+    
+    second = manager.delete_transaction_by_id(3)
+    assert second["balance"] == 80.0
+    assert manager.get_transaction(4)["Balance"] == 80.0
+    assert list(manager.transactions_df['Balance']) == [100.0, 80.0]
+
+
+def test_deletes_are_appended_as_tombstones(account):
+    manager = make_manager(account, [100.0, 50.0, -40.0, -20.0])
+    filepath = manager.get_file_path(2024)
+    manager.delete_transaction_by_id(2)
+    manager.delete_transaction_by_id(3)
+    
+    result = manager.flush(2024)
+    assert (result["appended"], result["tombstoned"]) == (0, 2)
+    with open(filepath, encoding='utf-8-sig') as f:
+        assert len(f.read().splitlines()) == 1 + 4 + 2
+    
+    reloaded = reload(account)
+    assert list(reloaded.transactions_df['Transaction ID']) == [1, 4]
+    assert reloaded.current_balance == 80.0
+    # Deleted IDs are never handed out again
+    assert reloaded.add_transaction("2024-03-05", 1.0, "Food")["transaction"]["Transaction ID"] == 5
+
+
+def test_deleting_an_unwritten_row_writes_no_tombstone(account):
+    manager = make_manager(account, [100.0])
+    manager.add_transaction("2024-03-02", 5.0, "Food")
+    manager.delete_transaction_by_id(2)
+    
+    assert manager.flush(2024)["tombstoned"] == 0
+    assert reload(account).current_balance == 100.0
+
+
+def test_compact_removes_tombstones(account):
+    manager = make_manager(account, [100.0, 50.0, -40.0])
+    filepath = manager.get_file_path(2024)
+    manager.delete_transaction_by_id(1)
+    manager.flush(2024)
+    
+    manager.compact(2024)
+    with open(filepath, encoding='utf-8-sig') as f:
+        assert len(f.read().splitlines()) == 1 + 2
+    
+    reloaded = reload(account)
+    assert list(reloaded.transactions_df['Balance']) == [50.0, 10.0]
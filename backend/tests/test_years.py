@@ -0,0 +1,85 @@
+"""
+Year files and carried-forward balances
+"""
+import os
+
+from conftest import PIGGY_BANK
+from app.domain.cache import transaction_cache
+from app.domain.migrations import convert_storage
+from app.domain.transactions import TransactionManager
+
+
+def seed_year(account: str, year: int, amounts: list, storage_format: str = 'csv') -> None:
+    """Write a year file the way a request would: load, add, save"""
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    manager.load(year)
+    for day, amount in enumerate(amounts, start=1):
+        manager.add_transaction(f"{year}-06-{day:02d}", amount, "Food", f"{year} row {day}")
+    manager.save(year)
+
+
+def load(account: str, year: int, storage_format: str = 'csv') -> TransactionManager:
+    manager = TransactionManager(account, PIGGY_BANK, storage_format)
+    assert manager.load(year)["success"]
+    return manager
+
+
+def test_opening_balance_is_carried_forward(account):
+    seed_year(account, 2023, [100.0, -40.0])
+    seed_year(account, 2024, [50.0])
+    
+    manager = load(account, 2024)
+    assert manager.opening_balance == 60.0
+    assert manager.current_balance == 110.0
+    # IDs continue across years
+    assert list(manager.transactions_df['Transaction ID']) == [3]
+
+
+def test_earlier_year_edit_shifts_cached_later_year(account):
+    seed_year(account, 2023, [100.0])
+    seed_year(account, 2024, [50.0])
+    assert load(account, 2024).current_balance == 150.0
+    
+    earlier = load(account, 2023)
+    earlier.add_transaction("2023-07-01", -30.0, "Food")
+    earlier.flush(2023)
+    
+    # Served from the cache, shifted by the new opening balance
+    manager = load(account, 2024)
+    assert manager.opening_balance == 70.0
+    assert manager.current_balance == 120.0
+    assert list(manager.transactions_df['Balance']) == [120.0]
+
+
+def test_missing_snapshots_are_backfilled(account):
+    seed_year(account, 2022, [10.0])
+    seed_year(account, 2023, [100.0])
+    seed_year(account, 2024, [50.0])
+    os.remove(os.path.join(TransactionManager.piggy_bank_path(account, PIGGY_BANK), "meta.json"))
+    transaction_cache.invalidate()
+    
+    manager = load(account, 2024)
+    assert manager.current_balance == 160.0
+    assert sorted(manager.meta.years) == [2022, 2023, 2024]
+    assert manager.add_transaction("2024-07-01", 1.0, "Food")["transaction"]["Transaction ID"] == 4
+
+
+def test_load_range_spans_years(account):
+    seed_year(account, 2023, [100.0, -40.0])
+    seed_year(account, 2024, [50.0, 5.0])
+    
+    df = TransactionManager(account, PIGGY_BANK).load_range("2023-06-02", "2024-06-01")
+    assert list(df['Transaction ID']) == [2, 3]
+    assert list(df['Balance']) == [60.0, 110.0]
+
+
+def test_converted_storage_keeps_balances(account):
+    seed_year(account, 2023, [100.0])
+    seed_year(account, 2024, [50.0, -20.0])
+    
+    assert convert_storage('parquet')["success"]
+    transaction_cache.invalidate()
+    
+    manager = load(account, 2024, 'parquet')
+    assert manager.opening_balance == 100.0
+    assert list(manager.transactions_df['Balance']) == [150.0, 130.0]
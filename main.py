@@ -6,6 +6,7 @@ from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
+from backend.app.domain.balances import running_balance
 
 # Load Config
 # ---------------
@@ -150,14 +151,9 @@ def refresh_balance():
         print("⚠️ 沒有交易紀錄可刷新。")
         return
     transactions_df.sort_values(by=['Date', 'Transaction ID'], inplace=True, ignore_index=True)
-    bal = 0
-    balances = []
-    for amt in transactions_df['Amount']:
-        bal += amt
-        balances.append(bal)
-    transactions_df['Balance'] = balances
+    transactions_df['Balance'] = running_balance(transactions_df['Amount'])
     transaction_counter = transactions_df['Transaction ID'].max() + 1
-    current_balance = balances[-1]
+    current_balance = transactions_df['Balance'].iloc[-1]
     print("🔄 餘額已重新計算完畢。")
 
 # ─── Transaction Recording & Removal ───────────────────
@@ -206,14 +202,8 @@ def remove_transaction_by_date():
     removed = transactions_df.loc[idx]
     transactions_df = transactions_df.drop(idx).reset_index(drop=True)
     transactions_df['Transaction ID'] = range(1, len(transactions_df) + 1)
-    bal = 0
-    balances = []
-    for amt in transactions_df['Amount']:
-        bal += amt
-        balances.append(bal)
-    transactions_df['Balance'] = balances
     transaction_counter = len(transactions_df) + 1
-    current_balance = balances[-1] if balances else 0.0
+    current_balance = 0.0
     refresh_balance()
     print(f"✅ 已刪除: ID {removed['Transaction ID']} 金額:{removed['Amount']} 分類:{removed['Category']}")
 
@@ -280,10 +270,7 @@ def load_from_csv(year=None):
         current_balance = 0.0
         return
     if 'Balance' not in transactions_df:
-        bal=0; balances=[]
-        for amt in transactions_df['Amount']:
-            bal+=amt; balances.append(bal)
-        transactions_df['Balance'] = balances
+        transactions_df['Balance'] = running_balance(transactions_df['Amount'])
     transactions_df.sort_values(by=['Date', 'Transaction ID'], inplace=True, ignore_index=True)
     transaction_counter = transactions_df['Transaction ID'].max()+1 if not transactions_df.empty else 1
     current_balance = transactions_df['Balance'].iloc[-1] if not transactions_df.empty else 0.0
@@ -418,10 +405,7 @@ def menu():
             transactions_df.sort_values(by=['Date', 'Transaction ID'], inplace=True, ignore_index=True)
 
             if 'Balance' not in transactions_df.columns:
-                bal = 0; balances = []
-                for amt in transactions_df['Amount']:
-                    bal += amt; balances.append(bal)
-                transactions_df['Balance'] = balances
+                transactions_df['Balance'] = running_balance(transactions_df['Amount'])
 
             transaction_counter = transactions_df['Transaction ID'].max() + 1
             current_balance = transactions_df['Balance'].iloc[-1] if not transactions_df.empty else 0.0